@@ -1,18 +1,25 @@
-from scipy.fft import fftfreq
+from scipy.fft import fftfreq, rfftfreq
 import numpy as np
 from abc import ABC, abstractmethod
+from PlanCache import plan_cache
+from Precision import Precision
 
 
 class Axis(ABC):
     """
     Abstract base class for representing an axis.
 
+    Frequency axes are generated in the global precision set with Precision.set. Time axes stay in
+    double precision, because the phase 2π·f·t of synthesized sines inherits their rounding error
+    multiplied by f·t.
+
     Attributes:
         samples_number (int): The number of samples.
         sampling_frequency (float): The sampling frequency.
 
     Methods:
         generate(): Abstract method to generate the axis values.
+        get_key(): Return a hashable description of the axis parameters.
     """
     def __init__(self, samples_number, sampling_frequency):
         """
@@ -25,6 +32,18 @@ class Axis(ABC):
         self.samples_number = samples_number
         self.sampling_frequency = sampling_frequency
 
+    def get_key(self):
+        """
+        Return a hashable description of the axis parameters.
+
+        Two axes with equal keys generate identical values. The key includes the precision, so that
+        waves cached for an axis are dropped when the precision changes.
+
+        Returns:
+            tuple: The axis type followed by its parameters.
+        """
+        return type(self).__name__, Precision.real.name, self.samples_number, self.sampling_frequency
+
     @abstractmethod
     def generate(self):
         """
@@ -57,6 +76,15 @@ class TimeAxis(Axis):
         super().__init__(samples_number, sampling_frequency)
         self.time_step = time_step
 
+    def get_key(self):
+        """
+        Return a hashable description of the axis parameters.
+
+        Returns:
+            tuple: The axis type followed by its parameters.
+        """
+        return super().get_key() + (self.time_step,)
+
     def generate(self):
         """
         Generate the time axis values.
@@ -77,6 +105,7 @@ class DiscreteTimeAxis(Axis):
 
     Methods:
         generate(): Generate the discrete time axis values.
+        get_time_step(): Get the spacing between consecutive discrete time values.
     """
     def __init__(self, samples_number, sampling_frequency):
         """
@@ -97,6 +126,19 @@ class DiscreteTimeAxis(Axis):
         """
         return np.linspace(0, self.samples_number / self.sampling_frequency, self.samples_number)
 
+    def get_time_step(self):
+        """
+        Get the spacing between consecutive discrete time values.
+
+        The axis includes both end points, so the spacing is slightly larger than 1 / sampling_frequency.
+
+        Returns:
+            float: The time step, or 0 for axes with fewer than two samples.
+        """
+        if self.samples_number < 2:
+            return 0.0
+        return self.samples_number / self.sampling_frequency / (self.samples_number - 1)
+
 
 class FrequencyAxis(Axis):
     """
@@ -105,26 +147,167 @@ class FrequencyAxis(Axis):
     Attributes:
         samples_number (int): The number of samples.
         sampling_frequency (float): The sampling frequency.
+        one_sided (bool): Whether only the non-negative frequencies of a real-input FFT are generated.
 
     Methods:
         generate(): Generate the frequency axis values.
     """
-    def __init__(self, samples_number, sampling_frequency):
+    def __init__(self, samples_number, sampling_frequency, one_sided=False):
         """
         Initializes a FrequencyAxis instance with specified number of samples and sampling frequency.
 
         Parameters:
             samples_number (int): The number of samples.
             sampling_frequency (float): The sampling frequency.
+            one_sided (bool): Whether to generate only the samples_number // 2 + 1 non-negative
+                frequencies matching FFTAnalyzer with one_sided=True.
         """
         super().__init__(samples_number, sampling_frequency)
+        self.one_sided = one_sided
+
+    def get_key(self):
+        """
+        Return a hashable description of the axis parameters.
+
+        Returns:
+            tuple: The axis type followed by its parameters.
+        """
+        return super().get_key() + (self.one_sided,)
 
     def generate(self):
         """
         Generate the frequency axis values using FFT.
 
+        Axes are cached by their parameters, so repeated updates at the same size reuse them.
+
         Returns:
-            numpy.ndarray: The frequency axis values.
+            numpy.ndarray: The read-only frequency axis values.
         """
-        return fftfreq(self.samples_number, d=1 / self.sampling_frequency)
+        frequencies = rfftfreq if self.one_sided else fftfreq
+        return plan_cache.get(self.get_key(), lambda: frequencies(
+            self.samples_number, d=1 / self.sampling_frequency).astype(Precision.real, copy=False))
+
+
+class LazyTimeAxis:
+    """
+    Represents an evenly spaced time axis without storing its values.
+
+    The axis is described by its start, step and length. Values are computed only for the
+    indices or slices that are actually requested; converting the whole axis with np.asarray
+    materializes it.
+
+    Attributes:
+        start (float): The first time value.
+        time_step (float): The spacing between consecutive time values.
+        samples_number (int): The number of time values.
+
+    Methods:
+        generate(): Materialize all time axis values.
+        index_of(time): Return the index of the sample at or before the given time.
+    """
+    def __init__(self, start, time_step, samples_number):
+        """
+        Initializes a LazyTimeAxis instance.
+
+        Parameters:
+            start (float): The first time value.
+            time_step (float): The spacing between consecutive time values.
+            samples_number (int): The number of time values.
+        """
+        self.start = start
+        self.time_step = time_step
+        self.samples_number = samples_number
+
+    def __len__(self):
+        return self.samples_number
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return self.start + self.time_step * np.arange(*item.indices(self.samples_number))
+        if isinstance(item, (int, np.integer)):
+            if not -self.samples_number <= item < self.samples_number:
+                raise IndexError('time axis index out of range')
+            return self.start + self.time_step * (item % self.samples_number)
+        indices = np.arange(self.samples_number)[item]
+        return self.start + self.time_step * indices
 
+    def __array__(self, dtype=None, copy=None):
+        return self.generate().astype(dtype, copy=False) if dtype is not None else self.generate()
+
+    def generate(self):
+        """
+        Materialize all time axis values.
+
+        Returns:
+            numpy.ndarray: The time axis values.
+        """
+        return self[:]
+
+    def index_of(self, time):
+        """
+        Return the index of the sample at or before the given time, clipped to the axis.
+
+        Parameters:
+            time (float or numpy.ndarray): The time values.
+
+        Returns:
+            int or numpy.ndarray: The sample indices.
+        """
+        if not self.time_step:
+            return np.zeros_like(time, dtype=int) if np.ndim(time) else 0
+        indices = np.floor((np.asarray(time) - self.start) / self.time_step).astype(int)
+        indices = np.clip(indices, 0, self.samples_number - 1)
+        return indices if np.ndim(indices) else int(indices)
+
+
+class BandFrequencyAxis(FrequencyAxis):
+    """
+    Represents a dense frequency axis covering only the band [low, high].
+
+    The axis matches the output of ZoomFFTAnalyzer with the same parameters.
+
+    Attributes:
+        samples_number (int): The number of frequencies in the band.
+        sampling_frequency (float): The sampling frequency.
+        low (float): The first frequency of the band.
+        high (float): The end frequency of the band.
+        endpoint (bool): Whether high itself is the last frequency.
+
+    Methods:
+        generate(): Generate the band frequency values.
+    """
+    def __init__(self, samples_number, sampling_frequency, low, high, endpoint=False):
+        """
+        Initializes a BandFrequencyAxis instance.
+
+        Parameters:
+            samples_number (int): The number of frequencies in the band.
+            sampling_frequency (float): The sampling frequency.
+            low (float): The first frequency of the band.
+            high (float): The end frequency of the band.
+            endpoint (bool): Whether high itself is the last frequency; otherwise the band is split
+                into samples_number equal steps starting at low.
+        """
+        super().__init__(samples_number, sampling_frequency)
+        self.low = low
+        self.high = high
+        self.endpoint = endpoint
+
+    def get_key(self):
+        """
+        Return a hashable description of the axis parameters.
+
+        Returns:
+            tuple: The axis type followed by its parameters.
+        """
+        return super().get_key() + (self.low, self.high, self.endpoint)
+
+    def generate(self):
+        """
+        Generate the band frequency values.
+
+        Returns:
+            numpy.ndarray: The read-only frequency values.
+        """
+        return plan_cache.get(self.get_key(), lambda: np.linspace(
+            self.low, self.high, self.samples_number, endpoint=self.endpoint, dtype=Precision.real))
@@ -0,0 +1,215 @@
+import argparse
+import glob
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from Axis import FrequencyAxis
+from Precision import Precision
+from SignalsHandler import SignalsHandler
+from TransformAnalyzer import FFTAnalyzer, DCTAnalyzer
+
+
+def collect_files(inputs, pattern='*.wav'):
+    """
+    Expand directories and glob patterns into a sorted list of files.
+
+    Parameters:
+        inputs (iterable): Directories, glob patterns or file paths.
+        pattern (str): The pattern matched inside directories.
+
+    Returns:
+        list: The paths of the files, without duplicates.
+    """
+    files = set()
+    for item in inputs:
+        if os.path.isdir(item):
+            files.update(glob.glob(os.path.join(item, pattern)))
+        else:
+            files.update(glob.glob(item))
+    return sorted(path for path in files if os.path.isfile(path))
+
+
+def get_output_name(file):
+    """
+    Return a unique output file name for an input file.
+
+    Parameters:
+        file (str): The path to the input file.
+
+    Returns:
+        str: The name of the compressed result file.
+    """
+    stem = os.path.splitext(os.path.basename(file))[0]
+    digest = hashlib.sha1(os.path.abspath(file).encode()).hexdigest()[:8]
+    return f'{stem}-{digest}.npz'
+
+
+def analyze_file(file, output_directory, parameters, precision='float64'):
+    """
+    Run the FFT and DCT analysis of one file and save the results as a compressed archive.
+
+    The input is real, so the one-sided spectrum and frequency axis are stored.
+
+    Parameters:
+        file (str): The path to the audio file.
+        output_directory (str): The directory for the results.
+        parameters (dict): Format options passed to the FileHandler registry.
+        precision (str): The floating-point precision of the analysis, float32 or float64.
+
+    Returns:
+        dict: The manifest entry of the file.
+    """
+    Precision.set(precision)
+    start = time.perf_counter()
+    entry = {'file': os.path.abspath(file)}
+    try:
+        data, _, sampling_frequency = SignalsHandler.generate_wave_from_file(file, mmap=True, **parameters)
+        samples_number = len(data)
+
+        fft_data = FFTAnalyzer(data, one_sided=True).calculate()
+        dct_data = DCTAnalyzer(data).calculate()
+        frequency_axis = FrequencyAxis(samples_number, sampling_frequency, one_sided=True).generate()
+
+        output = os.path.join(output_directory, get_output_name(file))
+        np.savez_compressed(output, fft=fft_data, dct=dct_data, frequency_axis=frequency_axis,
+                            sampling_frequency=sampling_frequency)
+
+        elapsed = time.perf_counter() - start
+        entry.update(output=output, samples_number=samples_number, channels=1 if data.ndim == 1 else data.shape[1],
+                     sampling_frequency=sampling_frequency, duration=samples_number / sampling_frequency,
+                     seconds=elapsed, samples_per_second=samples_number / elapsed if elapsed else None)
+    except Exception as error:
+        entry.update(error=f'{type(error).__name__}: {error}', seconds=time.perf_counter() - start)
+    return entry
+
+
+def run_files(function, files, output_directory, workers=None, arguments=(), describe=str):
+    """
+    Call a function for every file in parallel processes and print the outcome of each file.
+
+    Parameters:
+        function (callable): Called as function(file, output_directory, *arguments) in a worker
+            process; returns the manifest entry of the file, with an error key on failure.
+        files (list): The paths of the input files.
+        output_directory (str): The directory for the results, created if needed.
+        workers (int, optional): The number of processes. Defaults to the number of cores.
+        arguments (tuple): Further arguments of function.
+        describe (callable): Returns the progress message of a successful entry.
+
+    Returns:
+        tuple: The manifest entries in the order of files and the elapsed time in seconds.
+    """
+    os.makedirs(output_directory, exist_ok=True)
+    start = time.perf_counter()
+
+    entries = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(function, file, output_directory, *arguments) for file in files]
+        for future in futures:
+            entry = future.result()
+            entries.append(entry)
+            print(f"{entry['file']}: {entry['error'] if 'error' in entry else describe(entry)}")
+    return entries, time.perf_counter() - start
+
+
+def write_manifest(output_directory, entries, elapsed, **fields):
+    """
+    Write the summary manifest of a run of run_files to manifest.json.
+
+    Parameters:
+        output_directory (str): The directory of the manifest.
+        entries (list): The manifest entries of the files.
+        elapsed (float): The elapsed time in seconds.
+        **fields: Further summary fields.
+
+    Returns:
+        dict: The manifest.
+    """
+    manifest = {
+        'files': entries,
+        'succeeded': sum('error' not in entry for entry in entries),
+        'failed': sum('error' in entry for entry in entries),
+        **fields,
+        'seconds': elapsed,
+    }
+    with open(os.path.join(output_directory, 'manifest.json'), 'w') as manifest_file:
+        json.dump(manifest, manifest_file, indent=2)
+    return manifest
+
+
+def add_common_arguments(parser):
+    """
+    Add the input, output, process and file format options shared by the batch tools.
+
+    Parameters:
+        parser (argparse.ArgumentParser): The parser.
+    """
+    parser.add_argument('inputs', nargs='+', help='directories, glob patterns or audio files')
+    parser.add_argument('-o', '--output', required=True, help='directory for the results and manifest.json')
+    parser.add_argument('-j', '--workers', type=int, default=None, help='number of processes (default: all cores)')
+    parser.add_argument('--pattern', default='*.wav', help='file pattern used inside directories')
+    parser.add_argument('--sampling-rate', type=float, default=None, help='sampling rate of raw PCM and NPY files')
+    parser.add_argument('--dtype', default='<i2', help='sample dtype of raw PCM files')
+    parser.add_argument('--channels', type=int, default=1, help='number of channels of raw PCM files')
+    parser.add_argument('--precision', choices=('float32', 'float64'), default='float64',
+                        help='floating-point precision of the transforms')
+
+
+def get_parameters(args):
+    """
+    Return the FileHandler format options given on the command line.
+
+    Parameters:
+        args (argparse.Namespace): Arguments parsed with the options of add_common_arguments.
+
+    Returns:
+        dict: The format options.
+    """
+    return {'sampling_rate': args.sampling_rate, 'dtype': args.dtype, 'channels': args.channels}
+
+
+def run_batch(files, output_directory, workers=None, parameters=None, precision='float64'):
+    """
+    Analyze files in parallel processes and write a summary manifest.
+
+    Parameters:
+        files (list): The paths of the audio files.
+        output_directory (str): The directory for the results and the manifest.
+        workers (int, optional): The number of processes. Defaults to the number of cores.
+        parameters (dict, optional): Format options passed to the FileHandler registry.
+        precision (str): The floating-point precision of the analysis, float32 or float64.
+
+    Returns:
+        dict: The manifest.
+    """
+    entries, elapsed = run_files(
+        analyze_file, files, output_directory, workers, (parameters or {}, precision),
+        lambda entry: (f"{entry['samples_number']} samples in {entry['seconds']:.3f} s "
+                       f"({entry['samples_per_second'] / 1e6:.1f} Msamples/s)"))
+    samples_number = sum(entry.get('samples_number', 0) for entry in entries)
+    return write_manifest(output_directory, entries, elapsed, samples_number=samples_number, precision=precision,
+                          samples_per_second=samples_number / elapsed if elapsed else None)
+
+
+def main(argv=None):
+    """
+    Command-line entry point of the headless batch analysis.
+
+    Parameters:
+        argv (list, optional): The command-line arguments. Defaults to sys.argv.
+    """
+    parser = argparse.ArgumentParser(description='Run FFT and DCT analysis over many audio files.')
+    add_common_arguments(parser)
+    args = parser.parse_args(argv)
+
+    files = collect_files(args.inputs, args.pattern)
+    manifest = run_batch(files, args.output, args.workers, get_parameters(args), args.precision)
+    print(f"{manifest['succeeded']} files analyzed, {manifest['failed']} failed, "
+          f"{manifest['samples_number']} samples in {manifest['seconds']:.2f} s")
+
+
+if __name__ == '__main__':
+    main()
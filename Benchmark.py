@@ -0,0 +1,281 @@
+import os
+import time
+import numpy as np
+from scipy.fft import rfft
+from Oscillator import SineOscillator, PhasorOscillator
+from Precision import Precision
+from TransformAnalyzer import FFTAnalyzer, DCTAnalyzer, STFTAnalyzer, ZoomFFTAnalyzer, SparseDFTAnalyzer
+from Axis import DiscreteTimeAxis
+
+
+def measure(function, repeats=3):
+    """
+    Measure the best wall-clock time of several calls.
+
+    Parameters:
+        function (callable): The function to call without arguments.
+        repeats (int): The number of calls.
+
+    Returns:
+        tuple: The best time in seconds and the result of the last call.
+    """
+    best = float('inf')
+    result = None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = function()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def benchmark_oscillators(samples_numbers=(10 ** 5, 10 ** 6, 10 ** 7), components_numbers=(1, 16)):
+    """
+    Compare the accuracy and throughput of PhasorOscillator against the np.sin based SineOscillator.
+
+    Parameters:
+        samples_numbers (iterable): Lengths of the time axes.
+        components_numbers (iterable): Numbers of sine components.
+    """
+    print('Oscillators: samples, components, sine [Msamples/s], phasor [Msamples/s], max abs error')
+    rng = np.random.default_rng(0)
+    for samples_number in samples_numbers:
+        time_axis = np.linspace(0, samples_number / 44100, samples_number)
+        for components_number in components_numbers:
+            amplitudes = rng.uniform(0.1, 10, components_number)
+            frequencies = rng.uniform(1, 20000, components_number)
+            phases = rng.uniform(0, 360, components_number)
+
+            sine_time, reference = measure(
+                lambda: SineOscillator().generate(time_axis, amplitudes, frequencies, phases))
+            phasor_time, wave = measure(
+                lambda: PhasorOscillator().generate(time_axis, amplitudes, frequencies, phases))
+
+            print(f'{samples_number:>10} {components_number:>4} '
+                  f'{samples_number / sine_time / 1e6:>10.1f} {samples_number / phasor_time / 1e6:>10.1f} '
+                  f'{np.max(np.abs(wave - reference)):>10.2e}')
+
+
+def benchmark_workers(samples_number=2 ** 20, channels=16):
+    """
+    Measure how batched FFT and DCT throughput scales with the number of worker threads.
+
+    Parameters:
+        samples_number (int): The number of samples per channel.
+        channels (int): The number of channels transformed as one batch.
+    """
+    print(f'Workers: {samples_number} samples x {channels} channels, FFT and DCT [Msamples/s], speedup')
+    data = np.random.default_rng(0).standard_normal((samples_number, channels))
+    workers_numbers = sorted({1, 2, 4, 8, 16, 32, os.cpu_count()} & set(range(1, os.cpu_count() + 1)))
+    baseline = None
+    for workers in workers_numbers:
+        fft_time, _ = measure(lambda: FFTAnalyzer(data).calculate(workers=workers))
+        dct_time, _ = measure(lambda: DCTAnalyzer(data).calculate(workers=workers))
+        baseline = baseline or fft_time + dct_time
+        print(f'{workers:>4} {data.size / fft_time / 1e6:>10.1f} {data.size / dct_time / 1e6:>10.1f} '
+              f'{baseline / (fft_time + dct_time):>6.2f}x')
+
+
+def benchmark_stft(samples_numbers=(10 ** 5, 10 ** 6, 10 ** 7), window_length=1024, hop=256):
+    """
+    Compare the batched STFTAnalyzer against a naive loop transforming one frame at a time.
+
+    Parameters:
+        samples_numbers (iterable): Lengths of the input signals.
+        window_length (int): The number of samples per frame.
+        hop (int): The number of samples between frames.
+    """
+    print(f'STFT: samples, frames, naive loop [s], STFTAnalyzer [s], speedup (window {window_length}, hop {hop})')
+    rng = np.random.default_rng(0)
+    for samples_number in samples_numbers:
+        data = rng.standard_normal(samples_number)
+        window = STFTAnalyzer.get_window('hann', window_length)
+
+        def naive():
+            return np.array([np.fft.rfft(data[start:start + window_length] * window)
+                             for start in range(0, samples_number - window_length + 1, hop)])
+
+        naive_time, expected = measure(naive)
+        stft_time, result = measure(
+            lambda: STFTAnalyzer(data, window_length=window_length, hop=hop).calculate())
+        assert np.allclose(result, expected)
+        print(f'{samples_number:>10} {len(result):>8} {naive_time:>10.3f} {stft_time:>10.3f} '
+              f'{naive_time / stft_time:>6.1f}x')
+
+
+def benchmark_precision(samples_numbers=(10 ** 5, 10 ** 6, 10 ** 7), components_number=16, tolerance=1e-5):
+    """
+    Compare synthesis and FFT in single precision against double precision.
+
+    The errors are relative to the largest magnitude of the double precision result and are checked
+    against tolerance.
+
+    Parameters:
+        samples_numbers (iterable): Lengths of the discrete time axes.
+        components_number (int): The number of sine components.
+        tolerance (float): The largest accepted relative error.
+    """
+    print('Precision: samples, float64 [s], float32 [s], speedup, wave error, FFT error (relative)')
+    rng = np.random.default_rng(0)
+    amplitudes = rng.uniform(0.1, 10, components_number)
+    frequencies = rng.uniform(1, 2000, components_number)
+    phases = rng.uniform(0, 360, components_number)
+
+    def run():
+        time_axis = DiscreteTimeAxis(samples_number, 44100).generate()
+        wave = PhasorOscillator().generate(time_axis, amplitudes, frequencies, phases)
+        return wave, FFTAnalyzer(wave, one_sided=True).calculate()
+
+    try:
+        for samples_number in samples_numbers:
+            Precision.set('float64')
+            double_time, (double_wave, double_spectrum) = measure(run)
+            Precision.set('float32')
+            single_time, (single_wave, single_spectrum) = measure(run)
+            assert single_wave.dtype == np.float32 and single_spectrum.dtype == np.complex64
+
+            wave_error = np.max(np.abs(single_wave - double_wave)) / np.max(np.abs(double_wave))
+            spectrum_error = np.max(np.abs(single_spectrum - double_spectrum)) / np.max(np.abs(double_spectrum))
+            assert wave_error < tolerance and spectrum_error < tolerance
+            print(f'{samples_number:>10} {double_time:>10.3f} {single_time:>10.3f} {double_time / single_time:>6.2f}x '
+                  f'{wave_error:>10.2e} {spectrum_error:>10.2e}')
+    finally:
+        Precision.set('float64')
+
+
+def benchmark_zoom_fft(samples_number=2 ** 16, sampling_frequency=44100, band=(1000, 1100), points_number=4096):
+    """
+    Compare ZoomFFTAnalyzer against a zero-padded FFT reaching the same frequency resolution.
+
+    Parameters:
+        samples_number (int): The length of the input signal.
+        sampling_frequency (float): The sampling frequency of the input.
+        band (tuple): The inspected frequency band.
+        points_number (int): The number of points in the band.
+    """
+    low, high = band
+    resolution = (high - low) / points_number
+    padded_length = int(np.ceil(sampling_frequency / resolution))
+    print(f'Zoom FFT: {samples_number} samples, {resolution:.4f} Hz resolution, '
+          f'padded FFT of {padded_length} points [s], zoom FFT [s], speedup')
+
+    data = np.random.default_rng(0).standard_normal(samples_number)
+    padded_time, spectrum = measure(lambda: rfft(data, n=padded_length))
+    analyzer = ZoomFFTAnalyzer(data, sampling_frequency, low, high, points_number)
+    zoom_time, result = measure(analyzer.calculate)
+
+    frequencies = analyzer.get_frequency_axis()
+    bins = np.rint(frequencies * padded_length / sampling_frequency).astype(int)
+    exact = np.isclose(bins * sampling_frequency / padded_length, frequencies)
+    assert np.allclose(result[exact], spectrum[bins[exact]])
+    print(f'{padded_time:>10.3f} {zoom_time:>10.3f} {padded_time / zoom_time:>6.1f}x')
+
+
+def benchmark_sparse_dft(samples_numbers=(10 ** 6, 10 ** 7), channels=2, frequencies=(50, 440, 1000, 4410.5)):
+    """
+    Compare SparseDFTAnalyzer at a few frequencies against a full real-input FFT.
+
+    Parameters:
+        samples_numbers (iterable): Lengths of the input signals.
+        channels (int): The number of channels.
+        frequencies (iterable): The target frequencies.
+    """
+    print(f'Sparse DFT: samples, full FFT [s], {len(frequencies)} frequencies [s], speedup')
+    rng = np.random.default_rng(0)
+    for samples_number in samples_numbers:
+        data = rng.standard_normal((samples_number, channels))
+        fft_time, _ = measure(lambda: FFTAnalyzer(data, one_sided=True).calculate())
+        sparse_time, result = measure(lambda: SparseDFTAnalyzer(data, 44100, frequencies).calculate())
+
+        bins = np.arange(10)
+        exact = SparseDFTAnalyzer(data, 44100, bins * 44100 / samples_number).calculate()
+        assert np.allclose(exact, rfft(data, axis=0)[bins])
+        print(f'{samples_number:>10} {fft_time:>10.3f} {sparse_time:>10.3f} {fft_time / sparse_time:>6.1f}x')
+
+
+def benchmark_stem_plot(bins_numbers=(10 ** 4, 10 ** 5, 10 ** 6)):
+    """
+    Measure the time of drawing StemPlot on an off-screen Agg figure.
+
+    Parameters:
+        bins_numbers (iterable): Numbers of stems, e.g. FFT bins.
+    """
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+    from Graph import StemPlot
+
+    print('Stem plot: bins, render [s]')
+    rng = np.random.default_rng(0)
+    for bins_number in bins_numbers:
+        x = np.arange(bins_number) * 44100 / (2 * bins_number)
+        y = np.abs(rng.standard_normal(bins_number))
+
+        def render():
+            figure = Figure(figsize=(8, 6))
+            FigureCanvasAgg(figure)
+            StemPlot(x, y, 'Częstotliwość', 'Amplituda', 'abs(FFT)').create(figure)
+
+        render_time, _ = measure(render)
+        print(f'{bins_number:>10} {render_time:>10.3f}')
+
+
+def benchmark_graph_update(samples_number=10 ** 5, stems_number=200, repeats=20):
+    """
+    Compare redrawing a signal by clearing the axes and creating new graphs with updating
+    persistent, blitted graphs in place, on an off-screen Agg figure.
+
+    Parameters:
+        samples_number (int): The number of points of the line plot.
+        stems_number (int): The number of stems of the sampled signal.
+        repeats (int): The number of redraws measured.
+    """
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+    from Graph import Graph, Plot, StemPlot
+
+    time_axis = np.linspace(0, 1, samples_number)
+    discrete_time_axis = np.linspace(0, 1, stems_number)
+    phases = np.linspace(0, 1, repeats)
+    waves = [(np.sin(2 * np.pi * 5 * time_axis + phase), np.sin(2 * np.pi * 5 * discrete_time_axis + phase))
+             for phase in phases]
+
+    def create_axes():
+        figure = Figure(figsize=(8, 6))
+        FigureCanvasAgg(figure)
+        return figure.add_subplot()
+
+    def recreate():
+        ax = create_axes()
+        for wave, sampled_wave in waves:
+            ax.clear()
+            Plot(time_axis, wave, 'Czas', 'Amplituda', 'Sygnał oryginalny').plot(ax)
+            StemPlot(discrete_time_axis, sampled_wave, 'Czas', 'Amplituda', 'Sygnał oryginalny').stem(ax)
+            ax.figure.canvas.draw()
+
+    ax = create_axes()
+    graphs = [Plot(time_axis, waves[0][0], 'Czas', 'Amplituda', 'Sygnał oryginalny', blit=True),
+              StemPlot(discrete_time_axis, waves[0][1], 'Czas', 'Amplituda', 'Sygnał oryginalny', blit=True)]
+    graphs[0].plot(ax)
+    graphs[1].stem(ax)
+    ax.figure.canvas.draw()
+
+    def update():
+        for wave, sampled_wave in waves:
+            rescale = graphs[0].update(time_axis, wave)
+            rescale = graphs[1].update(discrete_time_axis, sampled_wave) or rescale
+            Graph.redraw(ax, graphs, rescale)
+
+    recreate_time, _ = measure(recreate)
+    update_time, _ = measure(update)
+    print('Graph redraw: clear and create [ms], update and blit [ms]')
+    print(f'{recreate_time / repeats * 1e3:>10.2f} {update_time / repeats * 1e3:>10.2f}')
+
+
+if __name__ == '__main__':
+    benchmark_oscillators()
+    benchmark_workers()
+    benchmark_stft()
+    benchmark_precision()
+    benchmark_zoom_fft()
+    benchmark_sparse_dft()
+    benchmark_stem_plot()
+    benchmark_graph_update()
@@ -0,0 +1,120 @@
+import argparse
+import os
+import time
+from BatchAnalysis import (collect_files, get_output_name, run_files, write_manifest, add_common_arguments,
+                           get_parameters)
+from Graph import Plot, StemPlot
+from Pipeline import TransformPipeline
+from Precision import Precision
+from SignalsHandler import SignalsHandler
+
+FIGURES = ('signal', 'DFT', 'DCT', 'IDFT', 'IDCT')
+
+
+def export_file(file, output_directory, parameters, figures=('signal', 'DFT'), formats=('png',),
+                precision='float64', size=(8, 6), dpi=100):
+    """
+    Render the figures of one file to image files with the Agg backend.
+
+    The figures are the ones of the GUI: the signal and the transform figures of TransformPipeline,
+    of which only the transforms needed by the requested figures are computed.
+
+    Parameters:
+        file (str): The path to the audio file.
+        output_directory (str): The directory for the images.
+        parameters (dict): Format options passed to the FileHandler registry.
+        figures (iterable): The names of the figures, out of FIGURES.
+        formats (iterable): The image formats, e.g. png and svg.
+        precision (str): The floating-point precision of the transforms, float32 or float64.
+        size (tuple): The width and height of the figures in inches.
+        dpi (float): The resolution of the figures in dots per inch.
+
+    Returns:
+        dict: The manifest entry of the file.
+    """
+    Precision.set(precision)
+    start = time.perf_counter()
+    entry = {'file': os.path.abspath(file)}
+    try:
+        wave, time_axis, sampling_frequency = SignalsHandler.generate_wave_from_file(file, mmap=True, **parameters)
+        pipeline = TransformPipeline(wave, sampling_frequency)
+        transform_figures = pipeline.get_figures(time_axis)
+        name = os.path.splitext(get_output_name(file))[0]
+
+        outputs = []
+        for figure in figures:
+            if figure == 'signal':
+                graph = Plot(time_axis, wave, 'Czas', 'Amplituda', 'Sygnał oryginalny')
+            else:
+                get_data, xlabel, title = transform_figures[figure]
+                graph = StemPlot(*get_data(), xlabel, 'Amplituda', title)
+            for image_format in formats:
+                output = os.path.join(output_directory, f'{name}-{figure}.{image_format}')
+                graph.export(output, size, dpi)
+                outputs.append(output)
+
+        entry.update(outputs=outputs, samples_number=len(wave), sampling_frequency=sampling_frequency,
+                     seconds=time.perf_counter() - start)
+    except Exception as error:
+        entry.update(error=f'{type(error).__name__}: {error}', seconds=time.perf_counter() - start)
+    return entry
+
+
+def run_export(files, output_directory, workers=None, parameters=None, figures=('signal', 'DFT'),
+               formats=('png',), precision='float64', size=(8, 6), dpi=100):
+    """
+    Render the figures of files in parallel processes and write a summary manifest.
+
+    Parameters:
+        files (list): The paths of the audio files.
+        output_directory (str): The directory for the images and the manifest.
+        workers (int, optional): The number of processes. Defaults to the number of cores.
+        parameters (dict, optional): Format options passed to the FileHandler registry.
+        figures (iterable): The names of the figures, out of FIGURES.
+        formats (iterable): The image formats, e.g. png and svg.
+        precision (str): The floating-point precision of the transforms, float32 or float64.
+        size (tuple): The width and height of the figures in inches.
+        dpi (float): The resolution of the figures in dots per inch.
+
+    Returns:
+        dict: The manifest.
+    """
+    unknown = set(figures) - set(FIGURES)
+    if unknown:
+        raise ValueError(f"Unknown figures {', '.join(sorted(unknown))}; use {', '.join(FIGURES)}")
+
+    entries, elapsed = run_files(
+        export_file, files, output_directory, workers,
+        (parameters or {}, tuple(figures), tuple(formats), precision, size, dpi),
+        lambda entry: f"{len(entry['outputs'])} images in {entry['seconds']:.3f} s")
+    return write_manifest(output_directory, entries, elapsed,
+                          images=sum(len(entry.get('outputs', [])) for entry in entries),
+                          figures=list(figures), formats=list(formats), precision=precision)
+
+
+def main(argv=None):
+    """
+    Command-line entry point of the headless figure export.
+
+    Parameters:
+        argv (list, optional): The command-line arguments. Defaults to sys.argv.
+    """
+    parser = argparse.ArgumentParser(description='Render signal and transform figures of many audio files.')
+    add_common_arguments(parser)
+    parser.add_argument('--figures', nargs='+', choices=FIGURES, default=['signal', 'DFT'],
+                        help='figures to render')
+    parser.add_argument('--formats', nargs='+', default=['png'], help='image formats, e.g. png svg')
+    parser.add_argument('--size', type=float, nargs=2, default=(8, 6), metavar=('WIDTH', 'HEIGHT'),
+                        help='figure size in inches')
+    parser.add_argument('--dpi', type=float, default=100, help='figure resolution in dots per inch')
+    args = parser.parse_args(argv)
+
+    files = collect_files(args.inputs, args.pattern)
+    manifest = run_export(files, args.output, args.workers, get_parameters(args), args.figures, args.formats,
+                          args.precision, tuple(args.size), args.dpi)
+    print(f"{manifest['images']} images of {manifest['succeeded']} files rendered, {manifest['failed']} failed "
+          f"in {manifest['seconds']:.2f} s")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,19 +1,46 @@
+import hashlib
+import inspect
+import json
+import os
+import struct
+import tempfile
 from scipy.io import wavfile
 import numpy as np
 from abc import ABC, abstractmethod
+from Axis import LazyTimeAxis
+from Precision import Precision
 
 
 class FileHandler(ABC):
     """
     Abstract base class for handling files.
 
+    Concrete handlers register themselves with FileHandler.register. FileHandler.for_file then picks
+    the handler of a file by its extension, or by its leading magic bytes if the extension is unknown.
+
     Attributes:
         file (str): The path to the file.
+        handlers (list): Registered handler classes.
+        extensions (tuple): Lower-case file extensions handled by the class.
+        magic (bytes or None): Leading bytes identifying files handled by the class.
 
     Methods:
+        register(handler_class): Class decorator adding a handler to the registry.
+        for_file(file, **parameters): Create the registered handler suited to a file.
+        get_format(): Return the options that determine how the file is decoded.
+        matches_magic(header): Check whether the leading bytes of a file identify this format.
         generate_data(): Abstract method to generate data from the file.
+        generate_samples(): Return the data of the file converted to the global precision.
+        iter_chunks(frame_size, overlap): Return a reader yielding the data in fixed-size frames.
+        get_channels_number(data): Return the number of channels of audio data.
+        select_channels(data, channels): Return a view of the selected channels of audio data.
+        get_time_axis(samples_number, sampling_rate): Return the lazy time axis of audio data.
     """
 
+    handlers = []
+    extensions = ()
+    magic = None
+
     def __init__(self, file):
         """
         Initializes a FileHandler instance with the specified file path.
@@ -23,6 +50,63 @@ class FileHandler(ABC):
         """
         self.file = file
 
+    @staticmethod
+    def register(handler_class):
+        """
+        Class decorator adding a handler to the registry.
+
+        Parameters:
+            handler_class (type): The FileHandler subclass to register.
+
+        Returns:
+            type: The registered class.
+        """
+        FileHandler.handlers.append(handler_class)
+        return handler_class
+
+    @staticmethod
+    def for_file(file, **parameters):
+        """
+        Create the registered handler suited to a file.
+
+        Parameters not accepted by the constructor of the chosen handler are ignored, so that a
+        single call can carry options for several formats.
+
+        Parameters:
+            file (str): The path to the file.
+            **parameters: Options passed to the handler constructor, e.g. mmap or sampling_rate.
+
+        Returns:
+            FileHandler: The handler instance.
+
+        Raises:
+            ValueError: If no registered handler recognizes the file.
+        """
+        extension = os.path.splitext(file)[1].lower()
+        handler_class = next((handler for handler in FileHandler.handlers if extension in handler.extensions), None)
+        if handler_class is None:
+            with open(file, 'rb') as stream:
+                header = stream.read(16)
+            handler_class = next((handler for handler in FileHandler.handlers if handler.matches_magic(header)), None)
+        if handler_class is None:
+            raise ValueError(f'Unsupported file format: {file}')
+
+        accepted = inspect.signature(handler_class).parameters
+        return handler_class(file, **{name: value for name, value in parameters.items() if name in accepted})
+
+    @classmethod
+    def matches_magic(cls, header):
+        """
+        Check whether the leading bytes of a file identify this format.
+
+        Parameters:
+            header (bytes): The first bytes of the file.
+
+        Returns:
+            bool: True if the file is handled by this class.
+        """
+        return cls.magic is not None and header.startswith(cls.magic)
+
     @abstractmethod
     def generate_data(self):
         """
@@ -30,35 +114,732 @@ class FileHandler(ABC):
         """
         pass
 
+    def get_format(self):
+        """
+        Return the options that determine how the file is decoded, e.g. for cache keys.
+
+        Returns:
+            dict: The options, empty for self-describing formats such as WAV.
+        """
+        return {}
+
+    def generate_samples(self):
+        """
+        Return the data of the file converted to the global precision.
+
+        generate_data returns the samples as stored, e.g. memory-mapped int16. In single precision
+        they are converted to float32 chunk by chunk; in double precision they are left unchanged.
+
+        Returns:
+            tuple: A tuple containing audio data, time axis, and sampling rate.
+        """
+        data, time_axis, sampling_rate = self.generate_data()
+        return Precision.convert_samples(data), time_axis, sampling_rate
 
+    def iter_chunks(self, frame_size, overlap=0):
+        """
+        Return a reader yielding the data in fixed-size frames.
+
+        The default implementation slices the array returned by generate_data.
+
+        Parameters:
+            frame_size (int): The number of samples per frame.
+            overlap (int): The number of samples shared by consecutive frames.
+
+        Returns:
+            ChunkReader: An iterable over the frames.
+        """
+        data, _, sampling_rate = self.generate_data()
+        return ArrayChunkReader(data, sampling_rate, frame_size, overlap)
+
+    @staticmethod
+    def get_time_axis(samples_number, sampling_rate):
+        """
+        Return the lazy time axis of audio data, running from 0 to the duration of the recording.
+
+        Parameters:
+            samples_number (int): The number of samples per channel.
+            sampling_rate (float): The sampling rate.
+
+        Returns:
+            LazyTimeAxis: The time axis.
+        """
+        duration = samples_number / sampling_rate
+        time_step = duration / (samples_number - 1) if samples_number > 1 else 0.0
+        return LazyTimeAxis(0.0, time_step, samples_number)
+
+    @staticmethod
+    def get_channels_number(data):
+        """
+        Return the number of channels of audio data.
+
+        Parameters:
+            data (numpy.ndarray): Audio data shaped (samples,) or (samples, channels).
+
+        Returns:
+            int: The number of channels.
+        """
+        return 1 if data.ndim == 1 else data.shape[1]
+
+    @staticmethod
+    def select_channels(data, channels):
+        """
+        Return a view of the selected channels of audio data.
+
+        A single channel index gives a 1-D view. A slice, or a sequence of evenly spaced indices,
+        gives a 2-D view. Neither copies the data. Any other sequence of indices needs a copy.
+
+        Parameters:
+            data (numpy.ndarray): Audio data shaped (samples,) or (samples, channels).
+            channels (int, slice or sequence of int): The channels to select.
+
+        Returns:
+            numpy.ndarray: The selected channels.
+        """
+        if data.ndim == 1:
+            data = data[:, np.newaxis]
+        if isinstance(channels, (int, np.integer, slice)):
+            return data[:, channels]
+
+        channels = np.arange(data.shape[1])[list(channels)]
+        if len(channels) == 1:
+            return data[:, channels[0]:channels[0] + 1]
+        steps = np.diff(channels)
+        if len(channels) and np.all(steps == steps[0]) and steps[0] > 0:
+            return data[:, channels[0]:channels[-1] + 1:steps[0]]
+        return data[:, channels]
+
+
+@FileHandler.register
 class WavFileHandler(FileHandler):
     """
     Handles WAV files and generates time axis and audio data.
 
     Attributes:
         file (str): The path to the WAV file.
+        mmap (bool): Whether the audio data is memory-mapped instead of read into memory.
 
     Methods:
         generate_data(): Read the WAV file and return time axis, audio data, and sampling rate.
+        iter_chunks(frame_size, overlap): Return a reader streaming the WAV data chunk in fixed-size frames.
     """
 
-    def __init__(self, file):
+    extensions = ('.wav', '.wave')
+
+    @classmethod
+    def matches_magic(cls, header):
+        return header[:4] in (b'RIFF', b'RIFX') and header[8:12] == b'WAVE'
+
+    def __init__(self, file, mmap=False):
         """
         Initializes a WavFileHandler instance with the specified WAV file path.
 
         Parameters:
             file (str): The path to the WAV file.
+            mmap (bool): Whether to memory-map the audio data. The data is then read-only and
+                only paged in when accessed.
         """
         super().__init__(file)
+        self.mmap = mmap
 
     def generate_data(self):
         """
         Read the WAV file and return time axis, audio data, and sampling rate.
 
+        The time axis runs from 0 to the duration of the recording and is returned as a
+        LazyTimeAxis, so its values are only computed for the parts that are used.
+
         Returns:
             tuple: A tuple containing audio data, time axis, and sampling rate.
         """
-        sampling_rate, data = wavfile.read(self.file)
-        duration = len(data) / sampling_rate
-        time_axis = np.linspace(0, duration, len(data))
-        return data, time_axis, sampling_rate
+        try:
+            sampling_rate, data = wavfile.read(self.file, mmap=self.mmap)
+        except ValueError:
+            if not self.mmap:
+                raise
+            # Formats such as 24-bit PCM cannot be memory-mapped by scipy.
+            sampling_rate, data = wavfile.read(self.file)
+
+        return data, self.get_time_axis(len(data), sampling_rate), sampling_rate
+
+    def iter_chunks(self, frame_size, overlap=0):
+        """
+        Return a reader streaming the WAV data chunk in fixed-size frames.
+
+        Parameters:
+            frame_size (int): The number of samples per frame.
+            overlap (int): The number of samples shared by consecutive frames.
+
+        Returns:
+            WavChunkReader: An iterable over the frames.
+        """
+        return WavChunkReader(self.file, frame_size, overlap)
+
+
+@FileHandler.register
+class RawPcmFileHandler(FileHandler):
+    """
+    Handles headerless files of interleaved PCM samples.
+
+    The samples are memory-mapped, so loading copies nothing and data is paged in on access.
+
+    Attributes:
+        file (str): The path to the file.
+        sampling_rate (float): The sampling rate of the samples.
+        dtype (numpy.dtype): The dtype of a single sample, including byte order.
+        channels (int): The number of interleaved channels.
+        offset (int): The number of bytes to skip at the start of the file.
+
+    Methods:
+        generate_data(): Map the file and return audio data, time axis, and sampling rate.
+    """
+
+    extensions = ('.pcm', '.raw')
+
+    def __init__(self, file, sampling_rate=None, dtype='<i2', channels=1, offset=0):
+        """
+        Initializes a RawPcmFileHandler instance.
+
+        Parameters:
+            file (str): The path to the file.
+            sampling_rate (float): The sampling rate of the samples.
+            dtype (str or numpy.dtype): The dtype of a single sample, including byte order.
+            channels (int): The number of interleaved channels.
+            offset (int): The number of bytes to skip at the start of the file.
+
+        Raises:
+            ValueError: If the sampling rate is not given.
+        """
+        super().__init__(file)
+        if sampling_rate is None:
+            raise ValueError('Raw PCM files need an explicit sampling_rate')
+        self.sampling_rate = sampling_rate
+        self.dtype = np.dtype(dtype)
+        self.channels = channels
+        self.offset = offset
+
+    def get_format(self):
+        """
+        Return the options that determine how the file is decoded.
+
+        Returns:
+            dict: The sampling rate, the dtype including byte order, the channels and the offset.
+        """
+        return {'sampling_rate': float(self.sampling_rate), 'dtype': self.dtype.str, 'channels': self.channels,
+                'offset': self.offset}
+
+    def generate_data(self):
+        """
+        Map the file and return audio data, time axis, and sampling rate.
+
+        Returns:
+            tuple: A tuple containing memory-mapped audio data, time axis, and sampling rate.
+        """
+        frame_bytes = self.dtype.itemsize * self.channels
+        samples_number = (os.path.getsize(self.file) - self.offset) // frame_bytes
+        shape = (samples_number,) if self.channels == 1 else (samples_number, self.channels)
+        data = np.memmap(self.file, dtype=self.dtype, mode='r', offset=self.offset, shape=shape)
+        return data, self.get_time_axis(samples_number, self.sampling_rate), self.sampling_rate
+
+
+@FileHandler.register
+class NpyFileHandler(FileHandler):
+    """
+    Handles NumPy .npy dumps shaped (samples,) or (samples, channels).
+
+    The array is memory-mapped, so loading copies nothing and data is paged in on access.
+
+    Attributes:
+        file (str): The path to the file.
+        sampling_rate (float): The sampling rate of the samples.
+
+    Methods:
+        generate_data(): Map the file and return audio data, time axis, and sampling rate.
+    """
+
+    extensions = ('.npy',)
+    magic = b'\x93NUMPY'
+
+    def __init__(self, file, sampling_rate=None):
+        """
+        Initializes an NpyFileHandler instance.
+
+        Parameters:
+            file (str): The path to the file.
+            sampling_rate (float): The sampling rate of the samples.
+
+        Raises:
+            ValueError: If the sampling rate is not given.
+        """
+        super().__init__(file)
+        if sampling_rate is None:
+            raise ValueError('NPY files need an explicit sampling_rate')
+        self.sampling_rate = sampling_rate
+
+    def get_format(self):
+        """
+        Return the options that determine how the file is decoded.
+
+        Returns:
+            dict: The sampling rate.
+        """
+        return {'sampling_rate': float(self.sampling_rate)}
+
+    def generate_data(self):
+        """
+        Map the file and return audio data, time axis, and sampling rate.
+
+        Returns:
+            tuple: A tuple containing memory-mapped audio data, time axis, and sampling rate.
+        """
+        data = np.load(self.file, mmap_mode='r')
+        return data, self.get_time_axis(len(data), self.sampling_rate), self.sampling_rate
+
+
+class CachedFileHandler(FileHandler):
+    """
+    Serves the decoded data of another handler from a DecodedAudioCache.
+
+    Attributes:
+        file (str): The path to the file.
+        handler (FileHandler): The handler decoding the file on a cache miss.
+        cache (DecodedAudioCache): The cache storing decoded data.
+
+    Methods:
+        generate_data(): Return the cached data of the file, decoding and storing it on a miss.
+    """
+
+    def __init__(self, handler, cache):
+        """
+        Initializes a CachedFileHandler instance.
+
+        Parameters:
+            handler (FileHandler): The handler decoding the file on a cache miss.
+            cache (DecodedAudioCache): The cache storing decoded data.
+        """
+        super().__init__(handler.file)
+        self.handler = handler
+        self.cache = cache
+
+    def get_format(self):
+        """
+        Return the options that determine how the file is decoded by the wrapped handler.
+
+        Returns:
+            dict: The options.
+        """
+        return self.handler.get_format()
+
+    def generate_data(self):
+        """
+        Return the cached data of the file, decoding and storing it on a miss.
+
+        Returns:
+            tuple: A tuple containing memory-mapped audio data, time axis, and sampling rate.
+        """
+        key = self.cache.get_key(self.handler)
+        entry = self.cache.load(key)
+        if entry is None:
+            data, _, sampling_rate = self.handler.generate_data()
+            self.cache.store(key, data, sampling_rate)
+            entry = self.cache.load(key, count=False)
+        data, sampling_rate = entry
+        return data, self.get_time_axis(len(data), sampling_rate), sampling_rate
+
+
+class DecodedAudioCache:
+    """
+    On-disk cache of decoded audio stored as .npy files and memory-mapped on load.
+
+    Entries are keyed by the absolute path, size and modification time of the source file, so an
+    edited file is decoded again, and by the handler and its format options, so a raw file decoded
+    with other options gets its own entry. Data is stored C-contiguous in native byte order. The total size
+    of the entries is bounded; the least recently used entries are evicted first.
+
+    Attributes:
+        directory (str): The directory holding the cache entries.
+        max_bytes (int): The maximum total size of the cached data.
+        hits (int): The number of loads served from the cache.
+        misses (int): The number of loads that required decoding.
+    """
+
+    def __init__(self, directory, max_bytes=2 ** 32):
+        """
+        Initializes a DecodedAudioCache instance, creating its directory if needed.
+
+        Parameters:
+            directory (str): The directory holding the cache entries.
+            max_bytes (int): The maximum total size of the cached data.
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def get_key(handler):
+        """
+        Return the cache key of a file decoded by a handler.
+
+        Parameters:
+            handler (FileHandler): The handler of the file.
+
+        Returns:
+            str: The hexadecimal key.
+        """
+        path = os.path.abspath(handler.file)
+        status = os.stat(path)
+        decoding = json.dumps([type(handler).__name__, handler.get_format()], sort_keys=True)
+        return hashlib.sha1(f'{path}|{status.st_size}|{status.st_mtime_ns}|{decoding}'.encode()).hexdigest()
+
+    def get_paths(self, key):
+        """
+        Return the paths of the data and metadata files of an entry.
+
+        Parameters:
+            key (str): The cache key.
+
+        Returns:
+            tuple: The .npy data path and the .json metadata path.
+        """
+        base = os.path.join(self.directory, key)
+        return base + '.npy', base + '.json'
+
+    @staticmethod
+    def write_atomically(path, write, mode='wb'):
+        """
+        Write a file through a uniquely named temporary file next to it, then move it into place.
+
+        Every writer, e.g. each of several batch processes decoding the same file, gets its own
+        temporary file, so readers only ever see complete files.
+
+        Parameters:
+            path (str): The path of the file.
+            write (callable): Called with the open temporary file to write the content.
+            mode (str): The mode of the temporary file, 'wb' or 'w'.
+        """
+        directory, name = os.path.split(path)
+        temporary = tempfile.NamedTemporaryFile(mode, dir=directory, prefix=name + '.', suffix='.tmp', delete=False)
+        try:
+            with temporary:
+                write(temporary)
+            os.replace(temporary.name, path)
+        except BaseException:
+            try:
+                os.remove(temporary.name)
+            except OSError:
+                pass
+            raise
+
+    def load(self, key, count=True):
+        """
+        Load an entry, marking it as recently used.
+
+        Parameters:
+            key (str): The cache key.
+            count (bool): Whether to update the hit/miss counters.
+
+        Returns:
+            tuple or None: The memory-mapped data and sampling rate, or None if the entry is missing.
+        """
+        data_path, metadata_path = self.get_paths(key)
+        try:
+            with open(metadata_path) as metadata_file:
+                sampling_rate = json.load(metadata_file)['sampling_rate']
+            data = np.load(data_path, mmap_mode='r')
+            os.utime(data_path)
+        except (OSError, ValueError, KeyError):
+            if count:
+                self.misses += 1
+            return None
+        if count:
+            self.hits += 1
+        return data, sampling_rate
+
+    def store(self, key, data, sampling_rate):
+        """
+        Store an entry and evict old entries if the cache grows too large.
+
+        Parameters:
+            key (str): The cache key.
+            data (numpy.ndarray): The decoded audio data.
+            sampling_rate (int): The sampling rate.
+        """
+        data_path, metadata_path = self.get_paths(key)
+        data = np.ascontiguousarray(data, dtype=np.asarray(data).dtype.newbyteorder('='))
+        self.write_atomically(data_path, lambda data_file: np.save(data_file, data))
+        self.write_atomically(metadata_path, lambda metadata_file: json.dump({'sampling_rate': sampling_rate},
+                                                                             metadata_file), mode='w')
+        self.evict()
+
+    def evict(self):
+        """
+        Remove the least recently used entries until the cache fits in max_bytes.
+
+        The most recently used entry is always kept.
+        """
+        entries = []
+        for name in os.listdir(self.directory):
+            if name.endswith('.npy'):
+                status = os.stat(os.path.join(self.directory, name))
+                entries.append((status.st_mtime, status.st_size, name[:-len('.npy')]))
+        entries.sort()
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, key in entries[:-1]:
+            if total <= self.max_bytes:
+                break
+            for path in self.get_paths(key):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            total -= size
+
+
+class ChunkReader(ABC):
+    """
+    Abstract base class for readers yielding audio data in fixed-size frames.
+
+    Each frame has frame_size samples, except possibly the last one, and starts frame_size - overlap
+    samples after the previous one. Frames are shaped like the data returned by generate_data:
+    (samples,) for mono and (samples, channels) otherwise. In single precision every frame is
+    converted to float32 on its own. Iterating again restarts from the beginning.
+
+    Attributes:
+        sampling_rate (int): The sampling rate of the data.
+        frame_size (int): The number of samples per frame.
+        overlap (int): The number of samples shared by consecutive frames.
+
+    Methods:
+        read(count): Abstract method to read the next samples.
+    """
+
+    def __init__(self, sampling_rate, frame_size, overlap=0):
+        """
+        Initializes a ChunkReader instance.
+
+        Parameters:
+            sampling_rate (int): The sampling rate of the data.
+            frame_size (int): The number of samples per frame.
+            overlap (int): The number of samples shared by consecutive frames.
+        """
+        if not 0 <= overlap < frame_size:
+            raise ValueError('overlap must be non-negative and smaller than frame_size')
+        self.sampling_rate = sampling_rate
+        self.frame_size = frame_size
+        self.overlap = overlap
+
+    @abstractmethod
+    def read(self, count):
+        """
+        Abstract method to read the next samples.
+
+        Parameters:
+            count (int): The maximum number of samples to read.
+
+        Returns:
+            numpy.ndarray: The samples, empty once the data is exhausted.
+        """
+        pass
+
+    def rewind(self):
+        """
+        Restart reading from the first sample.
+        """
+        pass
+
+    def __iter__(self):
+        self.rewind()
+        frame = self.read(self.frame_size)
+        if not len(frame):
+            return
+        yield Precision.convert_samples(frame)
+
+        hop = self.frame_size - self.overlap
+        while True:
+            samples = self.read(hop)
+            if not len(samples):
+                return
+            if self.overlap:
+                samples = np.concatenate((frame[len(frame) - self.overlap:], samples))
+            frame = samples
+            yield Precision.convert_samples(frame)
+
+
+class ArrayChunkReader(ChunkReader):
+    """
+    Yields frames of an in-memory or memory-mapped array as views, without copying unless the frames
+    have to be converted to single precision.
+
+    Attributes:
+        data (numpy.ndarray): The audio data.
+    """
+
+    def __init__(self, data, sampling_rate, frame_size, overlap=0):
+        """
+        Initializes an ArrayChunkReader instance.
+
+        Parameters:
+            data (numpy.ndarray): The audio data.
+            sampling_rate (int): The sampling rate of the data.
+            frame_size (int): The number of samples per frame.
+            overlap (int): The number of samples shared by consecutive frames.
+        """
+        super().__init__(sampling_rate, frame_size, overlap)
+        self.data = data
+        self.position = 0
+
+    def read(self, count):
+        samples = self.data[self.position:self.position + count]
+        self.position += len(samples)
+        return samples
+
+    def rewind(self):
+        self.position = 0
+
+    def __iter__(self):
+        hop = self.frame_size - self.overlap
+        start = 0
+        while start == 0 or start + self.overlap < len(self.data):
+            frame = self.data[start:start + self.frame_size]
+            if not len(frame):
+                return
+            yield Precision.convert_samples(frame)
+            start += hop
+
+
+class WavHeader:
+    """
+    Layout of the sample data of a WAV file, parsed from its RIFF header.
+
+    Attributes:
+        sampling_rate (int): The sampling rate.
+        channels (int): The number of channels.
+        bits_per_sample (int): The number of bits of a single sample.
+        dtype (numpy.dtype): The dtype of the decoded samples.
+        data_offset (int): The position of the first sample in the file.
+        data_size (int): The size of the data chunk in bytes.
+        samples_number (int): The number of samples per channel.
+    """
+
+    PCM = 0x0001
+    IEEE_FLOAT = 0x0003
+    EXTENSIBLE = 0xFFFE
+
+    def __init__(self, stream):
+        """
+        Parses the RIFF header, leaving the stream positioned at the first sample.
+
+        Parameters:
+            stream (file object): A binary stream positioned at the start of the file.
+        """
+        riff, _, wave = struct.unpack('<4sI4s', stream.read(12))
+        if riff not in (b'RIFF', b'RIFX') or wave != b'WAVE':
+            raise ValueError('Not a RIFF WAVE file')
+        endianness = '<' if riff == b'RIFF' else '>'
+
+        format_tag = None
+        while True:
+            header = stream.read(8)
+            if len(header) < 8:
+                raise ValueError('WAV file has no data chunk')
+            chunk_id, chunk_size = struct.unpack(endianness + '4sI', header)
+            if chunk_id == b'fmt ':
+                fmt = stream.read(chunk_size + chunk_size % 2)
+                format_tag, self.channels, self.sampling_rate, _, _, self.bits_per_sample = struct.unpack(
+                    endianness + 'HHIIHH', fmt[:16])
+                if format_tag == self.EXTENSIBLE and chunk_size >= 26:
+                    format_tag = struct.unpack(endianness + 'H', fmt[24:26])[0]
+            elif chunk_id == b'data':
+                if format_tag is None:
+                    raise ValueError('WAV data chunk precedes the fmt chunk')
+                self.data_offset = stream.tell()
+                self.data_size = chunk_size
+                break
+            else:
+                stream.seek(chunk_size + chunk_size % 2, 1)
+
+        self.sample_width = self.bits_per_sample // 8
+        if format_tag == self.PCM and self.bits_per_sample == 8:
+            self.dtype = np.dtype('u1')
+        elif format_tag == self.PCM and self.bits_per_sample in (16, 24, 32, 64):
+            self.dtype = np.dtype(endianness + ('i4' if self.bits_per_sample == 24 else f'i{self.sample_width}'))
+        elif format_tag == self.IEEE_FLOAT and self.bits_per_sample in (32, 64):
+            self.dtype = np.dtype(endianness + f'f{self.sample_width}')
+        else:
+            raise ValueError(f'Unsupported WAV format {format_tag} with {self.bits_per_sample} bits per sample')
+        self.samples_number = self.data_size // (self.sample_width * self.channels)
+
+    def decode(self, raw):
+        """
+        Convert raw bytes of whole samples to an array shaped like wavfile.read output.
+
+        24-bit samples are returned as left-justified int32, as scipy does.
+
+        Parameters:
+            raw (bytes): The raw sample data.
+
+        Returns:
+            numpy.ndarray: The decoded samples.
+        """
+        if self.bits_per_sample == 24:
+            packed = np.frombuffer(raw, dtype=np.uint8).reshape(-1, 3)
+            padded = np.zeros((len(packed), 4), dtype=np.uint8)
+            if self.dtype.byteorder == '>':
+                padded[:, :3] = packed
+            else:
+                padded[:, 1:] = packed
+            samples = padded.view(self.dtype).reshape(-1)
+        else:
+            samples = np.frombuffer(raw, dtype=self.dtype)
+        if self.channels > 1:
+            samples = samples.reshape(-1, self.channels)
+        return samples
+
+
+class WavChunkReader(ChunkReader):
+    """
+    Streams the data chunk of a WAV file in fixed-size frames with constant memory.
+
+    Attributes:
+        file (str): The path to the WAV file.
+        header (WavHeader): The parsed layout of the file.
+    """
+
+    def __init__(self, file, frame_size, overlap=0):
+        """
+        Initializes a WavChunkReader instance.
+
+        Parameters:
+            file (str): The path to the WAV file.
+            frame_size (int): The number of samples per frame.
+            overlap (int): The number of samples shared by consecutive frames.
+        """
+        self.file = file
+        with open(file, 'rb') as stream:
+            self.header = WavHeader(stream)
+        super().__init__(self.header.sampling_rate, frame_size, overlap)
+        self.stream = None
+        self.remaining = 0
+
+    def rewind(self):
+        if self.stream is None:
+            self.stream = open(self.file, 'rb')
+        self.stream.seek(self.header.data_offset)
+        self.remaining = self.header.samples_number
+
+    def read(self, count):
+        count = min(count, self.remaining)
+        self.remaining -= count
+        raw = self.stream.read(count * self.header.sample_width * self.header.channels)
+        return self.header.decode(raw)
+
+    def __iter__(self):
+        try:
+            yield from super().__iter__()
+        finally:
+            if self.stream is not None:
+                self.stream.close()
+                self.stream = None
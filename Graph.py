@@ -1,26 +1,322 @@
-import matplotlib.pyplot as plt
-from Canvas import Canvas
+import copy
+import weakref
+from typing import TYPE_CHECKING
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from Axis import LazyTimeAxis
 from abc import ABC, abstractmethod
 
+if TYPE_CHECKING:
+    from Canvas import Canvas
+
 
 class Graph(ABC):
     """
     Abstract base class for creating graphs.
 
+    Graphs draw only what can be seen at screen resolution. The points inside the visible x range
+    are split into one column per pixel of the axes width, and only the minimum and maximum of each
+    column are drawn, which keeps every peak. Whenever the x limits change, e.g. when zooming, the
+    visible range is decimated again from the full-resolution data.
+
+    A created graph keeps its artists, so new data is shown by update, which changes the artists in
+    place instead of clearing the axes and drawing them again. The axis limits are recomputed only
+    when the new data no longer fits the view, or fills less than min_extent_ratio of it.
+    With blit, the artists are animated and redrawn over a cached background of the figure.
+    Graphs can also be rendered to image files with export, which uses only the Agg backend.
+
     Attributes:
     - x: List or array-like, x-axis data
     - y: List or array-like, y-axis data
     - xlabel: str, label for x-axis
     - ylabel: str, label for y-axis
     - title: str, title of the graph
+    - blit: bool, whether updates are redrawn with blitting
+    - ax: matplotlib.axes.Axes or None, the axes the graph was created on
+    - artists: list, the artists of the graph
+    - bounds: tuple or None, the extent of the data
+    - min_extent_ratio: float, the fraction of the view below which the limits are recomputed
     """
 
-    def __init__(self, x, y, xlabel, ylabel, title):
+    min_extent_ratio = 0.5
+
+    def __init__(self, x, y, xlabel, ylabel, title, blit=False):
         self.x = x
         self.y = y
         self.xlabel = xlabel
         self.ylabel = ylabel
         self.title = title
+        self.blit = blit
+        self.sorted_data = None
+        self.ax = None
+        self.artists = []
+        self.bounds = None
+
+    def set_data(self, x, y):
+        """
+        Replace the data of the graph without redrawing it.
+
+        Parameters:
+        - x: List or array-like, x-axis data
+        - y: List or array-like, y-axis data
+        """
+        self.x = x
+        self.y = y
+        self.sorted_data = None
+
+    def get_sorted_data(self):
+        """
+        Return the data ordered by increasing x, sorting it once if needed.
+
+        A LazyTimeAxis is kept as it is, so that its values are only computed for visible ranges.
+
+        Returns:
+        - tuple: The x and y data.
+        """
+        if self.sorted_data is None:
+            x = self.x if isinstance(self.x, LazyTimeAxis) else np.asarray(self.x)
+            y = np.asarray(self.y)
+            if not isinstance(x, LazyTimeAxis) and len(x) and np.any(np.diff(x) < 0):
+                order = np.argsort(x, kind='stable')
+                x = x[order]
+                y = y[order]
+            self.sorted_data = (x, y)
+        return self.sorted_data
+
+    @staticmethod
+    def get_visible_range(x, limits):
+        """
+        Return the index range of the points inside the x limits, plus one point on each side.
+
+        Parameters:
+        - x: numpy.ndarray or LazyTimeAxis, sorted x-axis data
+        - limits: tuple, the lower and upper x limit
+
+        Returns:
+        - tuple: The first index and the index after the last one.
+        """
+        low, high = sorted(limits)
+        if isinstance(x, LazyTimeAxis):
+            start, stop = x.index_of(low), x.index_of(high) + 2
+        else:
+            start, stop = np.searchsorted(x, low), np.searchsorted(x, high, side='right') + 1
+        return max(0, start - 1), min(len(x), stop)
+
+    @staticmethod
+    def get_column_starts(x, columns_number):
+        """
+        Split sorted x data into columns of equal width and return the first index of each non-empty one.
+
+        Parameters:
+        - x: numpy.ndarray, sorted x-axis data
+        - columns_number: int, the number of columns
+
+        Returns:
+        - numpy.ndarray: The first indices of the non-empty columns.
+        """
+        edges = np.linspace(x[0], x[-1], columns_number + 1)
+        starts = np.searchsorted(x, edges[:-1])
+        return starts[np.r_[True, np.diff(starts) > 0] & (starts < len(x))]
+
+    @staticmethod
+    def decimate(x, y, columns_number):
+        """
+        Reduce sorted data to the minimum and maximum of each of columns_number columns.
+
+        Data with at most two points per column is returned unchanged.
+
+        Parameters:
+        - x: numpy.ndarray, sorted x-axis data
+        - y: numpy.ndarray, y-axis data shaped (points,) or (points, series)
+        - columns_number: int, the number of columns, e.g. the width of the axes in pixels
+
+        Returns:
+        - tuple: The decimated x and y data.
+        """
+        if len(x) <= 2 * columns_number or x[-1] == x[0]:
+            return x, y
+        starts = Graph.get_column_starts(x, columns_number)
+        lower = np.minimum.reduceat(y, starts, axis=0)
+        upper = np.maximum.reduceat(y, starts, axis=0)
+        decimated_x = np.append(np.repeat(x[starts], 2), x[-1])
+        decimated_y = np.concatenate((np.stack((lower, upper), axis=1).reshape((-1,) + y.shape[1:]), y[-1:]))
+        return decimated_x, decimated_y
+
+    @staticmethod
+    def get_pixels(ax):
+        """
+        Return the width of the axes in pixels.
+
+        Parameters:
+        - ax: matplotlib.axes.Axes, the axes
+
+        Returns:
+        - int: The width, at least 1.
+        """
+        return max(1, int(ax.get_window_extent().width))
+
+    @staticmethod
+    def get_series_number(y):
+        """
+        Return the number of series of y data.
+
+        Parameters:
+        - y: array-like, y-axis data shaped (points,) or (points, series)
+
+        Returns:
+        - int: The number of series.
+        """
+        return np.shape(y)[1] if np.ndim(y) == 2 else 1
+
+    def get_bounds(self):
+        """
+        Return the extent of the data.
+
+        Returns:
+        - tuple or None: The lower and upper x and the lower and upper y, or None for empty data.
+        """
+        x, y = self.get_sorted_data()
+        if not len(x):
+            return None
+        return float(x[0]), float(x[-1]), float(np.nanmin(y)), float(np.nanmax(y))
+
+    def fits_view(self, bounds):
+        """
+        Check whether data of the given extent can be shown without recomputing the axis limits.
+
+        Only autoscaled axes are checked, so a view set by zooming is kept.
+
+        Parameters:
+        - bounds: tuple or None, the extent returned by get_bounds
+
+        Returns:
+        - bool: True if the extent lies within the view limits of the axes and fills at least
+          min_extent_ratio of them.
+        """
+        if bounds is None or self.bounds is None:
+            return bounds == self.bounds
+        views = ((self.ax.get_autoscalex_on(), bounds[:2], self.ax.get_xlim()),
+                 (self.ax.get_autoscaley_on(), bounds[2:], self.ax.get_ylim()))
+        for autoscale, (low, high), limits in views:
+            view_low, view_high = sorted(limits)
+            if autoscale and (low < view_low or high > view_high
+                              or high - low < self.min_extent_ratio * (view_high - view_low)):
+                return False
+        return True
+
+    def attach(self, ax, artists):
+        """
+        Keep the artists drawn on the axes and redraw them whenever the x limits change.
+
+        Parameters:
+        - ax: matplotlib.axes.Axes, the axes the artists were drawn on
+        - artists: list, the artists of the graph
+        """
+        self.ax = ax
+        self.artists = list(artists)
+        self.bounds = self.get_bounds()
+        ax.callbacks.connect('xlim_changed', self.on_limits_changed)
+        if self.blit:
+            BlitManager.get(ax.figure.canvas).add(self.artists)
+
+    def can_update(self, ax, y):
+        """
+        Check whether the graph is still shown on the axes and can take new y data with update.
+
+        Parameters:
+        - ax: matplotlib.axes.Axes, the axes the graph should be shown on
+        - y: array-like, the new y-axis data
+
+        Returns:
+        - bool: True if update can be used, False if the graph has to be created again.
+        """
+        if self.ax is not ax or ax.figure is None or ax not in ax.figure.axes or not self.artists:
+            return False
+        if any(artist.axes is not ax for artist in self.artists):
+            return False
+        return self.get_series_number(y) == self.get_series_number(self.get_sorted_data()[1])
+
+    def update(self, x, y):
+        """
+        Show new data by changing the artists in place.
+
+        The axes are not redrawn; call Graph.redraw afterwards, once for all graphs on the axes.
+        A graph created from empty data has no artists to change; can_update returns False for it
+        and it has to be created again.
+
+        Parameters:
+        - x: List or array-like, x-axis data
+        - y: List or array-like, y-axis data
+
+        Returns:
+        - bool: True if the axis limits have to be recomputed for the new data.
+        """
+        if not self.artists:
+            raise ValueError('The graph has no artists to update; create it again instead')
+        self.set_data(x, y)
+        bounds = self.get_bounds()
+        rescale = not self.fits_view(bounds)
+        self.bounds = bounds
+        self.on_limits_changed(self.ax)
+        return rescale
+
+    @staticmethod
+    def redraw(ax, graphs, rescale=False):
+        """
+        Redraw updated graphs of one axes.
+
+        With rescale, the data limits are set to the extent of the graphs and the view is autoscaled,
+        which requires a full redraw of the figure. Otherwise the graphs are blitted if they use
+        blitting.
+
+        Parameters:
+        - ax: matplotlib.axes.Axes, the axes of the graphs
+        - graphs: list, the graphs shown on the axes
+        - rescale: bool, whether the axis limits have to be recomputed
+        """
+        canvas = ax.figure.canvas
+        if rescale:
+            ax.ignore_existing_data_limits = True
+            for graph in graphs:
+                if graph.bounds is not None:
+                    low_x, high_x, low_y, high_y = graph.bounds
+                    ax.update_datalim([(low_x, low_y), (high_x, high_y)])
+            ax.autoscale_view()
+            canvas.draw_idle()
+        elif any(graph.blit for graph in graphs):
+            BlitManager.get(canvas).update(canvas)
+        else:
+            canvas.draw_idle()
+
+    def export(self, path, size=(8, 6), dpi=100):
+        """
+        Render the graph to an image file with the Agg backend, without a GUI.
+
+        The graph is drawn by a copy on a new figure, so a graph shown in the GUI keeps its artists.
+        The format follows the extension of the path, e.g. PNG or SVG.
+
+        Parameters:
+        - path: str, the path of the image file
+        - size: tuple, the width and height of the figure in inches
+        - dpi: float, the resolution of the figure in dots per inch
+        """
+        figure = Figure(figsize=size, dpi=dpi)
+        FigureCanvasAgg(figure)
+        graph = copy.copy(self)
+        graph.blit = False
+        graph.create(figure)
+        figure.savefig(path)
+
+    @abstractmethod
+    def on_limits_changed(self, ax):
+        """
+        Abstract method for updating the artists to the current x limits of the axes.
+
+        Parameters:
+        - ax: matplotlib.axes.Axes, the axes of the graph
+        """
+        pass
 
     @abstractmethod
     def create(self, figure):
@@ -33,7 +329,7 @@ class Graph(ABC):
         pass
 
     @abstractmethod
-    def create_on_canvas(self, canvas: Canvas):
+    def create_on_canvas(self, canvas: 'Canvas'):
         """
         Abstract method for creating the graph on a provided canvas.
 
@@ -47,15 +343,106 @@ class Plot(Graph):
     """
     Class for creating a line plot.
 
-    Inherits from Graph.
+    Inherits from Graph. The line is decimated to the minimum and maximum per pixel column. With a
+    WaveformPyramid of the data, wide viewports are read from the pyramid level fitting the pixel
+    columns instead of the full-resolution data.
+
+    Attributes:
+    - pyramid: WaveformPyramid or None, the precomputed min/max summary of y
 
     Methods:
     - create: Create a line plot on a given figure.
     - create_on_canvas: Create a line plot on a given canvas.
+    - plot: Draw the decimated line and keep it decimated when the x limits change.
+    - get_visible_data: Return the decimated data of a viewport.
+    - update: Show new data and its pyramid by changing the line in place.
+    - on_limits_changed: Decimate the visible range again for the current x limits.
     """
 
-    def __init__(self, x, y, xlabel, ylabel, title):
-        super().__init__(x, y, xlabel, ylabel, title)
+    def __init__(self, x, y, xlabel, ylabel, title, pyramid=None, blit=False):
+        super().__init__(x, y, xlabel, ylabel, title, blit)
+        self.pyramid = pyramid
+
+    def update(self, x, y, pyramid=None):
+        """
+        Show new data by changing the line in place; see Graph.update.
+
+        Parameters:
+        - x: List or array-like, x-axis data
+        - y: List or array-like, y-axis data
+        - pyramid: WaveformPyramid or None, the precomputed min/max summary of y
+
+        Returns:
+        - bool: True if the axis limits have to be recomputed for the new data.
+        """
+        self.pyramid = pyramid
+        return super().update(x, y)
+
+    def get_bounds(self):
+        """
+        Return the extent of the data, reading the y extent from the coarsest pyramid level if there is one.
+
+        Returns:
+        - tuple or None: The lower and upper x and the lower and upper y, or None for empty data.
+        """
+        if self.pyramid is None:
+            return super().get_bounds()
+        x, _ = self.get_sorted_data()
+        if not len(x):
+            return None
+        summary = self.pyramid.get_level(self.pyramid.levels_number - 1)
+        return (float(x[0]), float(x[-1]), float(np.min(summary[:, self.pyramid.MINIMUM])),
+                float(np.max(summary[:, self.pyramid.MAXIMUM])))
+
+    def get_visible_data(self, limits, pixels):
+        """
+        Return the decimated data of a viewport.
+
+        Parameters:
+        - limits: tuple, the lower and upper x limit, or None for the whole data
+        - pixels: int, the width of the axes in pixels
+
+        Returns:
+        - tuple: The x and y data to draw.
+        """
+        x, y = self.get_sorted_data()
+        if limits is None:
+            limits = (x[0], x[-1])
+        if self.pyramid is not None:
+            decimated = self.pyramid.decimate(limits, pixels)
+            if decimated is not None:
+                return decimated
+        start, stop = self.get_visible_range(x, limits)
+        return self.decimate(np.asarray(x[start:stop]), y[start:stop], pixels)
+
+    def plot(self, ax):
+        """
+        Draw the decimated line on the given axes and keep it decimated when the x limits change.
+
+        Parameters:
+        - ax: matplotlib.axes.Axes, the axes on which the line will be drawn
+        """
+        x, y = self.get_sorted_data()
+        if not len(x):
+            ax.plot([], [])
+            return
+        self.attach(ax, ax.plot(*self.get_visible_data(None, self.get_pixels(ax))))
+
+    def on_limits_changed(self, ax):
+        """
+        Decimate the visible range of the line again for the current x limits of the axes.
+
+        Parameters:
+        - ax: matplotlib.axes.Axes, the axes of the line
+        """
+        x, _ = self.get_sorted_data()
+        if not len(x):
+            for line in self.artists:
+                line.set_data([], [])
+            return
+        visible_x, visible_y = self.get_visible_data(ax.get_xlim(), self.get_pixels(ax))
+        for index, line in enumerate(self.artists):
+            line.set_data(visible_x, visible_y if visible_y.ndim == 1 else visible_y[:, index])
 
     def create(self, figure):
         """
@@ -65,17 +452,20 @@ class Plot(Graph):
         - figure: matplotlib.figure.Figure, the figure on which the line plot will be created
         """
         ax = figure.gca()
-        ax.plot(self.x, self.y)
-        plt.draw()
+        self.plot(ax)
+        ax.set_xlabel(self.xlabel)
+        ax.set_ylabel(self.ylabel)
+        ax.set_title(self.title)
+        ax.figure.canvas.draw()
 
-    def create_on_canvas(self, canvas: Canvas):
+    def create_on_canvas(self, canvas: 'Canvas'):
         """
         Create a line plot on a given canvas.
 
         Parameters:
         - canvas: Canvas, the canvas on which the line plot will be created
         """
-        canvas.ax.plot(self.x, self.y)
+        self.plot(canvas.ax)
         canvas.ax.set_xlabel(self.xlabel)
         canvas.ax.set_ylabel(self.ylabel)
         canvas.ax.set_title(self.title)
@@ -86,15 +476,141 @@ class StemPlot(Graph):
     """
     Class for creating a stem plot.
 
-    Inherits from Graph.
+    Inherits from Graph. Two-dimensional y data, e.g. a multi-channel spectrum, is drawn as one
+    stem series per column.
+
+    All stems of a series are drawn as a single LineCollection, the markers as a single line without
+    segments, and the baseline as one more line, instead of an artist per stem as in ax.stem. When
+    there are more stems than max_stem_density per pixel of the axes width, the stems falling into
+    one pixel column are merged into a single stem spanning their minimum and maximum; the merged
+    stems cover exactly the same pixels. Markers are drawn only while there are at most
+    max_marker_density of them per pixel.
+
+    Attributes:
+    - max_stem_density: float, the number of stems per pixel above which stems are merged
+    - max_marker_density: float, the number of markers per pixel above which markers are omitted
 
     Methods:
     - create: Create a stem plot on a given figure.
     - create_on_canvas: Create a stem plot on a given canvas.
+    - get_stems: Return the positions and extents of the stems drawn for one series.
+    - get_segments: Return the stem segments of one series for LineCollection.set_segments.
+    - stem: Draw the stems and keep them merged per pixel column when the x limits change.
+    - on_limits_changed: Merge the visible stems again for the current x limits.
     """
 
-    def __init__(self, x, y, xlabel, ylabel, title):
-        super().__init__(x, y, xlabel, ylabel, title)
+    max_stem_density = 2.0
+    max_marker_density = 0.2
+
+    def __init__(self, x, y, xlabel, ylabel, title, blit=False):
+        super().__init__(x, y, xlabel, ylabel, title, blit)
+        self.collections = []
+        self.markers = []
+        self.baseline = None
+
+    def get_bounds(self):
+        """
+        Return the extent of the data, including the baseline at zero.
+
+        Returns:
+        - tuple or None: The lower and upper x and the lower and upper y, or None for empty data.
+        """
+        bounds = super().get_bounds()
+        if bounds is None:
+            return None
+        return bounds[0], bounds[1], min(bounds[2], 0.0), max(bounds[3], 0.0)
+
+    def get_stems(self, x, y, pixels):
+        """
+        Return the positions and extents of the stems drawn for one series.
+
+        Parameters:
+        - x: numpy.ndarray, sorted x-axis data
+        - y: numpy.ndarray, y-axis data of the series
+        - pixels: float, the width of the axes in pixels
+
+        Returns:
+        - tuple: The x positions, lower ends and upper ends of the stems.
+        """
+        zeros = np.zeros_like(y)
+        columns_number = int(pixels * self.max_stem_density)
+        if len(x) <= columns_number or x[-1] == x[0]:
+            return x, np.minimum(y, zeros), np.maximum(y, zeros)
+
+        starts = self.get_column_starts(x, columns_number)
+        lower = np.minimum(np.minimum.reduceat(y, starts), 0)
+        upper = np.maximum(np.maximum.reduceat(y, starts), 0)
+        return x[starts], lower, upper
+
+    def get_segments(self, x, y, pixels):
+        """
+        Return the stem segments of one series in the form accepted by LineCollection.set_segments.
+
+        Parameters:
+        - x: numpy.ndarray, sorted x-axis data
+        - y: numpy.ndarray, y-axis data of the series
+        - pixels: float, the width of the axes in pixels
+
+        Returns:
+        - numpy.ndarray: The segments shaped (stems, 2, 2).
+        """
+        positions, lower, upper = self.get_stems(x, y, pixels)
+        segments = np.empty((len(positions), 2, 2))
+        segments[:, :, 0] = positions[:, np.newaxis]
+        segments[:, 0, 1] = lower
+        segments[:, 1, 1] = upper
+        return segments
+
+    def stem(self, ax):
+        """
+        Draw the stems of every column of y on the given axes and keep them merged per pixel column
+        when the x limits change.
+
+        Parameters:
+        - ax: matplotlib.axes.Axes, the axes on which the stems will be drawn
+        """
+        x, y = self.get_sorted_data()
+        if not len(x):
+            return
+        x = np.asarray(x[:])
+        columns = list(y.T if y.ndim == 2 else [y])
+
+        pixels = self.get_pixels(ax)
+        show_markers = len(x) <= pixels * self.max_marker_density
+        self.collections = []
+        self.markers = []
+        for index, column in enumerate(columns):
+            color = f'C{index}'
+            positions, lower, upper = self.get_stems(x, column, pixels)
+            self.collections.append(ax.vlines(positions, lower, upper, colors=color))
+            self.markers.extend(ax.plot(x if show_markers else [], column if show_markers else [],
+                                        linestyle='none', marker='o', color=color))
+        self.baseline, = ax.plot([x[0], x[-1]], [0, 0], color='C3')
+        self.attach(ax, self.collections + self.markers + [self.baseline])
+
+    def on_limits_changed(self, ax):
+        """
+        Merge the visible stems per pixel column again for the current x limits of the axes.
+
+        Parameters:
+        - ax: matplotlib.axes.Axes, the axes of the stems
+        """
+        x, y = self.get_sorted_data()
+        x = np.asarray(x[:])
+        columns = list(y.T if y.ndim == 2 else [y])
+        self.baseline.set_data([x[0], x[-1]] if len(x) else [], [0, 0] if len(x) else [])
+
+        start, stop = self.get_visible_range(x, ax.get_xlim())
+        pixels = self.get_pixels(ax)
+        visible_x = x[start:stop]
+        show_visible_markers = len(visible_x) <= pixels * self.max_marker_density
+        for collection, marker, column in zip(self.collections, self.markers, columns):
+            visible_y = column[start:stop]
+            collection.set_segments(self.get_segments(visible_x, visible_y, pixels))
+            if show_visible_markers:
+                marker.set_data(visible_x, visible_y)
+            else:
+                marker.set_data([], [])
 
     def create(self, figure):
         """
@@ -104,21 +620,133 @@ class StemPlot(Graph):
         - figure: matplotlib.figure.Figure, the figure on which the stem plot will be created
         """
         ax = figure.gca()
-        ax.stem(self.x, self.y)
+        self.stem(ax)
         ax.set_xlabel(self.xlabel)
         ax.set_ylabel(self.ylabel)
         ax.set_title(self.title)
         ax.figure.canvas.draw()
 
-    def create_on_canvas(self, canvas: Canvas):
+    def create_on_canvas(self, canvas: 'Canvas'):
         """
         Create a stem plot on a given canvas.
 
         Parameters:
         - canvas: Canvas, the canvas on which the stem plot will be created
         """
-        canvas.ax.stem(self.x, self.y)
+        self.stem(canvas.ax)
         canvas.ax.set_xlabel(self.xlabel)
         canvas.ax.set_ylabel(self.ylabel)
         canvas.ax.set_title(self.title)
         canvas.ax.figure.canvas.draw()
+
+
+class BlitManager:
+    """
+    Redraws the animated artists of a figure canvas over a cached background.
+
+    Animated artists are skipped by a full draw of the figure. After every full draw the manager
+    copies the figure, which is then the background without the artists, and draws the artists on
+    top. An update restores the background, draws only the artists and blits the result, which is
+    much cheaper than redrawing the axes, ticks and labels. Artists removed from the figure, e.g. by
+    clearing the axes, are dropped.
+
+    There is a single manager per canvas, since the background must not contain any animated artist
+    of the canvas. Managers keep only weak references, so they do not keep closed figures alive.
+
+    Attributes:
+        managers (weakref.WeakKeyDictionary): The manager of every canvas.
+        artists (list): Weak references to the animated artists, in the order they were added.
+        background (object or None): The copy of the canvas taken after the last full draw.
+
+    Methods:
+        get(canvas): Return the manager of a canvas, creating it if needed.
+        add(artists): Animate artists and redraw them on every update.
+        update(canvas): Redraw the artists, with a full draw if there is no background yet.
+    """
+
+    managers = weakref.WeakKeyDictionary()
+
+    def __init__(self, canvas):
+        """
+        Initializes a BlitManager instance and connects it to the draw events of the canvas.
+
+        Parameters:
+            canvas (matplotlib.backend_bases.FigureCanvasBase): The canvas.
+        """
+        self.artists = []
+        self.background = None
+        canvas.mpl_connect('draw_event', self.on_draw)
+
+    @staticmethod
+    def get(canvas):
+        """
+        Return the manager of a canvas, creating it if needed.
+
+        Parameters:
+            canvas (matplotlib.backend_bases.FigureCanvasBase): The canvas.
+
+        Returns:
+            BlitManager: The manager.
+        """
+        manager = BlitManager.managers.get(canvas)
+        if manager is None:
+            manager = BlitManager.managers[canvas] = BlitManager(canvas)
+        return manager
+
+    def add(self, artists):
+        """
+        Animate artists and redraw them on every update.
+
+        Artists are left unchanged on canvases without blitting support, where update falls back to
+        a full draw.
+
+        Parameters:
+            artists (list): The artists.
+        """
+        for artist in artists:
+            if artist.figure is not None and artist.figure.canvas.supports_blit:
+                artist.set_animated(True)
+                self.artists.append(weakref.ref(artist))
+
+    def get_artists(self, canvas):
+        """
+        Return the animated artists still shown on the canvas, dropping the removed ones.
+
+        Parameters:
+            canvas (matplotlib.backend_bases.FigureCanvasBase): The canvas.
+
+        Returns:
+            list: The artists in drawing order.
+        """
+        self.artists = [reference for reference in self.artists
+                        if reference() is not None and reference().axes is not None
+                        and reference().axes in canvas.figure.axes]
+        return sorted((reference() for reference in self.artists), key=lambda artist: artist.get_zorder())
+
+    def on_draw(self, event):
+        """
+        Copy the background after a full draw and draw the artists on top of it.
+
+        Parameters:
+            event (matplotlib.backend_bases.DrawEvent): The draw event.
+        """
+        canvas = event.canvas
+        self.background = canvas.copy_from_bbox(canvas.figure.bbox)
+        for artist in self.get_artists(canvas):
+            canvas.figure.draw_artist(artist)
+
+    def update(self, canvas):
+        """
+        Redraw the artists over the background, with a full draw if there is no background yet.
+
+        Parameters:
+            canvas (matplotlib.backend_bases.FigureCanvasBase): The canvas.
+        """
+        if self.background is None:
+            canvas.draw_idle()
+            return
+        canvas.restore_region(self.background)
+        for artist in self.get_artists(canvas):
+            canvas.figure.draw_artist(artist)
+        canvas.blit(canvas.figure.bbox)
+        canvas.flush_events()
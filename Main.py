@@ -1,13 +1,18 @@
+import os
 import sys
 from PyQt5.QtWidgets import QApplication
 from Canvas import Canvas
 from Commands import (ChooseFileCommand, AddSignalCommand, DeleteSignalCommand, UpdateSignalCommand, UpdatePlotsCommand,
                       CreateWindowCommand)
 from Controller import Controller
+from FileHandler import DecodedAudioCache
 from Gui import Gui
 from Invoker import Invoker
+from Pyramid import PyramidIndex
 from Receiver import Receiver
 from SignalsHandler import SignalsHandler
+from TransformAnalyzer import TransformAnalyzer
+from TransformCache import TransformCache
 
 
 class App(QApplication):
@@ -15,7 +20,12 @@ class App(QApplication):
         super(App, self).__init__(sys_argv)
 
         self.gui = Gui()
-        self.signals_handler = SignalsHandler()
+        TransformAnalyzer.set_workers(-1)
+        TransformAnalyzer.set_cache(TransformCache())
+        cache_directory = os.path.join(os.path.expanduser('~'), '.cache', 'Praca-dyplomowa')
+        self.audio_cache = DecodedAudioCache(cache_directory)
+        self.pyramid_index = PyramidIndex(os.path.join(cache_directory, 'pyramids'))
+        self.signals_handler = SignalsHandler(audio_cache=self.audio_cache, pyramid_index=self.pyramid_index)
         self.controller = Controller(self.gui)
         self.receiver = Receiver()
         self.canvas = Canvas(self.gui.layout1)
@@ -0,0 +1,213 @@
+import numpy as np
+from Precision import Precision
+from abc import ABC, abstractmethod
+
+
+class Oscillator(ABC):
+    """
+    Abstract base class for sinusoid synthesis engines.
+
+    An oscillator generates the sum of sine components
+    amplitude * sin(2π * frequency * t + phase) over a time axis, in the global precision.
+
+    Methods:
+        generate(time, amplitudes, frequencies, phases): Abstract method to generate the composite waveform.
+    """
+
+    @abstractmethod
+    def generate(self, time, amplitudes, frequencies, phases):
+        """
+        Abstract method to generate the composite waveform of the given components.
+
+        Parameters:
+            time (numpy.ndarray): The time values for which the waveform should be generated.
+            amplitudes (numpy.ndarray): The amplitudes of the components.
+            frequencies (numpy.ndarray): The frequencies of the components.
+            phases (numpy.ndarray): The phases of the components in degrees.
+
+        Returns:
+            numpy.ndarray: The composite waveform.
+        """
+        pass
+
+
+class SineOscillator(Oscillator):
+    """
+    Generates sinusoids by evaluating np.sin on every sample.
+
+    The (components x samples) phase matrix is processed in blocks, so memory stays bounded
+    regardless of the number of components and samples.
+
+    Attributes:
+        max_block_size (int): The maximum number of elements of a single (components x samples) block.
+
+    Methods:
+        generate(time, amplitudes, frequencies, phases): Generate the composite waveform.
+    """
+
+    def __init__(self, max_block_size=2 ** 16):
+        """
+        Initializes a SineOscillator instance.
+
+        Parameters:
+            max_block_size (int): The maximum number of elements of a single (components x samples) block.
+        """
+        self.max_block_size = max_block_size
+
+    def generate(self, time, amplitudes, frequencies, phases):
+        """
+        Generate the composite waveform of the given components.
+
+        Parameters:
+            time (numpy.ndarray): The time values for which the waveform should be generated.
+            amplitudes (numpy.ndarray): The amplitudes of the components.
+            frequencies (numpy.ndarray): The frequencies of the components.
+            phases (numpy.ndarray): The phases of the components in degrees.
+
+        Returns:
+            numpy.ndarray: The composite waveform.
+        """
+        time = np.asarray(time)
+        amplitudes = np.asarray(amplitudes)
+        angular_frequencies = 2 * np.pi * np.asarray(frequencies)
+        phases = np.deg2rad(phases)
+
+        # The phases are always evaluated in double precision; only the output follows Precision.
+        wave = np.zeros(len(time), dtype=Precision.real)
+        components_number = len(amplitudes)
+        if not components_number:
+            return wave
+
+        components_step = min(components_number, self.max_block_size)
+        samples_step = max(1, self.max_block_size // components_step)
+
+        for first_component in range(0, components_number, components_step):
+            components = slice(first_component, first_component + components_step)
+            block_amplitudes = amplitudes[components]
+            block_frequencies = angular_frequencies[components, np.newaxis]
+            block_phases = phases[components, np.newaxis]
+
+            for first_sample in range(0, len(time), samples_step):
+                samples = slice(first_sample, first_sample + samples_step)
+                block = block_frequencies * time[samples]
+                block += block_phases
+                np.sin(block, out=block)
+                wave[samples] += block_amplitudes @ block
+
+        return wave
+
+
+class PhasorOscillator(Oscillator):
+    """
+    Generates sinusoids by complex phasor rotation instead of evaluating np.sin on every sample.
+
+    The time axis is split into blocks of block_size samples. Inside a block every component is
+    the imaginary part of anchor * r**n, where r = exp(1j * ω * Δt) is the per-sample rotation.
+    The powers r**n are built once per component with a cumulative product. Each anchor is
+    evaluated exactly at the start of its block, so rounding errors cannot accumulate beyond
+    one block. The sum over components of all blocks is then a single matrix product.
+
+    The time axis has to be evenly spaced, as produced by the Axis classes; otherwise the
+    computation falls back to the wrapped SineOscillator.
+
+    Attributes:
+        block_size (int): The number of samples between two exact re-anchorings.
+        max_block_size (int): The maximum number of output samples computed by one matrix product.
+        fallback (SineOscillator): The oscillator used for unevenly spaced time axes.
+
+    Methods:
+        generate(time, amplitudes, frequencies, phases): Generate the composite waveform.
+        is_evenly_spaced(time, time_step): Check whether the time axis matches the phasor recurrence.
+    """
+
+    def __init__(self, block_size=1024, max_block_size=2 ** 18):
+        """
+        Initializes a PhasorOscillator instance.
+
+        Parameters:
+            block_size (int): The number of samples between two exact re-anchorings.
+            max_block_size (int): The maximum number of output samples computed by one matrix product.
+        """
+        self.block_size = block_size
+        self.max_block_size = max_block_size
+        self.fallback = SineOscillator()
+
+    def is_evenly_spaced(self, time, time_step):
+        """
+        Check whether the time axis matches the phasor recurrence.
+
+        The first and last sample of every block are compared with the expected spacing, which
+        is cheap and enough for axes built with np.arange or np.linspace.
+
+        Parameters:
+            time (numpy.ndarray): The time values.
+            time_step (float): The expected spacing between samples.
+
+        Returns:
+            bool: True if every block spans the expected time range.
+        """
+        starts = time[::self.block_size]
+        ends = time[self.block_size - 1::self.block_size]
+        expected = (self.block_size - 1) * time_step
+        tolerance = 1e-9 * max(abs(time[0]), abs(time[-1]), abs(time_step))
+        if not np.all(np.abs(ends - starts[:len(ends)] - expected) <= tolerance):
+            return False
+        last_start = (len(time) - 1) // self.block_size * self.block_size
+        return abs(time[-1] - time[last_start] - (len(time) - 1 - last_start) * time_step) <= tolerance
+
+    def generate(self, time, amplitudes, frequencies, phases):
+        """
+        Generate the composite waveform of the given components.
+
+        Parameters:
+            time (numpy.ndarray): The time values for which the waveform should be generated.
+            amplitudes (numpy.ndarray): The amplitudes of the components.
+            frequencies (numpy.ndarray): The frequencies of the components.
+            phases (numpy.ndarray): The phases of the components in degrees.
+
+        Returns:
+            numpy.ndarray: The composite waveform.
+        """
+        time = np.asarray(time)
+        samples_number = len(time)
+        dtype = Precision.real
+        if samples_number < 2 * self.block_size:
+            return self.fallback.generate(time, amplitudes, frequencies, phases)
+
+        time_step = (time[-1] - time[0]) / (samples_number - 1)
+        if not self.is_evenly_spaced(time, time_step):
+            return self.fallback.generate(time, amplitudes, frequencies, phases)
+
+        amplitudes = np.asarray(amplitudes, dtype=float)
+        angular_frequencies = 2 * np.pi * np.asarray(frequencies, dtype=float)
+        phases = np.deg2rad(phases)
+
+        blocks_number = -(-samples_number // self.block_size)
+        wave = np.zeros(blocks_number * self.block_size, dtype=dtype)
+        blocks = wave.reshape(blocks_number, self.block_size)
+        if not len(amplitudes):
+            return wave[:samples_number]
+
+        starts = time[::self.block_size]
+        blocks_step = max(1, self.max_block_size // self.block_size)
+        components_step = max(1, self.max_block_size // self.block_size)
+
+        for first_component in range(0, len(amplitudes), components_step):
+            components = slice(first_component, first_component + components_step)
+            block_frequencies = angular_frequencies[components, np.newaxis]
+
+            rotations = np.empty((len(block_frequencies), self.block_size), dtype=complex)
+            rotations[:, 0] = 1
+            rotations[:, 1:] = np.exp(1j * block_frequencies * time_step)
+            np.cumprod(rotations, axis=1, out=rotations)
+            rotations = rotations.astype(Precision.complex, copy=False)
+
+            for first_block in range(0, blocks_number, blocks_step):
+                block_range = slice(first_block, first_block + blocks_step)
+                anchors = (amplitudes[components, np.newaxis]
+                           * np.exp(1j * (block_frequencies * starts[block_range]
+                                          + phases[components, np.newaxis]))).astype(Precision.complex)
+                # Im(anchors.T @ rotations) without forming the complex product.
+                blocks[block_range] += anchors.real.T @ rotations.imag + anchors.imag.T @ rotations.real
+
+        return wave[:samples_number]
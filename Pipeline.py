@@ -0,0 +1,210 @@
+import numpy as np
+from Axis import FrequencyAxis
+from TransformAnalyzer import (FFTAnalyzer, IFFTAnalyzer, DCTAnalyzer, IDCTAnalyzer, AnalyticFFTAnalyzer,
+                               AnalyticDCTAnalyzer)
+
+
+class Pipeline:
+    """
+    Lazily evaluated dependency graph of computations.
+
+    Every node is a function of the values of the nodes it depends on. A node is computed only when
+    its value, or the value of a node depending on it, is requested, and at most once until one of
+    its inputs changes. Source nodes hold values set from outside.
+
+    Attributes:
+        functions (dict): The function of every computed node.
+        dependencies (dict): The names of the nodes every computed node depends on.
+        values (dict): The values of the source nodes and of the nodes computed so far.
+
+    Methods:
+        add(name, function, *dependencies): Add a computed node.
+        set(name, value): Set the value of a source node, invalidating the nodes depending on it.
+        get(name): Return the value of a node, computing it and its dependencies if needed.
+        invalidate(name): Drop the computed values of the nodes depending on a node.
+        is_evaluated(name): Check whether the value of a node is available without computation.
+    """
+
+    def __init__(self):
+        """
+        Initializes an empty Pipeline instance.
+        """
+        self.functions = {}
+        self.dependencies = {}
+        self.values = {}
+
+    def add(self, name, function, *dependencies):
+        """
+        Add a computed node.
+
+        Parameters:
+            name (str): The name of the node.
+            function (callable): Called with the values of the dependencies to compute the node.
+            *dependencies (str): The names of the nodes the node depends on.
+        """
+        self.functions[name] = function
+        self.dependencies[name] = dependencies
+        self.invalidate(name)
+        self.values.pop(name, None)
+
+    def set(self, name, value):
+        """
+        Set the value of a source node, invalidating the nodes depending on it.
+
+        Parameters:
+            name (str): The name of the node.
+            value (object): The value.
+        """
+        self.invalidate(name)
+        self.values[name] = value
+
+    def get(self, name):
+        """
+        Return the value of a node, computing it and its dependencies if needed.
+
+        Parameters:
+            name (str): The name of the node.
+
+        Returns:
+            object: The value of the node.
+        """
+        if name not in self.values:
+            if name not in self.functions:
+                raise KeyError(f'Node {name!r} has neither a value nor a function')
+            arguments = [self.get(dependency) for dependency in self.dependencies[name]]
+            self.values[name] = self.functions[name](*arguments)
+        return self.values[name]
+
+    def invalidate(self, name):
+        """
+        Drop the computed values of the nodes depending on a node, directly or indirectly.
+
+        Parameters:
+            name (str): The name of the node.
+        """
+        for dependent, dependencies in self.dependencies.items():
+            if name in dependencies and dependent in self.values:
+                del self.values[dependent]
+                self.invalidate(dependent)
+
+    def is_evaluated(self, name):
+        """
+        Check whether the value of a node is available without computation.
+
+        Parameters:
+            name (str): The name of the node.
+
+        Returns:
+            bool: True if the value is available.
+        """
+        return name in self.values
+
+
+class TransformPipeline(Pipeline):
+    """
+    Dependency graph of the transforms shown by the GUI.
+
+    The sampled wave feeds two independent chains, wave → FFT → IFFT and wave → DCT → IDCT, with the
+    frequency axes of the spectra as side branches. Requesting e.g. the IDCT computes the DCT but not
+    the FFT.
+
+    Source nodes:
+        wave: The real sampled wave.
+        sampling_frequency: The sampling frequency of the wave.
+        bank: The SignalBank the wave was sampled from, or None for a wave of other origin.
+
+    Computed nodes:
+        fft, ifft, fft_frequency_axis, dct, idct, dct_frequency_axis, and the analyzers
+        fft_analyzer and dct_analyzer that fix the transform lengths.
+
+    By default the transforms have the length of the wave, so the spectra show its own bins. With
+    fast_length the wave is zero-padded to the next fast FFT length, which is quicker for awkward
+    lengths but changes the bins and adds the leakage of the padding.
+
+    When the bank of sine components the wave was sampled from is given, the DFT and DCT are
+    evaluated from the component parameters with AnalyticFFTAnalyzer and AnalyticDCTAnalyzer instead
+    of transforming the wave. The padded transforms of fast_length have no analytic counterpart, so
+    the bank is not used with fast_length.
+
+    Attributes:
+        fast_length (bool): Whether the wave is zero-padded to a fast transform length.
+
+    Methods:
+        get_figures(time_axis): Return the data and labels of the transform figures.
+    """
+
+    def __init__(self, wave=None, sampling_frequency=None, fast_length=False, bank=None):
+        """
+        Initializes a TransformPipeline instance.
+
+        Parameters:
+            wave (numpy.ndarray, optional): The real sampled wave.
+            sampling_frequency (float, optional): The sampling frequency of the wave.
+            fast_length (bool): Whether to zero-pad the wave to the next fast transform length.
+            bank (SignalBank, optional): The sine components the wave was sampled from.
+        """
+        super().__init__()
+        self.fast_length = fast_length
+        self.add('fft_analyzer', lambda wave: FFTAnalyzer(wave, one_sided=True, fast_length=fast_length), 'wave')
+        self.add('fft', lambda analyzer, bank, sampling_frequency: self.calculate(
+            analyzer, bank, sampling_frequency, AnalyticFFTAnalyzer,
+            np.arange(analyzer.transform_length // 2 + 1)), 'fft_analyzer', 'bank', 'sampling_frequency')
+        self.add('ifft', lambda fft_data, analyzer: IFFTAnalyzer(
+            fft_data, one_sided=True, samples_number=len(analyzer.function),
+            transform_length=analyzer.transform_length).calculate(), 'fft', 'fft_analyzer')
+        self.add('fft_frequency_axis', lambda analyzer, sampling_frequency: FrequencyAxis(
+            analyzer.transform_length, sampling_frequency, one_sided=True).generate(),
+            'fft_analyzer', 'sampling_frequency')
+
+        self.add('dct_analyzer', lambda wave: DCTAnalyzer(wave, fast_length=fast_length), 'wave')
+        self.add('dct', lambda analyzer, bank, sampling_frequency: self.calculate(
+            analyzer, bank, sampling_frequency, AnalyticDCTAnalyzer), 'dct_analyzer', 'bank', 'sampling_frequency')
+        self.add('idct', lambda dct_data, analyzer: IDCTAnalyzer(
+            dct_data, samples_number=len(analyzer.function)).calculate(), 'dct', 'dct_analyzer')
+        self.add('dct_frequency_axis', lambda analyzer, sampling_frequency: FrequencyAxis(
+            analyzer.transform_length, sampling_frequency).generate(), 'dct_analyzer', 'sampling_frequency')
+
+        self.set('bank', bank)
+        if wave is not None:
+            self.set('wave', wave)
+        if sampling_frequency is not None:
+            self.set('sampling_frequency', sampling_frequency)
+
+    def calculate(self, analyzer, bank, sampling_frequency, analytic_type, bins=None):
+        """
+        Return the transform of an analyzer, evaluated from the sine components when they are known.
+
+        Parameters:
+            analyzer (TransformAnalyzer): The analyzer of the sampled wave.
+            bank (SignalBank or None): The sine components the wave was sampled from.
+            sampling_frequency (float): The sampling frequency of the wave.
+            analytic_type (type): The analytic analyzer computing the same transform from the bank.
+            bins (array-like, optional): The bins of the analytic transform. Defaults to all bins.
+
+        Returns:
+            numpy.ndarray: The transform.
+        """
+        if bank is None or self.fast_length:
+            return analyzer.calculate()
+        return analytic_type(bank, analyzer.transform_length, sampling_frequency, bins).calculate()
+
+    def get_figures(self, time_axis):
+        """
+        Return the data and labels of the transform figures, keyed by the figure name.
+
+        The data of a figure is returned by a function, so that only the transforms of the figures
+        actually drawn are computed.
+
+        Parameters:
+            time_axis (array-like): The time axis of the inverse transforms.
+
+        Returns:
+            dict: A (get_data, xlabel, title) tuple for every figure, where get_data returns the x
+                and y data of a stem plot.
+        """
+        return {
+            'DFT': (lambda: (self.get('fft_frequency_axis'), np.abs(self.get('fft'))), 'Częstotliwość', 'abs(FFT)'),
+            'DCT': (lambda: (self.get('dct_frequency_axis'), np.abs(self.get('dct'))), 'Częstotliwość', 'abs(DCT)'),
+            'IDFT': (lambda: (time_axis, np.real(self.get('ifft'))), 'Czas', 'IFFT'),
+            'IDCT': (lambda: (time_axis, np.real(self.get('idct'))), 'Czas', 'IDCT'),
+        }
@@ -0,0 +1,121 @@
+import threading
+from collections import OrderedDict
+import numpy as np
+
+
+class PlanCache:
+    """
+    Bounded least-recently-used cache of precomputed, length-dependent transform data.
+
+    Entries such as frequency axes, window tables and transform plans are keyed by a tuple that
+    includes their length and dtype. Returned arrays are made read-only, since cached ones are
+    shared by every caller requesting the same key. The cache can be used from several threads;
+    entries are computed outside the lock, so two threads missing the same key may both compute it.
+
+    Plans are meant to be small. The cache is bounded by the number of entries and by their total
+    size, and entries larger than max_entry_bytes, such as the frequency axis of a whole long
+    recording, are computed on every request instead of being kept.
+
+    Attributes:
+        max_entries (int): The maximum number of cached entries.
+        max_bytes (int): The maximum total size of the cached entries.
+        max_entry_bytes (int): The maximum size of a single cached entry.
+        entries (OrderedDict): The cached entries, least recently used first.
+        sizes (dict): The size of every cached entry in bytes.
+        bytes (int): The total size of the cached entries.
+        hits (int): The number of requests served from the cache.
+        misses (int): The number of requests that required computing the entry.
+        lock (threading.Lock): Guards the entries and the counters.
+
+    Methods:
+        get(key, factory): Return the cached entry of a key, computing it with factory on a miss.
+        get_size(value): Return the number of bytes held by the arrays of an entry.
+        clear(): Remove all entries.
+    """
+
+    def __init__(self, max_entries=64, max_bytes=2 ** 26, max_entry_bytes=2 ** 22):
+        """
+        Initializes a PlanCache instance.
+
+        Parameters:
+            max_entries (int): The maximum number of cached entries.
+            max_bytes (int): The maximum total size of the cached entries.
+            max_entry_bytes (int): The maximum size of a single cached entry.
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.max_entry_bytes = max_entry_bytes
+        self.entries = OrderedDict()
+        self.sizes = {}
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    def get(self, key, factory):
+        """
+        Return the cached entry of a key, computing it with factory on a miss.
+
+        Parameters:
+            key (hashable): The key of the entry.
+            factory (callable): Called without arguments to compute a missing entry.
+
+        Returns:
+            object: The cached entry.
+        """
+        with self.lock:
+            if key in self.entries:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return self.entries[key]
+            self.misses += 1
+
+        value = factory()
+        if isinstance(value, np.ndarray):
+            value.setflags(write=False)
+        size = self.get_size(value)
+        if size > min(self.max_entry_bytes, self.max_bytes):
+            return value
+
+        with self.lock:
+            if key in self.entries:
+                return self.entries[key]
+            self.entries[key] = value
+            self.sizes[key] = size
+            self.bytes += size
+            while len(self.entries) > self.max_entries or self.bytes > self.max_bytes:
+                evicted, _ = self.entries.popitem(last=False)
+                self.bytes -= self.sizes.pop(evicted)
+        return value
+
+    @staticmethod
+    def get_size(value):
+        """
+        Return the number of bytes held by the arrays of an entry.
+
+        Arrays are counted directly, and so are the arrays inside tuples and lists and the array
+        attributes of other objects, e.g. of a scipy.signal.ZoomFFT plan.
+
+        Parameters:
+            value (object): The entry.
+
+        Returns:
+            int: The size in bytes.
+        """
+        if isinstance(value, np.ndarray):
+            return value.nbytes
+        if isinstance(value, (tuple, list)):
+            return sum(PlanCache.get_size(item) for item in value)
+        return sum(item.nbytes for item in getattr(value, '__dict__', {}).values() if isinstance(item, np.ndarray))
+
+    def clear(self):
+        """
+        Remove all entries.
+        """
+        with self.lock:
+            self.entries.clear()
+            self.sizes.clear()
+            self.bytes = 0
+
+
+plan_cache = PlanCache()
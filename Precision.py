@@ -0,0 +1,80 @@
+import numpy as np
+
+
+class Precision:
+    """
+    Global floating-point precision of generated waves, axes, decoded audio and transforms.
+
+    Double precision (float64 / complex128) is the default. Single precision (float32 / complex64)
+    halves the memory and bandwidth of every array, which is enough for visualization and most
+    analysis. Its error is relative to the magnitude of the values; for generated sines it grows with
+    frequency × time, since the phase 2π·f·t is rounded to float32 as well.
+
+    Attributes:
+        real (numpy.dtype): The dtype of real arrays.
+        complex (numpy.dtype): The dtype of complex arrays.
+        chunk_size (int): The number of samples converted at a time by convert_samples.
+
+    Methods:
+        set(dtype): Set the global precision.
+        is_single(): Check whether single precision is in use.
+        convert_samples(data): Convert samples to the global precision, chunk by chunk.
+    """
+
+    real = np.dtype(np.float64)
+    complex = np.dtype(np.complex128)
+    chunk_size = 2 ** 16
+
+    @staticmethod
+    def set(dtype):
+        """
+        Set the global precision.
+
+        Parameters:
+            dtype (str or numpy.dtype): float32 or float64.
+
+        Raises:
+            ValueError: If the dtype is neither float32 nor float64.
+        """
+        dtype = np.dtype(dtype)
+        if dtype not in (np.float32, np.float64):
+            raise ValueError(f'Unsupported precision {dtype}; use float32 or float64')
+        Precision.real = dtype
+        Precision.complex = np.result_type(dtype, np.complex64)
+
+    @staticmethod
+    def is_single():
+        """
+        Check whether single precision is in use.
+
+        Returns:
+            bool: True for float32.
+        """
+        return Precision.real == np.float32
+
+    @staticmethod
+    def convert_samples(data):
+        """
+        Convert samples to the global precision, chunk by chunk.
+
+        Integer samples are written into the output a chunk at a time, so no intermediate float64 copy
+        of the whole recording is made. Complex samples are converted to the complex dtype. In double
+        precision the samples are returned unchanged, since the transforms upcast them internally.
+
+        Parameters:
+            data (numpy.ndarray): The samples, e.g. int16 data of a memory-mapped WAV file.
+
+        Returns:
+            numpy.ndarray: The samples in the global precision.
+        """
+        dtype = Precision.complex if np.iscomplexobj(data) else Precision.real
+        if not Precision.is_single() or data.dtype == dtype:
+            return data
+
+        converted = np.empty(data.shape, dtype=dtype)
+        if not data.ndim:
+            converted[()] = data
+            return converted
+        for first in range(0, len(data), Precision.chunk_size):
+            converted[first:first + Precision.chunk_size] = data[first:first + Precision.chunk_size]
+        return converted
@@ -0,0 +1,320 @@
+import json
+import os
+import numpy as np
+from FileHandler import FileHandler, DecodedAudioCache
+
+
+class WaveformPyramid:
+    """
+    Multi-resolution summary of audio data: the minimum, maximum and RMS of every block of samples.
+
+    Level 0 summarizes blocks of base_block_size samples and every following level blocks twice as
+    large, up to a single block covering the whole recording. A viewport is then drawn from the level
+    whose blocks are just smaller than one pixel column, so the work depends on the width of the
+    axes and not on the length of the recording.
+
+    All levels are stored in a single array shaped (blocks, 3, channels) holding minimum, maximum and
+    RMS, which can be saved and memory-mapped.
+
+    Attributes:
+        data (numpy.ndarray): The summaries of all levels, level 0 first.
+        offsets (list): The first block of every level in data, followed by the total number of blocks.
+        sampling_rate (float): The sampling rate of the summarized data.
+        samples_number (int): The number of samples per channel.
+        time_step (float): The time between consecutive samples on the time axis of the data.
+        base_block_size (int): The number of samples per block of level 0.
+        mono (bool): Whether the summarized data was one-dimensional.
+
+    Methods:
+        build(chunks, sampling_rate, base_block_size): Summarize data in a single streaming pass.
+        get_level(level): Return the summaries of one level.
+        get_level_index(samples_per_column): Return the coarsest level fitting the given column width.
+        decimate(limits, columns_number): Return min/max data of a viewport, like Graph.decimate.
+    """
+
+    MINIMUM, MAXIMUM, RMS = range(3)
+
+    def __init__(self, data, offsets, sampling_rate, samples_number, time_step, base_block_size, mono):
+        """
+        Initializes a WaveformPyramid instance from already computed summaries.
+
+        Parameters:
+            data (numpy.ndarray): The summaries of all levels, level 0 first.
+            offsets (list): The first block of every level in data, followed by the total number of blocks.
+            sampling_rate (float): The sampling rate of the summarized data.
+            samples_number (int): The number of samples per channel.
+            time_step (float): The time between consecutive samples on the time axis of the data.
+            base_block_size (int): The number of samples per block of level 0.
+            mono (bool): Whether the summarized data was one-dimensional.
+        """
+        self.data = data
+        self.offsets = list(offsets)
+        self.sampling_rate = sampling_rate
+        self.samples_number = samples_number
+        self.time_step = time_step
+        self.base_block_size = base_block_size
+        self.mono = mono
+
+    @classmethod
+    def build(cls, chunks, sampling_rate, base_block_size=256):
+        """
+        Summarize audio data in a single streaming pass.
+
+        Only level 0 is computed from the samples; the coarser levels are reduced from it. The time
+        axis is the one FileHandler.get_time_axis gives the data.
+
+        Parameters:
+            chunks (iterable): The data in consecutive chunks with time as the first axis, e.g. a ChunkReader.
+            sampling_rate (float): The sampling rate of the data.
+            base_block_size (int): The number of samples per block of level 0.
+
+        Returns:
+            WaveformPyramid: The pyramid.
+        """
+        minima, maxima, squares, counts = [], [], [], []
+        mono = True
+        remainder = None
+        samples_number = 0
+        for chunk in chunks:
+            chunk = np.asarray(chunk, dtype=np.float64)
+            samples_number += len(chunk)
+            mono = chunk.ndim == 1
+            if mono:
+                chunk = chunk[:, np.newaxis]
+            if remainder is not None and len(remainder):
+                chunk = np.concatenate((remainder, chunk))
+
+            full_length = len(chunk) // base_block_size * base_block_size
+            blocks = chunk[:full_length].reshape(-1, base_block_size, chunk.shape[1])
+            minima.append(blocks.min(axis=1))
+            maxima.append(blocks.max(axis=1))
+            squares.append(np.einsum('ijk,ijk->ik', blocks, blocks))
+            counts.append(np.full(len(blocks), base_block_size))
+            remainder = chunk[full_length:]
+
+        if remainder is None:
+            raise ValueError('Cannot build a pyramid of empty data')
+        if len(remainder):
+            minima.append(remainder.min(axis=0, keepdims=True))
+            maxima.append(remainder.max(axis=0, keepdims=True))
+            squares.append(np.sum(remainder ** 2, axis=0, keepdims=True))
+            counts.append(np.array([len(remainder)]))
+
+        minimum = np.concatenate(minima)
+        maximum = np.concatenate(maxima)
+        square = np.concatenate(squares)
+        count = np.concatenate(counts)
+
+        levels = []
+        while True:
+            rms = np.sqrt(square / count[:, np.newaxis])
+            levels.append(np.stack((minimum, maximum, rms), axis=1).astype(np.float32))
+            if len(minimum) == 1:
+                break
+            if len(minimum) % 2:
+                # An odd last block is paired with an empty one.
+                minimum = np.concatenate((minimum, minimum[-1:]))
+                maximum = np.concatenate((maximum, maximum[-1:]))
+                square = np.concatenate((square, np.zeros_like(square[-1:])))
+                count = np.concatenate((count, [0]))
+            minimum = np.minimum(minimum[0::2], minimum[1::2])
+            maximum = np.maximum(maximum[0::2], maximum[1::2])
+            square = square[0::2] + square[1::2]
+            count = count[0::2] + count[1::2]
+
+        offsets = np.concatenate(([0], np.cumsum([len(level) for level in levels]))).tolist()
+        time_step = FileHandler.get_time_axis(samples_number, sampling_rate).time_step
+        return cls(np.concatenate(levels), offsets, sampling_rate, samples_number, time_step, base_block_size, mono)
+
+    @property
+    def levels_number(self):
+        return len(self.offsets) - 1
+
+    def get_level(self, level):
+        """
+        Return the summaries of one level.
+
+        Parameters:
+            level (int): The level, 0 being the finest.
+
+        Returns:
+            numpy.ndarray: The summaries shaped (blocks, 3, channels).
+        """
+        return self.data[self.offsets[level]:self.offsets[level + 1]]
+
+    def get_level_index(self, samples_per_column):
+        """
+        Return the coarsest level whose blocks are not larger than the given column width.
+
+        Parameters:
+            samples_per_column (float): The number of samples per pixel column.
+
+        Returns:
+            int or None: The level, or None if even level 0 is too coarse and raw samples should be used.
+        """
+        if samples_per_column < self.base_block_size:
+            return None
+        level = int(np.log2(samples_per_column / self.base_block_size))
+        return min(level, self.levels_number - 1)
+
+    def decimate(self, limits, columns_number):
+        """
+        Return the minimum and maximum of every block of the viewport, interleaved like Graph.decimate.
+
+        Parameters:
+            limits (tuple): The lower and upper time limit of the viewport.
+            columns_number (int): The number of pixel columns.
+
+        Returns:
+            tuple or None: The time and amplitude data, or None if the viewport is narrow enough to
+                draw raw samples.
+        """
+        low, high = sorted(limits)
+        start = int(np.clip(np.floor(low / self.time_step), 0, self.samples_number)) if self.time_step else 0
+        stop = int(np.clip(np.ceil(high / self.time_step) + 1, 0, self.samples_number)) if self.time_step else 0
+        level = self.get_level_index((stop - start) / max(1, columns_number))
+        if level is None:
+            return None
+
+        block_size = self.base_block_size << level
+        first, last = start // block_size, -(-stop // block_size)
+        summaries = self.get_level(level)[first:last]
+        block_starts = np.arange(first, first + len(summaries)) * block_size * self.time_step
+
+        x = np.repeat(block_starts, 2)
+        y = summaries[:, [self.MINIMUM, self.MAXIMUM]].reshape(-1, summaries.shape[2])
+        return x, (y[:, 0] if self.mono else y)
+
+    def get_metadata(self):
+        """
+        Return the parameters of the pyramid as a JSON-serializable dict.
+
+        Returns:
+            dict: The metadata.
+        """
+        return {'offsets': self.offsets, 'sampling_rate': float(self.sampling_rate),
+                'samples_number': int(self.samples_number), 'time_step': float(self.time_step),
+                'base_block_size': self.base_block_size, 'mono': self.mono}
+
+
+class PyramidIndex:
+    """
+    On-disk store of WaveformPyramid instances of audio files, memory-mapped on load.
+
+    Pyramids are keyed like DecodedAudioCache entries, by the absolute path, size and modification
+    time of the source file and by the handler and its format options. A modified file therefore
+    gets a new pyramid, and the stale pyramid of the same path and format is removed, while a raw
+    file decoded with other options gets a pyramid of its own. Pyramids are reused across sessions.
+
+    Attributes:
+        directory (str): The directory holding the pyramids.
+        base_block_size (int): The number of samples per block of level 0 of new pyramids.
+        frame_size (int): The number of samples read at a time while building a pyramid.
+        hits (int): The number of pyramids loaded from disk.
+        misses (int): The number of pyramids that had to be built.
+    """
+
+    def __init__(self, directory, base_block_size=256, frame_size=2 ** 20):
+        """
+        Initializes a PyramidIndex instance, creating its directory if needed.
+
+        Parameters:
+            directory (str): The directory holding the pyramids. It must not be shared with a
+                DecodedAudioCache, whose entries use the same keys.
+            base_block_size (int): The number of samples per block of level 0 of new pyramids.
+            frame_size (int): The number of samples read at a time while building a pyramid.
+        """
+        self.directory = directory
+        self.base_block_size = base_block_size
+        self.frame_size = frame_size // base_block_size * base_block_size or base_block_size
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(directory, exist_ok=True)
+
+    def get_paths(self, key):
+        """
+        Return the paths of the data and metadata files of a pyramid.
+
+        Parameters:
+            key (str): The key of the source file.
+
+        Returns:
+            tuple: The .npy data path and the .json metadata path.
+        """
+        base = os.path.join(self.directory, key)
+        return base + '.npy', base + '.json'
+
+    def load(self, key):
+        """
+        Load a stored pyramid.
+
+        Parameters:
+            key (str): The key of the source file.
+
+        Returns:
+            WaveformPyramid or None: The memory-mapped pyramid, or None if it is missing.
+        """
+        data_path, metadata_path = self.get_paths(key)
+        try:
+            with open(metadata_path) as metadata_file:
+                metadata = json.load(metadata_file)
+            data = np.load(data_path, mmap_mode='r')
+            return WaveformPyramid(data, metadata['offsets'], metadata['sampling_rate'],
+                                   metadata['samples_number'], metadata['time_step'],
+                                   metadata['base_block_size'], metadata['mono'])
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def store(self, key, handler, pyramid):
+        """
+        Store a pyramid and remove the stale pyramids of the same file decoded the same way.
+
+        Parameters:
+            key (str): The key of the source file.
+            handler (FileHandler): The handler of the source file.
+            pyramid (WaveformPyramid): The pyramid.
+        """
+        source = {'path': os.path.abspath(handler.file), 'handler': type(handler).__name__,
+                  'format': handler.get_format()}
+        for name in os.listdir(self.directory):
+            if name.endswith('.json') and name != key + '.json':
+                try:
+                    with open(os.path.join(self.directory, name)) as metadata_file:
+                        metadata = json.load(metadata_file)
+                    stale = all(metadata.get(field) == value for field, value in source.items())
+                except (OSError, ValueError):
+                    stale = False
+                if stale:
+                    for stale_path in self.get_paths(name[:-len('.json')]):
+                        try:
+                            os.remove(stale_path)
+                        except OSError:
+                            pass
+
+        data_path, metadata_path = self.get_paths(key)
+        DecodedAudioCache.write_atomically(data_path, lambda data_file: np.save(data_file, pyramid.data))
+        DecodedAudioCache.write_atomically(metadata_path, lambda metadata_file: json.dump(
+            dict(pyramid.get_metadata(), **source), metadata_file), mode='w')
+
+    def get(self, file, **parameters):
+        """
+        Return the pyramid of a file, building and storing it if it is missing or stale.
+
+        Parameters:
+            file (str): The path to the audio file.
+            **parameters: Format options passed to the FileHandler registry.
+
+        Returns:
+            WaveformPyramid: The memory-mapped pyramid.
+        """
+        handler = FileHandler.for_file(file, **parameters)
+        key = DecodedAudioCache.get_key(handler)
+        pyramid = self.load(key)
+        if pyramid is not None:
+            self.hits += 1
+            return pyramid
+
+        self.misses += 1
+        reader = handler.iter_chunks(self.frame_size)
+        self.store(key, handler, WaveformPyramid.build(reader, reader.sampling_rate, self.base_block_size))
+        return self.load(key)
@@ -1,17 +1,19 @@
 import os
 
-import numpy as np
 from PyQt5.QtWidgets import QFileDialog
 from Figure import Figure
-from Graph import Plot, StemPlot
+from Graph import Graph, Plot, StemPlot
 from Signal import Sine
 from SignalsHandler import SignalsHandler
-from Axis import TimeAxis, DiscreteTimeAxis, FrequencyAxis
-from TransformAnalyzer import FFTAnalyzer, IFFTAnalyzer, DCTAnalyzer, IDCTAnalyzer
+from Axis import TimeAxis, DiscreteTimeAxis
+from Pipeline import TransformPipeline
 from Gui import Gui
 
 
 class Receiver:
+    # Graphs shown on the canvas and in the transform figures, updated in place on later refreshes.
+    graphs = {}
+
     @staticmethod
     def add_signal_to_list(signals_handler: SignalsHandler, controller):
         amplitude = controller.get_amplitude()
@@ -23,110 +25,94 @@ class Receiver:
 
     @staticmethod
     def update_plots(controller, signals_handler: SignalsHandler, canvas):
-        canvas.clear_canvas()
-
-        dft_figure = Figure.get_figure_by_name('DFT')
-        dct_figure = Figure.get_figure_by_name('DCT')
-        idft_figure = Figure.get_figure_by_name('IDFT')
-        idct_figure = Figure.get_figure_by_name('IDCT')
-
         samples_number = controller.get_samples_number()
         sampling_frequency = controller.get_sampling_frequency()
         time_step = controller.get_time_step()
 
-        time_axis = TimeAxis(samples_number, sampling_frequency, time_step).generate()
-        discrete_time_axis = DiscreteTimeAxis(samples_number, sampling_frequency).generate()
-        frequency_axis = FrequencyAxis(samples_number, sampling_frequency).generate()
-
-        wave, sampled_wave = signals_handler.generate_wave(time_axis, discrete_time_axis)
-
-        fft_data = FFTAnalyzer(sampled_wave).calculate()
-        ifft_data = IFFTAnalyzer(fft_data).calculate()
-        dct_data = DCTAnalyzer(sampled_wave).calculate()
-        idct_data = IDCTAnalyzer(dct_data).calculate()
+        time_axis_generator = TimeAxis(samples_number, sampling_frequency, time_step)
+        discrete_time_axis_generator = DiscreteTimeAxis(samples_number, sampling_frequency)
+        axes_key = (time_axis_generator.get_key(), discrete_time_axis_generator.get_key())
 
-        signal_plot = Plot(time_axis, wave, 'Czas', 'Amplituda', 'Sygnał oryginalny')
-        sampled_signal_plot = StemPlot(discrete_time_axis, sampled_wave, 'Czas', 'Amplituda', 'Sygnał oryginalny')
+        time_axis = time_axis_generator.generate()
+        discrete_time_axis = discrete_time_axis_generator.generate()
 
-        fft_plot = StemPlot(frequency_axis, np.abs(fft_data), 'Częstotliwość', 'Amplituda', 'abs(FFT)')
-        idft_plot = StemPlot(discrete_time_axis, np.real(ifft_data), 'Czas', 'Amplituda', 'IFFT')
+        wave, sampled_wave = signals_handler.generate_wave(time_axis, discrete_time_axis, axes_key)
 
-        dct_plot = StemPlot(frequency_axis, np.abs(dct_data), 'Częstotliwość', 'Amplituda', 'abs(DCT)')
-        idct_plot = StemPlot(discrete_time_axis, np.real(idct_data), 'Czas', 'Amplituda', 'IDCT')
-
-        signal_plot.create_on_canvas(canvas)
-        sampled_signal_plot.create_on_canvas(canvas)
+        graphs = [Receiver.graphs.get('signal'), Receiver.graphs.get('sampled_signal')]
+        if all(graph is not None and graph.can_update(canvas.ax, data)
+               for graph, data in zip(graphs, (wave, sampled_wave))):
+            rescale = graphs[0].update(time_axis, wave)
+            rescale = graphs[1].update(discrete_time_axis, sampled_wave) or rescale
+            Graph.redraw(canvas.ax, graphs, rescale)
+        else:
+            canvas.clear_canvas()
+            graphs = [Plot(time_axis, wave, 'Czas', 'Amplituda', 'Sygnał oryginalny', blit=True),
+                      StemPlot(discrete_time_axis, sampled_wave, 'Czas', 'Amplituda', 'Sygnał oryginalny', blit=True)]
+            for graph in graphs:
+                graph.create_on_canvas(canvas)
+        Receiver.graphs['signal'], Receiver.graphs['sampled_signal'] = graphs
 
-        if dft_figure:
-            dft_figure.clf()
-            fft_plot.create(dft_figure)
-        if dct_figure:
-            dct_figure.clf()
-            dct_plot.create(dct_figure)
-        if idft_figure:
-            idft_figure.clf()
-            idft_plot.create(idft_figure)
-        if idct_figure:
-            idct_figure.clf()
-            idct_plot.create(idct_figure)
+        pipeline = TransformPipeline(sampled_wave, sampling_frequency, bank=signals_handler.bank)
+        Receiver.update_transform_figures(pipeline, discrete_time_axis)
 
     @staticmethod
     def update_plots_from_file(controller, signals_handler: SignalsHandler, canvas):
-        canvas.clear_canvas()
-
-        dft_figure = Figure.get_figure_by_name('DFT')
-        dct_figure = Figure.get_figure_by_name('DCT')
-        idft_figure = Figure.get_figure_by_name('IDFT')
-        idct_figure = Figure.get_figure_by_name('IDCT')
-
         filename = controller.get_filename()
 
-        wave, time_axis, sampling_frequency = signals_handler.generate_wave_from_file(filename)
-        samples_number = len(wave)
+        wave, time_axis, sampling_frequency = signals_handler.generate_wave_from_file(
+            filename, mmap=True, cache=signals_handler.audio_cache)
 
-        frequency_axis = FrequencyAxis(samples_number, sampling_frequency).generate()
+        pyramid = signals_handler.get_pyramid(filename)
 
-        fft_data = FFTAnalyzer(wave).calculate()
-        ifft_data = IFFTAnalyzer(fft_data).calculate()
-
-        dct_data = DCTAnalyzer(wave).calculate()
-        idct_data = IDCTAnalyzer(dct_data).calculate()
-
-        signal_plot = Plot(time_axis, wave, 'Czas', 'Amplituda', 'Sygnał oryginalny')
-
-        fft_plot = StemPlot(frequency_axis, np.abs(fft_data), 'Częstotliwość', 'Amplituda', 'abs(FFT)')
-        idft_plot = StemPlot(time_axis, np.real(ifft_data), 'Czas', 'Amplituda', 'IFFT')
-
-        dct_plot = StemPlot(frequency_axis, np.abs(dct_data), 'Częstotliwość', 'Amplituda', 'abs(DCT)')
-        idct_plot = StemPlot(time_axis, np.real(idct_data), 'Czas', 'Amplituda', 'abs(IDCT)')
+        signal_plot = Receiver.graphs.get('signal')
+        if ('sampled_signal' not in Receiver.graphs and signal_plot is not None
+                and signal_plot.can_update(canvas.ax, wave)):
+            Graph.redraw(canvas.ax, [signal_plot], signal_plot.update(time_axis, wave, pyramid))
+        else:
+            canvas.clear_canvas()
+            signal_plot = Plot(time_axis, wave, 'Czas', 'Amplituda', 'Sygnał oryginalny', pyramid=pyramid, blit=True)
+            signal_plot.create_on_canvas(canvas)
+            Receiver.graphs.pop('sampled_signal', None)
+        Receiver.graphs['signal'] = signal_plot
 
-        signal_plot.create_on_canvas(canvas)
+        Receiver.update_transform_figures(TransformPipeline(wave, sampling_frequency), time_axis)
 
-        if dft_figure:
-            dft_figure.clf()
-            fft_plot.create(dft_figure)
-        if dct_figure:
-            dct_figure.clf()
-            dct_plot.create(dct_figure)
-        if idft_figure:
-            idft_figure.clf()
-            idft_plot.create(idft_figure)
-        if idct_figure:
-            idct_figure.clf()
-            idct_plot.create(idct_figure)
+    @staticmethod
+    def update_transform_figures(pipeline: TransformPipeline, time_axis):
+        """
+        Redraw the open transform figures.
+
+        Only the pipeline nodes needed by open figures are evaluated, so with no transform window
+        open no transform is computed at all. A figure still showing the graph of the previous
+        refresh gets the graph updated in place instead of being cleared.
+
+        Parameters:
+            pipeline (TransformPipeline): The transforms of the displayed wave.
+            time_axis (array-like): The time axis of the inverse transforms.
+        """
+        for name, (get_data, xlabel, title) in pipeline.get_figures(time_axis).items():
+            figure = Figure.get_figure_by_name(name)
+            if not figure:
+                Receiver.graphs.pop(name, None)
+                continue
+
+            x, y = get_data()
+            graph = Receiver.graphs.get(name)
+            if graph is not None and figure.axes and graph.can_update(figure.axes[0], y):
+                Graph.redraw(graph.ax, [graph], graph.update(x, y))
+            else:
+                figure.clf()
+                graph = StemPlot(x, y, xlabel, 'Amplituda', title, blit=True)
+                graph.create(figure)
+            Receiver.graphs[name] = graph
 
     @staticmethod
     def delete_signal(signals_handler: SignalsHandler, controller):
         index = controller.get_signal_number() - 1
         signal_amount = signals_handler.signal_amount
 
-        list_of_signals = signals_handler.signals
-        list_of_signals_labels = signals_handler.signals_labels
-
-        if list_of_signals and list_of_signals_labels and 0 <= index < signal_amount:
-            list_of_signals.pop(index)
-            list_of_signals_labels.pop(index)
-            signals_handler.signal_amount -= 1
+        if 0 <= index < signal_amount:
+            signals_handler.remove_signal(index)
 
     @staticmethod
     def update_signal(signals_handler: SignalsHandler, controller):
@@ -136,9 +122,7 @@ class Receiver:
         else:
             Gui.print_error('Numer składowej nie może być równy 0')
             return
-        if index < signals_handler.signal_amount:
-            signal = signals_handler.signals[index]
-        else:
+        if index >= signals_handler.signal_amount:
             Gui.print_error('Numer składowej nie może być większy niż ich ilość.')
             return
 
@@ -147,11 +131,7 @@ class Receiver:
         phase = controller.get_phase()
 
         if amplitude and frequency and phase:
-            signal.amplitude = amplitude
-            signal.frequency = frequency
-            signal.phase = phase
-
-        signals_handler.signals_labels[index] = signal.signal_to_text()
+            signals_handler.update_signal(index, amplitude, frequency, phase)
 
     @staticmethod
     def choose_file(gui):
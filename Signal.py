@@ -1,5 +1,32 @@
 import numpy as np
 from abc import ABC, abstractmethod
+from Oscillator import SineOscillator
+
+
+class BankField:
+    """
+    Descriptor for a signal parameter that can live in a SignalBank column.
+
+    While the signal is detached the value is kept on the instance. Once the signal is attached
+    to a bank, reads and writes go straight to the bank column at the signal's index.
+    """
+
+    def __set_name__(self, owner, name):
+        self.name = name
+        self.local_name = '_' + name
+
+    def __get__(self, signal, owner):
+        if signal is None:
+            return self
+        if signal.bank is None:
+            return getattr(signal, self.local_name)
+        return signal.bank.get(signal.index, self.name)
+
+    def __set__(self, signal, value):
+        if signal.bank is None:
+            setattr(signal, self.local_name, value)
+        else:
+            signal.bank.set(signal.index, self.name, value)
 
 
 class Signal(ABC):
@@ -8,8 +35,14 @@ class Signal(ABC):
 
     Attributes:
     - amplitude (float): The amplitude of the signal.
+    - bank (SignalBank or None): The bank storing the signal parameters, if attached.
+    - index (int or None): The position of the signal in the bank, if attached.
+    - oscillator (Oscillator): Class-wide synthesis backend used by get_wave when none is given.
     """
 
+    amplitude = BankField()
+    oscillator = SineOscillator()
+
     def __init__(self, amplitude):
         """
         Initializes a Signal object.
@@ -17,8 +50,41 @@ class Signal(ABC):
         Parameters:
         - amplitude (float): The amplitude of the signal.
         """
+        self.bank = None
+        self.index = None
         self.amplitude = amplitude
 
+    def get_parameters(self):
+        """
+        Returns the values of all bank-backed parameters of the signal.
+
+        Returns:
+        - dict: Parameter values keyed by parameter name.
+        """
+        return {name: getattr(self, name) for name in dir(type(self))
+                if isinstance(getattr(type(self), name, None), BankField)}
+
+    def attach(self, bank):
+        """
+        Moves the signal parameters into a bank, turning the signal into a view onto it.
+
+        Parameters:
+        - bank (SignalBank): The bank to store the parameters in.
+        """
+        parameters = self.get_parameters()
+        self.index = bank.append(**parameters)
+        self.bank = bank
+
+    def detach(self):
+        """
+        Copies the signal parameters out of its bank so that the signal stands on its own again.
+        """
+        parameters = self.get_parameters()
+        self.bank = None
+        self.index = None
+        for name, value in parameters.items():
+            setattr(self, name, value)
+
     @abstractmethod
     def signal_to_text(self):
         """
@@ -29,13 +95,24 @@ class Signal(ABC):
         """
         pass
 
+    @classmethod
+    def set_oscillator(cls, oscillator):
+        """
+        Selects the synthesis backend used by get_wave.
+
+        Parameters:
+        - oscillator (Oscillator): The backend, e.g. SineOscillator or PhasorOscillator.
+        """
+        cls.oscillator = oscillator
+
     @abstractmethod
-    def get_wave(self, x_axis):
+    def get_wave(self, x_axis, oscillator=None):
         """
         Abstract method to generate the waveform of the signal.
 
         Parameters:
         - x_axis (numpy.ndarray): The time values for which the waveform should be generated.
+        - oscillator (Oscillator, optional): The synthesis backend. Defaults to Signal.oscillator.
 
         Returns:
         - numpy.ndarray: The waveform of the signal.
@@ -52,6 +129,9 @@ class Sine(Signal):
     - phase (float): The phase of the sine wave in degrees.
     """
 
+    frequency = BankField()
+    phase = BankField()
+
     def __init__(self, amplitude, frequency, phase):
         """
         Initializes a Sine object.
@@ -77,15 +157,172 @@ class Sine(Signal):
         phase_text = str(self.phase)
         return f"{amplitude_text} sin(2π*{frequency_text}*t+{phase_text})\n"
 
-    def get_wave(self, time):
+    def get_wave(self, time, oscillator=None):
         """
         Generates the waveform of the sine wave.
 
         Parameters:
         - time (numpy.ndarray): The time values for which the waveform should be generated.
+        - oscillator (Oscillator, optional): The synthesis backend. Defaults to Signal.oscillator.
 
         Returns:
         - numpy.ndarray: The waveform of the sine wave.
         """
         if self.amplitude and self.frequency and self.phase:
-            return self.amplitude * np.sin(2 * np.pi * self.frequency * time + np.deg2rad(self.phase))
+            oscillator = oscillator or self.oscillator
+            return oscillator.generate(time, [self.amplitude], [self.frequency], [self.phase])
+
+
+class SignalBank:
+    """
+    Column-based store of sine components.
+
+    Amplitudes, frequencies and phases (in degrees) are kept in contiguous NumPy arrays so that
+    the composite wave can be computed with a single broadcast instead of a Python loop.
+
+    Attributes:
+    - size (int): The number of stored components.
+    - listener (callable or None): Called as listener(old, new) with the parameter dicts of a component
+      whenever stored parameters are changed in place.
+    """
+
+    columns = ('amplitude', 'frequency', 'phase')
+
+    def __init__(self, capacity=16):
+        """
+        Initializes an empty SignalBank.
+
+        Parameters:
+        - capacity (int): The initial number of components the columns can hold.
+        """
+        self.size = 0
+        self.listener = None
+        self.data = {column: np.zeros(capacity) for column in self.columns}
+
+    @property
+    def amplitudes(self):
+        return self.data['amplitude'][:self.size]
+
+    @property
+    def frequencies(self):
+        return self.data['frequency'][:self.size]
+
+    @property
+    def phases(self):
+        return self.data['phase'][:self.size]
+
+    def get(self, index, column):
+        """
+        Returns a single stored parameter.
+
+        Parameters:
+        - index (int): The index of the component.
+        - column (str): The name of the parameter.
+
+        Returns:
+        - float: The parameter value.
+        """
+        return float(self.data[column][:self.size][index])
+
+    def get_component(self, index):
+        """
+        Returns all stored parameters of a component.
+
+        Parameters:
+        - index (int): The index of the component.
+
+        Returns:
+        - dict: Parameter values keyed by parameter name.
+        """
+        return {column: self.get(index, column) for column in self.columns}
+
+    def set(self, index, column, value):
+        """
+        Sets a single stored parameter.
+
+        Parameters:
+        - index (int): The index of the component.
+        - column (str): The name of the parameter.
+        - value (float): The new parameter value.
+        """
+        self.update(index, **{column: value})
+
+    def update(self, index, **parameters):
+        """
+        Sets several stored parameters of a component at once and notifies the listener.
+
+        Parameters:
+        - index (int): The index of the component.
+        - **parameters: New parameter values keyed by parameter name.
+        """
+        old = self.get_component(index)
+        for column, value in parameters.items():
+            self.data[column][:self.size][index] = value
+        if self.listener is not None:
+            self.listener(old, self.get_component(index))
+
+    def append(self, amplitude, frequency, phase):
+        """
+        Appends a component to the bank, growing the columns if needed.
+
+        Parameters:
+        - amplitude (float): The amplitude of the component.
+        - frequency (float): The frequency of the component.
+        - phase (float): The phase of the component in degrees.
+
+        Returns:
+        - int: The index of the new component.
+        """
+        if self.size == len(self.data['amplitude']):
+            for column, values in self.data.items():
+                grown = np.zeros(max(1, 2 * len(values)))
+                grown[:self.size] = values[:self.size]
+                self.data[column] = grown
+
+        index = self.size
+        self.size += 1
+        self.data['amplitude'][index] = amplitude
+        self.data['frequency'][index] = frequency
+        self.data['phase'][index] = phase
+        return index
+
+    def remove(self, index):
+        """
+        Removes a component from the bank, shifting the following components down by one.
+
+        Parameters:
+        - index (int): The index of the component.
+        """
+        for values in self.data.values():
+            values[index:self.size - 1] = values[index + 1:self.size]
+        self.size -= 1
+
+    def get_wave(self, time, oscillator=None):
+        """
+        Generates the composite waveform of all stored components, in the global precision.
+
+        Parameters:
+        - time (numpy.ndarray): The time values for which the waveform should be generated.
+        - oscillator (Oscillator, optional): The synthesis backend. Defaults to Signal.oscillator.
+
+        Returns:
+        - numpy.ndarray: The composite waveform.
+        """
+        oscillator = oscillator or Signal.oscillator
+        return oscillator.generate(time, self.amplitudes, self.frequencies, self.phases)
+
+    @staticmethod
+    def get_component_wave(time, amplitude, frequency, phase):
+        """
+        Generates the waveform of a single component described by its parameters.
+
+        Parameters:
+        - time (numpy.ndarray): The time values for which the waveform should be generated.
+        - amplitude (float): The amplitude of the component.
+        - frequency (float): The frequency of the component.
+        - phase (float): The phase of the component in degrees.
+
+        Returns:
+        - numpy.ndarray: The waveform of the component.
+        """
+        return Signal.oscillator.generate(time, [amplitude], [frequency], [phase])
@@ -1,5 +1,5 @@
-import numpy as np
-from FileHandler import WavFileHandler
+from FileHandler import FileHandler, CachedFileHandler
+from Signal import Signal, SignalBank
 
 
 class SignalsHandler:
@@ -10,67 +10,222 @@ class SignalsHandler:
         signals (list): List to store Signal instances.
         signals_labels (list): List to store labels of Signal instances.
         signal_amount (int): The total number of signals.
+        bank (SignalBank): Column store holding the parameters of the stored signals.
+        audio_cache (DecodedAudioCache or None): Cache of decoded audio files.
+        pyramid_index (PyramidIndex or None): Store of min/max pyramids of audio files.
+        full_recompute_interval (int): Number of incremental cache updates after which the cached
+            waves are recomputed from scratch to limit floating-point drift.
 
     Methods:
         append_signal(signal): Append a Signal instance to the list of signals.
-        generate_wave(time_axis, discrete_time_axis): Generate the composite wave from the stored signals.
-        generate_wave_from_file(file): Generate wave data from a WAV file using WavFileHandler.
+        remove_signal(index): Remove the Signal instance at the given index.
+        update_signal(index, amplitude, frequency, phase): Change the parameters of a stored signal.
+        generate_wave(time_axis, discrete_time_axis, axes_key): Generate the composite wave from the stored signals.
+        clear_cache(): Drop the cached composite waves.
+        generate_wave_from_file(file, mmap, cache, **parameters): Generate wave data from an audio file.
+        stream_wave_from_file(file, frame_size, overlap, **parameters): Stream wave data from an audio file in frames.
+        get_pyramid(file, **parameters): Return the min/max pyramid of an audio file.
     """
 
-    def __init__(self):
+    def __init__(self, full_recompute_interval=100, audio_cache=None, pyramid_index=None):
         """
         Initializes a SignalsHandler instance.
+
+        Parameters:
+            full_recompute_interval (int): Number of incremental cache updates after which the cached
+                waves are recomputed from scratch.
+            audio_cache (DecodedAudioCache, optional): Cache of decoded audio files.
+            pyramid_index (PyramidIndex, optional): Store of min/max pyramids of audio files.
         """
         self.signals = []
         self.signals_labels = []
         self.signal_amount = 0
+        self.bank = SignalBank()
+        self.bank.listener = self.on_component_changed
+        self.full_recompute_interval = full_recompute_interval
+        self.audio_cache = audio_cache
+        self.pyramid_index = pyramid_index
+
+        self.cache_key = None
+        self.cached_axes = None
+        self.cached_waves = None
+        self.incremental_updates = 0
 
     def append_signal(self, signal):
         """
         Append a signal to the list of signals.
 
+        The signal parameters are moved into the bank and the signal becomes a view onto it.
+
         Parameters:
             signal : The instance to be appended.
         """
+        signal.attach(self.bank)
         self.signals.append(signal)
         self.signals_labels.append(signal.signal_to_text())
         self.signal_amount += 1
+        self.update_cache(None, signal.get_parameters())
+
+    def remove_signal(self, index):
+        """
+        Remove the signal at the given index.
+
+        Parameters:
+            index (int): The index of the signal to remove.
+        """
+        signal = self.signals.pop(index)
+        self.signals_labels.pop(index)
+        signal.detach()
+        self.bank.remove(index)
+        for following_signal in self.signals[index:]:
+            following_signal.index -= 1
+        self.signal_amount -= 1
+        self.update_cache(signal.get_parameters(), None)
+
+    def update_signal(self, index, amplitude, frequency, phase):
+        """
+        Change the parameters of the signal at the given index and refresh its label.
+
+        Parameters:
+            index (int): The index of the signal to update.
+            amplitude (float): The new amplitude.
+            frequency (float): The new frequency.
+            phase (float): The new phase in degrees.
+        """
+        self.bank.update(index, amplitude=amplitude, frequency=frequency, phase=phase)
+        self.signals_labels[index] = self.signals[index].signal_to_text()
+
+    def on_component_changed(self, old, new):
+        """
+        Bank listener keeping the cached waves in sync with in-place parameter changes.
 
-    def generate_wave(self, time_axis, discrete_time_axis):
+        Parameters:
+            old (dict): The component parameters before the change.
+            new (dict): The component parameters after the change.
+        """
+        self.update_cache(old, new)
+
+    def update_cache(self, old, new):
+        """
+        Replace the contribution of one component in the cached waves.
+
+        Parameters:
+            old (dict or None): Parameters of the component to subtract, or None for an added component.
+            new (dict or None): Parameters of the component to add, or None for a removed component.
+        """
+        if self.cached_waves is None:
+            return
+
+        self.incremental_updates += 1
+        if not self.signal_amount or self.incremental_updates >= self.full_recompute_interval:
+            self.cached_waves = tuple(self.bank.get_wave(axis) for axis in self.cached_axes)
+            self.incremental_updates = 0
+            return
+
+        waves = []
+        for axis, wave in zip(self.cached_axes, self.cached_waves):
+            # New arrays are built instead of updating in place, so waves already handed out stay valid.
+            if old is not None:
+                wave = wave - SignalBank.get_component_wave(axis, **old)
+            if new is not None:
+                wave = wave + SignalBank.get_component_wave(axis, **new)
+            waves.append(wave)
+        self.cached_waves = tuple(waves)
+
+    def clear_cache(self):
+        """
+        Drop the cached composite waves.
+        """
+        self.cache_key = None
+        self.cached_axes = None
+        self.cached_waves = None
+        self.incremental_updates = 0
+
+    def generate_wave(self, time_axis, discrete_time_axis, axes_key=None):
         """
         Generate the composite wave from the stored signals.
 
+        When axes_key is given, the result is cached for that time-axis configuration and the
+        oscillator of Signal, and later calls with the same key and oscillator return it directly.
+        Adding, updating and removing signals then only replaces the contribution of the changed
+        component. A different key, or a new oscillator set with Signal.set_oscillator, drops the cache.
+
         Parameters:
             time_axis (numpy.ndarray): Time axis values for the continuous wave.
             discrete_time_axis (numpy.ndarray): Time axis values for the sampled wave.
+            axes_key (hashable, optional): Description of the axes parameters, e.g. built from Axis.get_key().
 
         Returns:
             tuple: A tuple containing the continuous wave and sampled wave.
         """
-        wave = np.zeros(len(time_axis))  # initialize wave vector with zeros
-        sampled_wave = np.zeros(len(discrete_time_axis))  # initialize sampled_wave vector with zeros
-
-        for signal in self.signals:
-            wave += signal.get_wave(time_axis)
-            sampled_wave += signal.get_wave(discrete_time_axis)
-
+        if axes_key is not None:
+            axes_key = (axes_key, Signal.oscillator)
+            if axes_key == self.cache_key:
+                return self.cached_waves
+
+        wave = self.bank.get_wave(time_axis)
+        sampled_wave = self.bank.get_wave(discrete_time_axis)
+
+        if axes_key is None:
+            self.clear_cache()
+        else:
+            self.cache_key = axes_key
+            self.cached_axes = (time_axis, discrete_time_axis)
+            self.cached_waves = (wave, sampled_wave)
+            self.incremental_updates = 0
         return wave, sampled_wave
 
     @staticmethod
-    def generate_wave_from_file(file):
+    def generate_wave_from_file(file, mmap=False, cache=None, **parameters):
         """
-        Generate wave data from a WAV file using WavFileHandler.
+        Generate wave data from an audio file using the FileHandler registry, in the global precision.
 
         Parameters:
-            file (str): The path to the WAV file.
+            file (str): The path to the audio file.
+            mmap (bool): Whether to memory-map WAV data instead of reading it into memory.
+            cache (DecodedAudioCache, optional): Cache of decoded audio to load the data from.
+            **parameters: Format options, e.g. sampling_rate, dtype and channels for raw PCM files.
 
         Returns:
             tuple: A tuple containing audio data, time axis, and sampling frequency.
         """
-        file_handler = WavFileHandler(file)
-        data, time_axis, sampling_frequency = file_handler.generate_data()
+        file_handler = FileHandler.for_file(file, mmap=mmap, **parameters)
+        if cache is not None:
+            file_handler = CachedFileHandler(file_handler, cache)
+        data, time_axis, sampling_frequency = file_handler.generate_samples()
         return data, time_axis, sampling_frequency
 
+    @staticmethod
+    def stream_wave_from_file(file, frame_size, overlap=0, **parameters):
+        """
+        Stream wave data from an audio file in fixed-size frames using the FileHandler registry.
+
+        Parameters:
+            file (str): The path to the audio file.
+            frame_size (int): The number of samples per frame.
+            overlap (int): The number of samples shared by consecutive frames.
+            **parameters: Format options, e.g. sampling_rate, dtype and channels for raw PCM files.
+
+        Returns:
+            ChunkReader: An iterable over the frames, also exposing the sampling rate.
+        """
+        return FileHandler.for_file(file, **parameters).iter_chunks(frame_size, overlap)
+
+    def get_pyramid(self, file, **parameters):
+        """
+        Return the min/max pyramid of an audio file, building it on first use.
+
+        Parameters:
+            file (str): The path to the audio file.
+            **parameters: Format options, e.g. sampling_rate, dtype and channels for raw PCM files.
+
+        Returns:
+            WaveformPyramid or None: The pyramid, or None without a pyramid index.
+        """
+        if self.pyramid_index is None:
+            return None
+        return self.pyramid_index.get(file, **parameters)
+
     def get_text(self):
         text = ''
         for label in self.signals_labels:
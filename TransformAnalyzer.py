@@ -1,25 +1,187 @@
-from scipy.fft import fft, ifft, dct, idct
+import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from scipy.fft import fft, ifft, rfft, irfft, dct, idct, next_fast_len
+from scipy.signal import get_window, ZoomFFT
+import numpy as np
 from abc import ABC, abstractmethod
+from Axis import DiscreteTimeAxis, FrequencyAxis, BandFrequencyAxis
+from PlanCache import plan_cache
+from Precision import Precision
+from TransformCache import memoized
 
 
 class TransformAnalyzer(ABC):
     """
     Abstract base class for analyzing transforms.
 
+    Multi-channel input is transformed as one batch along axis; by default axis 0, which is the
+    time axis of (samples, channels) arrays returned by the FileHandler classes.
+
+    The scipy.fft based analyzers run their transforms on TransformAnalyzer.workers threads, or on
+    the number given to calculate. None keeps the scipy.fft default, which can itself be changed
+    with the scipy.fft.set_workers context manager; -1 uses all cores.
+
+    When TransformAnalyzer.cache holds a TransformCache, the memoized analyzers return the stored
+    result for byte-identical input and parameters instead of recomputing it. Such results are
+    shared and therefore read-only; callers changing a result in place must copy it first.
+    Memory-mapped input is not memoized, since hashing it would read the whole file.
+
+    Array input is converted to the global precision set with Precision.set, so in single precision
+    the transforms run in float32 / complex64. Streaming analyzers, whose memory must not depend on
+    the input length, set convert_input to False and convert every block instead.
+
     Attributes:
         function (array-like): The input data for the transformation.
+        axis (int): The axis along which the transformation is performed.
+        workers (int or None): Class-wide number of threads used by the transforms.
+        cache (TransformCache or None): Class-wide cache of transform results.
+        convert_input (bool): Whether array input is converted to the global precision up front.
 
     Methods:
         calculate(): Abstract method to perform the transformation and return the result.
+        calculate_stream(chunks, *args, workers, **kwargs): Transform every chunk of an iterable in turn.
+        set_workers(workers): Set the class-wide number of threads used by the transforms.
+        set_cache(cache): Set the class-wide cache of transform results.
+        get_workers(workers): Resolve the number of threads of a single call.
+        get_transform_length(fast_length, real): Return the transform length, optionally padded.
+        trim(result, samples_number): Cut a result down to samples_number along the transform axis.
+        get_window(window, length): Return a cached window table.
     """
-    def __init__(self, function):
+
+    workers = None
+    cache = None
+    convert_input = True
+
+    def __init__(self, function, axis=0):
         """
         Initializes a TransformAnalyzer instance with the specified input data.
 
         Parameters:
             function (array-like): The input data for the transformation.
+            axis (int): The axis along which the transformation is performed.
         """
+        if self.convert_input and isinstance(function, np.ndarray):
+            function = Precision.convert_samples(function)
         self.function = function
+        self.axis = axis
+
+    @staticmethod
+    def set_workers(workers):
+        """
+        Set the class-wide number of threads used by the transforms.
+
+        Parameters:
+            workers (int or None): The number of threads; -1 for all cores, None for the scipy.fft default.
+        """
+        TransformAnalyzer.workers = workers
+
+    @staticmethod
+    def set_cache(cache):
+        """
+        Set the class-wide cache of transform results.
+
+        Parameters:
+            cache (TransformCache or None): The cache; None disables memoization.
+        """
+        TransformAnalyzer.cache = cache
+
+    @staticmethod
+    def get_workers(workers=None):
+        """
+        Resolve the number of threads of a single call.
+
+        Parameters:
+            workers (int or None): The number of threads requested for the call.
+
+        Returns:
+            int or None: The requested number, or the class-wide setting if none was requested.
+        """
+        return TransformAnalyzer.workers if workers is None else workers
+
+    def get_transform_length(self, fast_length=False, real=False):
+        """
+        Return the transform length, optionally padded to the next fast length.
+
+        Lengths with large prime factors are much slower to transform than nearby lengths whose
+        factors are all small, so zero padding to such a length usually pays off.
+
+        Parameters:
+            fast_length (bool): Whether to pad to the next fast length.
+            real (bool): Whether the transform is a real-input one.
+
+        Returns:
+            int: The transform length.
+        """
+        samples_number = np.shape(self.function)[self.axis]
+        return next_fast_len(samples_number, real) if fast_length and samples_number else samples_number
+
+    def trim(self, result, samples_number):
+        """
+        Cut a result down to samples_number along the transform axis, without copying.
+
+        Parameters:
+            result (numpy.ndarray): The result of a transform.
+            samples_number (int or None): The length to keep; None keeps the whole result.
+
+        Returns:
+            numpy.ndarray: The trimmed result.
+        """
+        if samples_number is None:
+            return result
+        index = [slice(None)] * result.ndim
+        index[self.axis] = slice(0, samples_number)
+        return result[tuple(index)]
+
+    @staticmethod
+    def get_window(window, length, dtype=None):
+        """
+        Return a cached window table for periodic (spectral) analysis.
+
+        Parameters:
+            window (str or tuple): The window specification accepted by scipy.signal.get_window.
+            length (int): The number of samples of the window.
+            dtype (numpy.dtype, optional): The dtype of the table. Defaults to the global precision.
+
+        Returns:
+            numpy.ndarray: The read-only window table.
+        """
+        dtype = Precision.real if dtype is None else dtype
+        return plan_cache.get(('window', window, length, np.dtype(dtype).str),
+                              lambda: get_window(window, length).astype(dtype))
+
+    @classmethod
+    def calculate_stream(cls, chunks, *args, workers=None, **kwargs):
+        """
+        Transform every chunk of an iterable in turn, e.g. the frames of a ChunkReader.
+
+        With more than one worker the chunks are transformed concurrently on a thread pool. Results
+        are still yielded in order, and only a bounded number of chunks is held at a time.
+
+        Parameters:
+            chunks (iterable): The input chunks.
+            *args, **kwargs: Further arguments passed to the analyzer constructor.
+            workers (int, optional): The number of threads; defaults to the class-wide setting.
+
+        Yields:
+            numpy.ndarray: The result of the transformation of each chunk.
+        """
+        workers = cls.get_workers(workers)
+        if workers is not None and workers < 0:
+            workers = os.cpu_count()
+        if not workers or workers == 1:
+            for chunk in chunks:
+                yield cls(chunk, *args, **kwargs).calculate()
+            return
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            pending = deque()
+            for chunk in chunks:
+                pending.append(executor.submit(lambda chunk: cls(chunk, *args, **kwargs).calculate(), chunk))
+                if len(pending) >= 2 * workers:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
 
     @abstractmethod
     def calculate(self):
@@ -35,27 +197,43 @@ class FFTAnalyzer(TransformAnalyzer):
 
     Attributes:
         function (array-like): The input data for the FFT.
+        axis (int): The axis along which the FFT is performed.
+        one_sided (bool): Whether only the non-negative frequency bins of a real input are computed.
+        transform_length (int): The length of the transform, including zero padding.
 
     Methods:
         calculate(): Perform FFT on the input data and return the result.
     """
-    def __init__(self, function):
+    def __init__(self, function, axis=0, one_sided=False, fast_length=False):
         """
         Initializes an FFTAnalyzer instance with the specified input data.
 
         Parameters:
             function (array-like): The input data for the FFT.
+            axis (int): The axis along which the FFT is performed.
+            one_sided (bool): Whether to use the real-input FFT, which returns only the
+                transform_length // 2 + 1 non-negative frequency bins. The input must be real.
+            fast_length (bool): Whether to zero-pad the input to the next length that has only
+                small prime factors. Build the frequency axis from transform_length in that case.
         """
-        super().__init__(function)
+        super().__init__(function, axis)
+        self.one_sided = one_sided
+        self.transform_length = self.get_transform_length(fast_length, real=one_sided)
 
-    def calculate(self):
+    @memoized
+    def calculate(self, workers=None):
         """
         Perform FFT on the input data and return the result.
 
+        Parameters:
+            workers (int, optional): The number of threads; defaults to the class-wide setting.
+
         Returns:
             numpy.ndarray: The result of the FFT.
+                Read-only while TransformAnalyzer.cache is set; copy it before changing it in place.
         """
-        return fft(self.function)
+        transform = rfft if self.one_sided else fft
+        return transform(self.function, n=self.transform_length, axis=self.axis, workers=self.get_workers(workers))
 
 
 class DCTAnalyzer(TransformAnalyzer):
@@ -64,27 +242,39 @@ class DCTAnalyzer(TransformAnalyzer):
 
     Attributes:
         function (array-like): The input data for the DCT.
+        axis (int): The axis along which the DCT is performed.
+        transform_length (int): The length of the transform, including zero padding.
 
     Methods:
         calculate(): Perform DCT on the input data and return the result.
     """
-    def __init__(self, function):
+    def __init__(self, function, axis=0, fast_length=False):
         """
         Initializes a DCTAnalyzer instance with the specified input data.
 
         Parameters:
             function (array-like): The input data for the DCT.
+            axis (int): The axis along which the DCT is performed.
+            fast_length (bool): Whether to zero-pad the input to the next length that has only
+                small prime factors.
         """
-        super().__init__(function)
+        super().__init__(function, axis)
+        self.transform_length = self.get_transform_length(fast_length, real=True)
 
-    def calculate(self):
+    @memoized
+    def calculate(self, workers=None):
         """
         Perform DCT on the input data and return the result.
 
+        Parameters:
+            workers (int, optional): The number of threads; defaults to the class-wide setting.
+
         Returns:
             numpy.ndarray: The result of the DCT.
+                Read-only while TransformAnalyzer.cache is set; copy it before changing it in place.
         """
-        return dct(self.function, norm='ortho')
+        return dct(self.function, n=self.transform_length, norm='ortho', axis=self.axis,
+                   workers=self.get_workers(workers))
 
 
 class IFFTAnalyzer(TransformAnalyzer):
@@ -93,27 +283,52 @@ class IFFTAnalyzer(TransformAnalyzer):
 
     Attributes:
         function (array-like): The input data for the IFFT.
+        axis (int): The axis along which the IFFT is performed.
+        one_sided (bool): Whether the input is a one-sided spectrum of a real signal.
+        samples_number (int or None): The length the output is trimmed to.
+        transform_length (int or None): The length of the signal the spectrum was computed from.
 
     Methods:
         calculate(): Perform IFFT on the input data and return the result.
     """
-    def __init__(self, function):
+    def __init__(self, function, axis=0, one_sided=False, samples_number=None, transform_length=None):
         """
         Initializes an IFFTAnalyzer instance with the specified input data.
 
         Parameters:
             function (array-like): The input data for the IFFT.
+            axis (int): The axis along which the IFFT is performed.
+            one_sided (bool): Whether the input is a one-sided spectrum, as returned by
+                FFTAnalyzer with one_sided=True. The result is then real.
+            samples_number (int, optional): The length the output is trimmed to, e.g. the length of
+                the signal before zero padding.
+            transform_length (int, optional): The length of the (padded) signal the spectrum was
+                computed from. Needed to restore odd lengths of one-sided spectra; defaults to
+                samples_number, or 2 * (bins - 1) if that is not given either.
         """
-        super().__init__(function)
+        super().__init__(function, axis)
+        self.one_sided = one_sided
+        self.samples_number = samples_number
+        self.transform_length = transform_length
 
-    def calculate(self):
+    @memoized
+    def calculate(self, workers=None):
         """
         Perform IFFT on the input data and return the result.
 
+        Parameters:
+            workers (int, optional): The number of threads; defaults to the class-wide setting.
+
         Returns:
             numpy.ndarray: The result of the IFFT.
+                Read-only while TransformAnalyzer.cache is set; copy it before changing it in place.
         """
-        return ifft(self.function)
+        if self.one_sided:
+            transform_length = self.transform_length or self.samples_number
+            result = irfft(self.function, n=transform_length, axis=self.axis, workers=self.get_workers(workers))
+        else:
+            result = ifft(self.function, axis=self.axis, workers=self.get_workers(workers))
+        return self.trim(result, self.samples_number)
 
 
 class IDCTAnalyzer(TransformAnalyzer):
@@ -122,24 +337,697 @@ class IDCTAnalyzer(TransformAnalyzer):
 
     Attributes:
         function (array-like): The input data for the IDCT.
+        axis (int): The axis along which the IDCT is performed.
+        samples_number (int or None): The length the output is trimmed to.
 
     Methods:
         calculate(): Perform IDCT on the input data and return the result.
     """
-    def __init__(self, function):
+    def __init__(self, function, axis=0, samples_number=None):
         """
         Initializes an IDCTAnalyzer instance with the specified input data.
 
         Parameters:
             function (array-like): The input data for the IDCT.
+            axis (int): The axis along which the IDCT is performed.
+            samples_number (int, optional): The length the output is trimmed to, e.g. the length of
+                the signal before zero padding.
         """
-        super().__init__(function)
+        super().__init__(function, axis)
+        self.samples_number = samples_number
 
-    def calculate(self):
+    @memoized
+    def calculate(self, workers=None):
         """
         Perform IDCT on the input data and return the result.
 
+        Parameters:
+            workers (int, optional): The number of threads; defaults to the class-wide setting.
+
         Returns:
             numpy.ndarray: The result of the IDCT.
+                Read-only while TransformAnalyzer.cache is set; copy it before changing it in place.
         """
-        return idct(self.function, norm='ortho')
+        result = idct(self.function, norm='ortho', axis=self.axis, workers=self.get_workers(workers))
+        return self.trim(result, self.samples_number)
+
+
+class ZoomFFTAnalyzer(TransformAnalyzer):
+    """
+    Performs zoom FFT analysis with the chirp-z transform.
+
+    The DFT is evaluated at points evenly spaced over the band [low, high] only, at any density.
+    Closely spaced components can then be resolved without zero padding the whole transform; the
+    cost is O((N + M) log(N + M)) for N input samples and M output points. The transform plans are
+    cached per length, band and sampling frequency.
+
+    Attributes:
+        function (array-like): The input data.
+        axis (int): The axis along which the transform is performed.
+        sampling_frequency (float): The sampling frequency of the input.
+        low (float): The first frequency of the band.
+        high (float): The end frequency of the band.
+        points_number (int): The number of output points M.
+        endpoint (bool): Whether high itself is the last output frequency.
+
+    Methods:
+        calculate(): Evaluate the spectrum over the band and return it.
+        get_frequency_axis(): Return the frequencies of the output points.
+    """
+    def __init__(self, function, sampling_frequency, low, high, points_number=None, endpoint=False, axis=0):
+        """
+        Initializes a ZoomFFTAnalyzer instance with the specified input data.
+
+        Parameters:
+            function (array-like): The input data.
+            sampling_frequency (float): The sampling frequency of the input.
+            low (float): The first frequency of the band.
+            high (float): The end frequency of the band.
+            points_number (int, optional): The number of output points. Defaults to the input length.
+            endpoint (bool): Whether high itself is the last output frequency.
+            axis (int): The axis along which the transform is performed.
+        """
+        super().__init__(function, axis)
+        if not low < high:
+            raise ValueError('The band must satisfy low < high')
+        self.sampling_frequency = sampling_frequency
+        self.low = low
+        self.high = high
+        self.points_number = points_number or np.shape(function)[axis]
+        self.endpoint = endpoint
+
+    def get_plan(self):
+        """
+        Return the cached chirp-z plan of the transform.
+
+        Returns:
+            scipy.signal.ZoomFFT: The plan.
+        """
+        samples_number = np.shape(self.function)[self.axis]
+        key = ('zoom_fft', samples_number, self.low, self.high, self.points_number, self.sampling_frequency,
+               self.endpoint)
+        return plan_cache.get(key, lambda: ZoomFFT(samples_number, [self.low, self.high], self.points_number,
+                                                   fs=self.sampling_frequency, endpoint=self.endpoint))
+
+    @memoized
+    def calculate(self, workers=None):
+        """
+        Evaluate the spectrum over the band and return it.
+
+        Parameters:
+            workers (int, optional): Unused; the chirp-z plan runs its FFTs on a single thread.
+
+        Returns:
+            numpy.ndarray: The complex spectrum at the band frequencies, matching fft at those frequencies.
+                Read-only while TransformAnalyzer.cache is set; copy it before changing it in place.
+        """
+        result = self.get_plan()(np.asarray(self.function), axis=self.axis)
+        return result.astype(Precision.complex, copy=False)
+
+    def get_frequency_axis(self):
+        """
+        Return the frequencies of the output points.
+
+        Returns:
+            numpy.ndarray: The band frequencies.
+        """
+        return BandFrequencyAxis(self.points_number, self.sampling_frequency, self.low, self.high,
+                                 self.endpoint).generate()
+
+
+class SparseDFTAnalyzer(TransformAnalyzer):
+    """
+    Evaluates the DFT only at a few chosen frequencies, e.g. the frequencies of the stored components.
+
+    The result at frequency f is the sum of x[n] * exp(-2j * pi * f * n / sampling_frequency), which
+    equals fft at bin frequencies but may be taken at any frequency. The input is processed in blocks
+    of block_size samples. Each block is multiplied by cached cosine and sine tables of all target
+    frequencies in a single matrix product that covers every channel. The product is then rotated by
+    the exact phase of the block start. The work is O(N * K) for N samples and K frequencies, and
+    memory does not depend on N. The input may be an array or an iterable of chunks with time as
+    the first axis, such as a ChunkReader. Each block is converted to the global precision on its
+    own, so e.g. a memory-mapped int16 file is never copied as a whole.
+
+    Attributes:
+        function (array-like or iterable): The real input data or chunks.
+        axis (int): The time axis of array input.
+        sampling_frequency (float): The sampling frequency of the input.
+        frequencies (numpy.ndarray): The target frequencies.
+        block_size (int): The number of samples multiplied by the tables at a time.
+
+    Methods:
+        get_tables(): Return the cached cosine and sine tables of one block.
+        calculate(): Evaluate the DFT at the target frequencies and return it.
+    """
+    convert_input = False
+
+    def __init__(self, function, sampling_frequency, frequencies, axis=0, block_size=4096):
+        """
+        Initializes a SparseDFTAnalyzer instance with the specified input data.
+
+        Parameters:
+            function (array-like or iterable): The real input data, or chunks of it with time first.
+            sampling_frequency (float): The sampling frequency of the input.
+            frequencies (array-like): The target frequencies, e.g. SignalBank.frequencies.
+            axis (int): The time axis of array input.
+            block_size (int): The number of samples multiplied by the tables at a time.
+        """
+        super().__init__(function, axis)
+        self.sampling_frequency = sampling_frequency
+        self.frequencies = np.atleast_1d(np.asarray(frequencies, dtype=float))
+        self.block_size = block_size
+
+    def get_tables(self):
+        """
+        Return the cached cosine and sine tables of one block.
+
+        Returns:
+            tuple: Two arrays shaped (frequencies, block_size) holding cos and sin of the angle
+                2 * pi * f * m / sampling_frequency for m = 0 .. block_size - 1.
+        """
+        key = ('sparse_dft', self.frequencies.tobytes(), self.sampling_frequency, self.block_size,
+               Precision.real.name)
+
+        def create():
+            angles = np.outer(2 * np.pi * self.frequencies / self.sampling_frequency, np.arange(self.block_size))
+            return np.stack((np.cos(angles), np.sin(angles))).astype(Precision.real)
+
+        return tuple(plan_cache.get(key, create))
+
+    def calculate(self):
+        """
+        Evaluate the DFT at the target frequencies and return it.
+
+        Returns:
+            numpy.ndarray: The complex spectrum, with the target frequencies in place of the time axis.
+        """
+        if isinstance(self.function, np.ndarray):
+            chunks = [np.moveaxis(self.function, self.axis, 0)]
+        else:
+            chunks = self.function
+
+        cosines, sines = self.get_tables()
+        angles = 2 * np.pi * self.frequencies / self.sampling_frequency
+        result = None
+        offset = 0
+        for chunk in chunks:
+            chunk = np.asarray(chunk)
+            if result is None:
+                result = np.zeros((len(self.frequencies),) + chunk.shape[1:], dtype=complex)
+                rotation_shape = (-1,) + (1,) * (chunk.ndim - 1)
+
+            for first in range(0, len(chunk), self.block_size):
+                block = Precision.convert_samples(chunk[first:first + self.block_size])
+                samples_number = len(block)
+                # sum of x[m] * exp(-j w (offset + m)) = exp(-j w offset) * (C @ x - j S @ x)
+                products = cosines[:, :samples_number] @ block - 1j * (sines[:, :samples_number] @ block)
+                result += np.exp(-1j * angles * offset).reshape(rotation_shape) * products
+                offset += samples_number
+
+        if result is None:
+            raise ValueError('The input is empty')
+        axis = self.axis if isinstance(self.function, np.ndarray) else 0
+        return np.moveaxis(result, 0, axis).astype(Precision.complex, copy=False)
+
+
+class WelchAnalyzer(TransformAnalyzer):
+    """
+    Estimates the power spectral density with Welch's averaged periodogram.
+
+    The input is cut into overlapping segments, each segment is windowed and transformed, and the
+    power spectra are averaged. Segments are accumulated a bounded batch at a time, so memory depends
+    on the segment length and not on the length of the input. The input may be an array or an
+    iterable of chunks with time as the first axis, such as a ChunkReader. Segments never span a
+    gap, since chunks are joined before framing. Each batch of segments is converted to the global
+    precision on its own, so e.g. a memory-mapped int16 file is never copied as a whole. No
+    detrending is applied.
+
+    The result is the one-sided density in units²/Hz with the frequency bins in place of the time
+    axis, e.g. (bins,) for mono and (bins, channels) for (samples, channels) input. It matches
+    scipy.signal.welch with detrend=False.
+
+    Attributes:
+        function (array-like or iterable): The real input data or chunks.
+        axis (int): The time axis of array input.
+        sampling_frequency (float): The sampling frequency of the input.
+        window (str or tuple): The window specification accepted by scipy.signal.get_window.
+        segment_length (int): The number of samples per segment.
+        hop (int): The number of samples between the starts of consecutive segments.
+        fft_size (int): The FFT length; segments are zero-padded if it exceeds segment_length.
+        max_block_size (int): The maximum number of samples transformed in one batch.
+        segments_number (int): The number of segments averaged by the last calculation.
+
+    Methods:
+        calculate(): Estimate the power spectral density and return it.
+        get_frequency_axis(): Return the frequencies of the bins.
+    """
+    convert_input = False
+
+    def __init__(self, function, sampling_frequency, window='hann', segment_length=256, overlap=None,
+                 fft_size=None, axis=0, max_block_size=2 ** 18):
+        """
+        Initializes a WelchAnalyzer instance with the specified input data.
+
+        Parameters:
+            function (array-like or iterable): The real input data, or chunks of it with time first.
+            sampling_frequency (float): The sampling frequency of the input.
+            window (str or tuple): The window specification accepted by scipy.signal.get_window.
+            segment_length (int): The number of samples per segment.
+            overlap (int, optional): The number of samples shared by consecutive segments.
+                Defaults to segment_length // 2.
+            fft_size (int, optional): The FFT length. Defaults to segment_length.
+            axis (int): The time axis of array input.
+            max_block_size (int): The maximum number of samples transformed in one batch.
+        """
+        super().__init__(function, axis)
+        self.sampling_frequency = sampling_frequency
+        self.window = window
+        self.segment_length = segment_length
+        overlap = segment_length // 2 if overlap is None else overlap
+        if not 0 <= overlap < segment_length:
+            raise ValueError('overlap must be non-negative and smaller than segment_length')
+        self.hop = segment_length - overlap
+        self.fft_size = fft_size or segment_length
+        self.max_block_size = max_block_size
+        self.segments_number = 0
+
+    def iterate_segments(self):
+        """
+        Yield batches of segments shaped (segments, ..., segment_length), as strided views.
+
+        Yields:
+            numpy.ndarray: The next batch of segments.
+        """
+        if isinstance(self.function, np.ndarray):
+            chunks = [np.moveaxis(self.function, self.axis, 0)]
+        else:
+            chunks = self.function
+
+        buffer = None
+        for chunk in chunks:
+            chunk = np.asarray(chunk)
+            buffer = chunk if buffer is None or not len(buffer) else np.concatenate((buffer, chunk))
+            if len(buffer) < self.segment_length:
+                continue
+
+            segments = np.lib.stride_tricks.sliding_window_view(buffer, self.segment_length, axis=0)[::self.hop]
+            batch_size = max(1, self.max_block_size // (self.segment_length * max(1, buffer[0].size)))
+            for first in range(0, len(segments), batch_size):
+                yield segments[first:first + batch_size]
+            buffer = buffer[len(segments) * self.hop:]
+
+    def calculate(self, workers=None):
+        """
+        Estimate the power spectral density and return it.
+
+        Parameters:
+            workers (int, optional): The number of threads processing batches of segments concurrently;
+                defaults to the class-wide setting.
+
+        Returns:
+            numpy.ndarray: The one-sided power spectral density.
+        """
+        window = self.get_window(self.window, self.segment_length)
+
+        def power(segments):
+            spectra = rfft(Precision.convert_samples(segments) * window, n=self.fft_size, axis=-1, workers=1)
+            return len(segments), np.sum(spectra.real ** 2 + spectra.imag ** 2, axis=0)
+
+        workers = self.get_workers(workers)
+        if workers is not None and workers < 0:
+            workers = os.cpu_count()
+
+        self.segments_number = 0
+        total = 0
+        if not workers or workers == 1:
+            for segments in self.iterate_segments():
+                count, partial = power(segments)
+                self.segments_number += count
+                total = total + partial
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                pending = deque()
+                for segments in self.iterate_segments():
+                    pending.append(executor.submit(power, segments))
+                    while len(pending) >= 2 * workers or (pending and pending[0].done()):
+                        count, partial = pending.popleft().result()
+                        self.segments_number += count
+                        total = total + partial
+                for future in pending:
+                    count, partial = future.result()
+                    self.segments_number += count
+                    total = total + partial
+
+        if not self.segments_number:
+            raise ValueError('The input is shorter than segment_length')
+
+        density = total / (self.segments_number * self.sampling_frequency * np.sum(window ** 2))
+        last = -1 if self.fft_size % 2 == 0 else None
+        density[..., 1:last] *= 2
+        axis = self.axis if isinstance(self.function, np.ndarray) else 0
+        return np.moveaxis(density, -1, axis)
+
+    def get_frequency_axis(self):
+        """
+        Return the frequencies of the bins.
+
+        Returns:
+            numpy.ndarray: The bin frequencies.
+        """
+        return FrequencyAxis(self.fft_size, self.sampling_frequency, one_sided=True).generate()
+
+
+class STFTAnalyzer(TransformAnalyzer):
+    """
+    Performs Short-Time Fourier Transform (STFT) analysis.
+
+    The input is cut into frames of window_length samples, hop samples apart, through a strided
+    view of the input without copying. All windowed frames are then transformed by a single batched
+    real-input FFT. Frames lie entirely inside the input; there is no padding at either end.
+
+    The result has the frame index in place of the time axis and the frequency bins as the last
+    axis, e.g. (frames, bins) for mono and (frames, channels, bins) for (samples, channels) input.
+
+    Attributes:
+        function (array-like): The real input data for the STFT.
+        axis (int): The time axis of the input.
+        window (str or tuple): The window specification accepted by scipy.signal.get_window.
+        window_length (int): The number of samples per frame.
+        hop (int): The number of samples between the starts of consecutive frames.
+        fft_size (int): The FFT length; frames are zero-padded if it exceeds window_length.
+
+    Methods:
+        calculate(): Perform STFT on the input data and return the result.
+        get_frequency_axis(sampling_frequency): Return the frequencies of the bins.
+        get_time_axis(sampling_frequency): Return the center times of the frames.
+    """
+    def __init__(self, function, window='hann', window_length=256, hop=None, fft_size=None, axis=0):
+        """
+        Initializes an STFTAnalyzer instance with the specified input data.
+
+        Parameters:
+            function (array-like): The real input data for the STFT.
+            window (str or tuple): The window specification accepted by scipy.signal.get_window.
+            window_length (int): The number of samples per frame.
+            hop (int, optional): The number of samples between frames. Defaults to window_length // 2.
+            fft_size (int, optional): The FFT length. Defaults to window_length.
+            axis (int): The time axis of the input.
+        """
+        super().__init__(function, axis)
+        self.window = window
+        self.window_length = window_length
+        self.hop = hop or max(1, window_length // 2)
+        self.fft_size = fft_size or window_length
+        if self.fft_size < window_length:
+            raise ValueError('fft_size must not be smaller than window_length')
+
+    def get_frames(self):
+        """
+        Return a strided view of the input frames, without copying.
+
+        Returns:
+            numpy.ndarray: The frames, with the frame index in place of the time axis and the samples
+                of each frame as the last axis.
+        """
+        data = np.asarray(self.function)
+        if data.shape[self.axis] < self.window_length:
+            raise ValueError('The input is shorter than window_length')
+        frames = np.lib.stride_tricks.sliding_window_view(data, self.window_length, axis=self.axis)
+        index = [slice(None)] * frames.ndim
+        index[self.axis] = slice(None, None, self.hop)
+        return frames[tuple(index)]
+
+    @memoized
+    def calculate(self, workers=None):
+        """
+        Perform STFT on the input data and return the result.
+
+        Parameters:
+            workers (int, optional): The number of threads; defaults to the class-wide setting.
+
+        Returns:
+            numpy.ndarray: The complex spectra of all frames.
+                Read-only while TransformAnalyzer.cache is set; copy it before changing it in place.
+        """
+        frames = self.get_frames()
+        windowed = frames * self.get_window(self.window, self.window_length)
+        return rfft(windowed, n=self.fft_size, axis=-1, workers=self.get_workers(workers))
+
+    def get_frequency_axis(self, sampling_frequency):
+        """
+        Return the frequencies of the bins.
+
+        Parameters:
+            sampling_frequency (float): The sampling frequency of the input.
+
+        Returns:
+            numpy.ndarray: The bin frequencies.
+        """
+        return FrequencyAxis(self.fft_size, sampling_frequency, one_sided=True).generate()
+
+    def get_time_axis(self, sampling_frequency):
+        """
+        Return the center times of the frames.
+
+        Parameters:
+            sampling_frequency (float): The sampling frequency of the input.
+
+        Returns:
+            numpy.ndarray: The frame center times.
+        """
+        frames_number = (np.shape(self.function)[self.axis] - self.window_length) // self.hop + 1
+        return (np.arange(frames_number) * self.hop + self.window_length / 2) / sampling_frequency
+
+
+class ISTFTAnalyzer(TransformAnalyzer):
+    """
+    Performs Inverse Short-Time Fourier Transform (ISTFT) analysis by weighted overlap-add.
+
+    Every frame is inverse transformed, multiplied by the synthesis window and added at its
+    position. The sum is divided by the overlap-added squared window, which inverts STFTAnalyzer
+    exactly wherever the windows overlap with non-zero weight.
+
+    Attributes:
+        function (array-like): The STFT data, shaped as returned by STFTAnalyzer.
+        axis (int): The frame axis of the input, which becomes the time axis of the output.
+        window (str or tuple): The window specification accepted by scipy.signal.get_window.
+        window_length (int): The number of samples per frame.
+        hop (int): The number of samples between the starts of consecutive frames.
+        fft_size (int): The FFT length used by the STFT.
+        samples_number (int or None): The length the output is padded or trimmed to.
+
+    Methods:
+        calculate(): Perform ISTFT on the input data and return the result.
+    """
+    def __init__(self, function, window='hann', window_length=256, hop=None, fft_size=None, samples_number=None,
+                 axis=0):
+        """
+        Initializes an ISTFTAnalyzer instance with the specified input data.
+
+        Parameters:
+            function (array-like): The STFT data, shaped as returned by STFTAnalyzer.
+            window (str or tuple): The window specification accepted by scipy.signal.get_window.
+            window_length (int): The number of samples per frame.
+            hop (int, optional): The number of samples between frames. Defaults to window_length // 2.
+            fft_size (int, optional): The FFT length used by the STFT. Defaults to window_length.
+            samples_number (int, optional): The length the output is padded or trimmed to, e.g. the
+                length of the original signal. Defaults to the span of the frames.
+            axis (int): The frame axis of the input.
+        """
+        super().__init__(function, axis)
+        self.window = window
+        self.window_length = window_length
+        self.hop = hop or max(1, window_length // 2)
+        self.fft_size = fft_size or window_length
+        self.samples_number = samples_number
+
+    def overlap_add(self, frames):
+        """
+        Add frames shaped (frames, ..., window_length) at their positions, hop samples apart.
+
+        The frames are split into hop-sized pieces so that the sum takes only
+        ceil(window_length / hop) vectorized additions, independent of the number of frames.
+
+        Parameters:
+            frames (numpy.ndarray): The frames.
+
+        Returns:
+            numpy.ndarray: The overlap-added signal with time as the first axis.
+        """
+        frames_number = frames.shape[0]
+        other_shape = frames.shape[1:-1]
+        pieces_number = -(-self.window_length // self.hop)
+
+        padding = [(0, 0)] * (frames.ndim - 1) + [(0, pieces_number * self.hop - self.window_length)]
+        pieces = np.pad(frames, padding).reshape(frames.shape[:-1] + (pieces_number, self.hop))
+
+        blocks = np.zeros((frames_number + pieces_number - 1,) + other_shape + (self.hop,), dtype=frames.dtype)
+        for piece in range(pieces_number):
+            blocks[piece:piece + frames_number] += pieces[..., piece, :]
+
+        signal = np.moveaxis(blocks, -1, 1).reshape((-1,) + other_shape)
+        return signal[:(frames_number - 1) * self.hop + self.window_length]
+
+    @memoized
+    def calculate(self, workers=None):
+        """
+        Perform ISTFT on the input data and return the result.
+
+        Parameters:
+            workers (int, optional): The number of threads; defaults to the class-wide setting.
+
+        Returns:
+            numpy.ndarray: The reconstructed real signal.
+                Read-only while TransformAnalyzer.cache is set; copy it before changing it in place.
+        """
+        spectra = np.moveaxis(np.asarray(self.function), self.axis, 0)
+        window = self.get_window(self.window, self.window_length)
+
+        frames = irfft(spectra, n=self.fft_size, axis=-1, workers=self.get_workers(workers))
+        frames = frames[..., :self.window_length] * window
+        signal = self.overlap_add(frames)
+
+        weights = self.overlap_add(np.broadcast_to(window ** 2, (spectra.shape[0], self.window_length)))
+        weights = weights.reshape(weights.shape + (1,) * (signal.ndim - 1))
+        signal = np.divide(signal, weights, out=np.zeros_like(signal), where=weights > 1e-10)
+
+        if self.samples_number is not None:
+            if self.samples_number > len(signal):
+                padding = [(0, self.samples_number - len(signal))] + [(0, 0)] * (signal.ndim - 1)
+                signal = np.pad(signal, padding)
+            signal = signal[:self.samples_number]
+        return np.moveaxis(signal, 0, self.axis)
+
+
+def dirichlet_sum(theta, samples_number):
+    """
+    Evaluate the geometric sum of exp(1j * theta * n) for n = 0 .. samples_number - 1 in closed form.
+
+    Parameters:
+        theta (numpy.ndarray): Angle increments in radians.
+        samples_number (int): The number of summed terms.
+
+    Returns:
+        numpy.ndarray: The complex sums.
+    """
+    half = theta / 2
+    denominator = np.sin(half)
+    singular = np.abs(denominator) < 1e-12
+    ratio = np.where(singular,
+                     samples_number * np.cos(samples_number * half) / np.where(singular, np.cos(half), 1),
+                     np.sin(samples_number * half) / np.where(singular, 1, denominator))
+    return np.exp(1j * half * (samples_number - 1)) * ratio
+
+
+class AnalyticFFTAnalyzer(TransformAnalyzer):
+    """
+    Computes the DFT of a sampled sum of sines directly from the component parameters.
+
+    The sampled wave is never synthesized: each component contributes two Dirichlet-kernel terms
+    to every requested bin. This is cheaper than synthesis followed by an FFT when there are few
+    components, or when only some bins are needed.
+
+    Attributes:
+        function (SignalBank): The components of the signal.
+        samples_number (int): The number of samples of the discrete time axis.
+        sampling_frequency (float): The sampling frequency of the discrete time axis.
+        bins (numpy.ndarray): Indices of the DFT bins to evaluate.
+        max_block_size (int): The maximum number of elements of a single (components x bins) block.
+
+    Methods:
+        calculate(): Evaluate the requested DFT bins and return them.
+    """
+    def __init__(self, function, samples_number, sampling_frequency, bins=None, max_block_size=2 ** 16):
+        """
+        Initializes an AnalyticFFTAnalyzer instance.
+
+        Parameters:
+            function (SignalBank): The components of the signal.
+            samples_number (int): The number of samples of the discrete time axis.
+            sampling_frequency (float): The sampling frequency of the discrete time axis.
+            bins (array-like, optional): Indices of the DFT bins to evaluate. Defaults to all bins.
+            max_block_size (int): The maximum number of elements of a single (components x bins) block.
+        """
+        super().__init__(function)
+        self.samples_number = samples_number
+        self.sampling_frequency = sampling_frequency
+        self.bins = np.arange(samples_number) if bins is None else np.asarray(bins)
+        self.max_block_size = max_block_size
+
+    def get_component_angles(self):
+        """
+        Get the per-sample angle increment and the initial phase of every component.
+
+        Returns:
+            tuple: Angle increments and phases in radians.
+        """
+        time_step = DiscreteTimeAxis(self.samples_number, self.sampling_frequency).get_time_step()
+        angles = 2 * np.pi * self.function.frequencies * time_step
+        phases = np.deg2rad(self.function.phases)
+        return angles[:, np.newaxis], phases[:, np.newaxis]
+
+    def calculate(self):
+        """
+        Evaluate the requested DFT bins and return them.
+
+        Returns:
+            numpy.ndarray: The DFT values, matching fft of the sampled wave at the requested bins.
+        """
+        result = np.zeros(len(self.bins), dtype=Precision.complex)
+        if not self.function.size:
+            return result
+
+        angles, phases = self.get_component_angles()
+        amplitudes = self.function.amplitudes / 2j
+        step = max(1, self.max_block_size // self.function.size)
+
+        for first in range(0, len(self.bins), step):
+            bins = slice(first, first + step)
+            bin_angles = 2 * np.pi * self.bins[bins] / self.samples_number
+            terms = (np.exp(1j * phases) * dirichlet_sum(angles - bin_angles, self.samples_number)
+                     - np.exp(-1j * phases) * dirichlet_sum(-angles - bin_angles, self.samples_number))
+            result[bins] = amplitudes @ terms
+        return result
+
+
+class AnalyticDCTAnalyzer(AnalyticFFTAnalyzer):
+    """
+    Computes the orthonormal DCT-II of a sampled sum of sines directly from the component parameters.
+
+    Attributes:
+        function (SignalBank): The components of the signal.
+        samples_number (int): The number of samples of the discrete time axis.
+        sampling_frequency (float): The sampling frequency of the discrete time axis.
+        bins (numpy.ndarray): Indices of the DCT coefficients to evaluate.
+        max_block_size (int): The maximum number of elements of a single (components x bins) block.
+
+    Methods:
+        calculate(): Evaluate the requested DCT coefficients and return them.
+    """
+    def calculate(self):
+        """
+        Evaluate the requested DCT coefficients and return them.
+
+        Returns:
+            numpy.ndarray: The DCT values, matching dct(..., norm='ortho') of the sampled wave.
+        """
+        result = np.zeros(len(self.bins), dtype=Precision.real)
+        if not self.function.size:
+            return result
+
+        angles, phases = self.get_component_angles()
+        amplitudes = self.function.amplitudes
+        step = max(1, self.max_block_size // self.function.size)
+
+        for first in range(0, len(self.bins), step):
+            bins = slice(first, first + step)
+            # sin(a n + p) cos(b (2n + 1)) = (sin((a + 2b) n + p + b) + sin((a - 2b) n + p - b)) / 2
+            half_angles = np.pi * self.bins[bins] / (2 * self.samples_number)
+            terms = (np.exp(1j * (phases + half_angles))
+                     * dirichlet_sum(angles + 2 * half_angles, self.samples_number)
+                     + np.exp(1j * (phases - half_angles))
+                     * dirichlet_sum(angles - 2 * half_angles, self.samples_number))
+            scale = np.where(self.bins[bins] == 0, np.sqrt(1 / (4 * self.samples_number)),
+                             np.sqrt(1 / (2 * self.samples_number)))
+            result[bins] = (amplitudes @ terms.imag) * scale
+        return result
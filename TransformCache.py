@@ -0,0 +1,159 @@
+import functools
+import hashlib
+import mmap
+import threading
+from collections import OrderedDict
+import numpy as np
+
+
+class TransformCache:
+    """
+    Bounded least-recently-used cache of transform results, keyed by the content of their input.
+
+    A key combines a BLAKE2 digest of the input bytes with its shape and dtype, the analyzer class
+    and its parameters, so byte-identical input gives a hit even when it arrives as a new array.
+    The cache is limited by the total size of the stored results rather than by their number.
+    Cached results are made read-only, since they are shared by every caller requesting the same key;
+    a caller modifying a result in place has to copy it first. Memory-mapped input is not cached,
+    since hashing it would read the whole file on every calculation.
+
+    Attributes:
+        max_bytes (int): The maximum total size of the cached results.
+        entries (OrderedDict): The cached results, least recently used first.
+        bytes (int): The total size of the cached results.
+        hits (int): The number of calculations served from the cache.
+        misses (int): The number of calculations that had to be performed.
+
+    Methods:
+        get_key(analyzer): Return the key of the result of an analyzer, or None if it cannot be cached.
+        get(key, factory): Return the cached result of a key, computing it with factory on a miss.
+        get_statistics(): Return the hit and miss counts and the memory use.
+        clear(): Remove all entries.
+    """
+
+    def __init__(self, max_bytes=2 ** 28):
+        """
+        Initializes a TransformCache instance.
+
+        Parameters:
+            max_bytes (int): The maximum total size of the cached results.
+        """
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def get_key(analyzer):
+        """
+        Return the key of the result of an analyzer, or None if it cannot be cached.
+
+        Only NumPy array input held in memory is hashed; other input, such as chunk iterables, a
+        SignalBank or an array backed by a memory-mapped file, is not cached.
+
+        Parameters:
+            analyzer (TransformAnalyzer): The analyzer whose result is looked up.
+
+        Returns:
+            tuple or None: The key.
+        """
+        data = analyzer.function
+        if not isinstance(data, np.ndarray) or data.dtype.hasobject:
+            return None
+        base = data
+        while base is not None:
+            if isinstance(base, (np.memmap, mmap.mmap)):
+                return None
+            base = getattr(base, 'base', None)
+
+        parameters = tuple(sorted((name, value) for name, value in vars(analyzer).items() if name != 'function'))
+        try:
+            hash(parameters)
+        except TypeError:
+            return None
+
+        digest = hashlib.blake2b(np.ascontiguousarray(data), digest_size=16).digest()
+        return type(analyzer).__name__, parameters, data.shape, data.dtype.str, digest
+
+    def get(self, key, factory):
+        """
+        Return the cached result of a key, computing it with factory on a miss.
+
+        Parameters:
+            key (hashable): The key of the result.
+            factory (callable): Called without arguments to compute a missing result.
+
+        Returns:
+            object: The result.
+        """
+        with self.lock:
+            if key in self.entries:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return self.entries[key]
+            self.misses += 1
+
+        value = factory()
+        if not isinstance(value, np.ndarray) or value.nbytes > self.max_bytes:
+            return value
+        value.setflags(write=False)
+
+        with self.lock:
+            if key not in self.entries:
+                self.entries[key] = value
+                self.bytes += value.nbytes
+            while self.bytes > self.max_bytes:
+                _, evicted = self.entries.popitem(last=False)
+                self.bytes -= evicted.nbytes
+        return value
+
+    def get_statistics(self):
+        """
+        Return the hit and miss counts and the memory use.
+
+        Returns:
+            dict: The statistics.
+        """
+        requests = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / requests if requests else 0.0,
+            'entries': len(self.entries),
+            'bytes': self.bytes,
+            'max_bytes': self.max_bytes,
+        }
+
+    def clear(self):
+        """
+        Remove all entries.
+        """
+        with self.lock:
+            self.entries.clear()
+            self.bytes = 0
+
+
+def memoized(calculate):
+    """
+    Decorator serving the calculate method of an analyzer from TransformAnalyzer.cache.
+
+    The number of workers does not change the result, so it is not part of the key. Without a
+    cache, or for input that cannot be hashed, the method is called directly. Results served by the
+    cache are read-only.
+
+    Parameters:
+        calculate (callable): The calculate method to wrap.
+
+    Returns:
+        callable: The wrapped method.
+    """
+    @functools.wraps(calculate)
+    def wrapper(self, *args, **kwargs):
+        cache = self.cache
+        key = None if cache is None else cache.get_key(self)
+        if key is None:
+            return calculate(self, *args, **kwargs)
+        return cache.get(key, lambda: calculate(self, *args, **kwargs))
+    return wrapper
@@ -0,0 +1,78 @@
+import numpy as np
+import pytest
+from scipy.fft import fft, dct
+from Axis import DiscreteTimeAxis
+from Signal import SignalBank
+from Pipeline import TransformPipeline
+from TransformAnalyzer import AnalyticFFTAnalyzer, AnalyticDCTAnalyzer
+
+SAMPLING_FREQUENCY = 1000.0
+
+
+def create_bank(samples_number):
+    """
+    Create components with off-bin, on-bin and phase-shifted frequencies for a given length.
+    """
+    time_step = DiscreteTimeAxis(samples_number, SAMPLING_FREQUENCY).get_time_step()
+    bin_frequency = 1 / (samples_number * time_step)
+    bank = SignalBank()
+    bank.append(1.0, 37.3, 0.0)
+    bank.append(0.5, 5 * bin_frequency, 0.0)
+    bank.append(2.0, 3 * bin_frequency, 45.0)
+    bank.append(0.25, 123.4, 270.0)
+    return bank
+
+
+def get_sampled_wave(bank, samples_number):
+    return bank.get_wave(DiscreteTimeAxis(samples_number, SAMPLING_FREQUENCY).generate())
+
+
+@pytest.mark.parametrize('samples_number', [64, 100, 101, 127, 257, 1000])
+def test_analytic_fft_matches_fft(samples_number):
+    bank = create_bank(samples_number)
+    expected = fft(get_sampled_wave(bank, samples_number))
+    result = AnalyticFFTAnalyzer(bank, samples_number, SAMPLING_FREQUENCY).calculate()
+    assert np.max(np.abs(result - expected)) <= 1e-9 * np.max(np.abs(expected))
+
+
+@pytest.mark.parametrize('samples_number', [64, 100, 101, 127, 257, 1000])
+def test_analytic_dct_matches_dct(samples_number):
+    bank = create_bank(samples_number)
+    expected = dct(get_sampled_wave(bank, samples_number), norm='ortho')
+    result = AnalyticDCTAnalyzer(bank, samples_number, SAMPLING_FREQUENCY).calculate()
+    assert np.max(np.abs(result - expected)) <= 1e-9 * np.max(np.abs(expected))
+
+
+def test_analytic_fft_evaluates_selected_bins():
+    samples_number = 127
+    bank = create_bank(samples_number)
+    bins = [0, 3, 5, 64, 126]
+    expected = fft(get_sampled_wave(bank, samples_number))[bins]
+    result = AnalyticFFTAnalyzer(bank, samples_number, SAMPLING_FREQUENCY, bins=bins, max_block_size=8).calculate()
+    assert np.allclose(result, expected, rtol=0, atol=1e-9 * np.max(np.abs(expected)))
+
+
+def test_analytic_transforms_of_empty_bank():
+    assert not np.any(AnalyticFFTAnalyzer(SignalBank(), 16, SAMPLING_FREQUENCY).calculate())
+    assert not np.any(AnalyticDCTAnalyzer(SignalBank(), 16, SAMPLING_FREQUENCY).calculate())
+
+
+@pytest.mark.parametrize('samples_number', [100, 127])
+def test_pipeline_uses_the_bank(samples_number):
+    bank = create_bank(samples_number)
+    wave = get_sampled_wave(bank, samples_number)
+    analytic = TransformPipeline(wave, SAMPLING_FREQUENCY, bank=bank)
+    sampled = TransformPipeline(wave, SAMPLING_FREQUENCY)
+    for name in ('fft', 'dct', 'ifft', 'idct'):
+        expected = sampled.get(name)
+        assert analytic.get(name).shape == expected.shape
+        assert np.max(np.abs(analytic.get(name) - expected)) <= 1e-9 * np.max(np.abs(expected))
+    assert np.allclose(analytic.get('idct'), wave)
+
+
+def test_pipeline_ignores_the_bank_with_fast_length():
+    samples_number = 127
+    bank = create_bank(samples_number)
+    wave = get_sampled_wave(bank, samples_number)
+    pipeline = TransformPipeline(wave, SAMPLING_FREQUENCY, fast_length=True, bank=bank)
+    assert np.allclose(pipeline.get('fft'), TransformPipeline(wave, SAMPLING_FREQUENCY, fast_length=True).get('fft'))
@@ -0,0 +1,53 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from FileHandler import DecodedAudioCache
+from Pyramid import PyramidIndex
+from SignalsHandler import SignalsHandler
+
+
+def store(directory, value):
+    DecodedAudioCache(directory).store('key', np.full(2 ** 16, value, dtype=np.int16), 44100)
+
+
+def test_concurrent_stores_leave_a_complete_entry(tmp_path):
+    with ProcessPoolExecutor(max_workers=4) as executor:
+        list(executor.map(store, [str(tmp_path)] * 8, range(8)))
+
+    data, sampling_rate = DecodedAudioCache(str(tmp_path)).load('key')
+    assert sampling_rate == 44100
+    assert len(data) == 2 ** 16 and np.all(data == data[0])
+    assert sorted(os.listdir(tmp_path)) == ['key.json', 'key.npy']
+
+
+def test_raw_file_decoded_two_ways_gets_two_entries(tmp_path):
+    file = str(tmp_path / 'samples.raw')
+    np.arange(3 * 10007, dtype='<i2').tofile(file)
+    cache = DecodedAudioCache(str(tmp_path / 'cache'))
+
+    data, time_axis, sampling_frequency = SignalsHandler.generate_wave_from_file(
+        file, cache=cache, sampling_rate=8000, channels=3)
+    assert data.shape == (10007, 3) and sampling_frequency == 8000
+
+    data, time_axis, sampling_frequency = SignalsHandler.generate_wave_from_file(
+        file, cache=cache, sampling_rate=16000, channels=1)
+    assert data.shape == (3 * 10007,) and sampling_frequency == 16000
+    assert len(time_axis) == 3 * 10007
+    assert cache.misses == 2
+
+    SignalsHandler.generate_wave_from_file(file, cache=cache, sampling_rate=8000, channels=3)
+    assert cache.hits == 1
+
+
+def test_raw_file_pyramids_follow_the_format(tmp_path):
+    file = str(tmp_path / 'samples.raw')
+    np.arange(3 * 10007, dtype='<i2').tofile(file)
+    index = PyramidIndex(str(tmp_path / 'pyramids'))
+
+    multi_channel = index.get(file, sampling_rate=8000, channels=3)
+    mono = index.get(file, sampling_rate=16000, channels=1)
+    assert not multi_channel.mono and multi_channel.samples_number == 10007 and multi_channel.sampling_rate == 8000
+    assert mono.mono and mono.samples_number == 3 * 10007 and mono.sampling_rate == 16000
+
+    assert index.get(file, sampling_rate=8000, channels=3).samples_number == 10007
+    assert (index.hits, index.misses) == (1, 2)
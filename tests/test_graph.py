@@ -0,0 +1,27 @@
+import numpy as np
+import pytest
+from matplotlib.figure import Figure
+from Graph import Plot, StemPlot
+
+
+@pytest.mark.parametrize('graph_type', [Plot, StemPlot])
+def test_graph_of_empty_data_is_created_again(graph_type):
+    figure = Figure()
+    graph = graph_type([], [], 'Czas', 'Amplituda', 'Sygnał oryginalny')
+    graph.create(figure)
+    y = np.sin(np.arange(100.0))
+    assert not graph.can_update(figure.axes[0], y)
+    with pytest.raises(ValueError):
+        graph.update(np.arange(100.0), y)
+
+
+@pytest.mark.parametrize('graph_type', [Plot, StemPlot])
+def test_graph_is_updated_in_place(graph_type):
+    figure = Figure()
+    x = np.arange(100.0)
+    graph = graph_type(x, np.sin(x), 'Czas', 'Amplituda', 'Sygnał oryginalny')
+    graph.create(figure)
+    artists = list(graph.artists)
+    assert graph.can_update(figure.axes[0], np.cos(x))
+    assert not graph.update(x, np.cos(x))
+    assert graph.artists == artists
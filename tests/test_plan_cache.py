@@ -0,0 +1,41 @@
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+from PlanCache import PlanCache
+
+
+def test_entries_are_read_only_and_reused():
+    cache = PlanCache()
+    first = cache.get(('table', 4), lambda: np.arange(4.0))
+    assert cache.get(('table', 4), lambda: np.zeros(4)) is first
+    assert not first.flags.writeable
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_concurrent_access_keeps_the_bound():
+    cache = PlanCache(max_entries=8)
+
+    def request(index):
+        key = ('table', index % 32)
+        return cache.get(key, lambda: np.full(4, index % 32))[0] == index % 32
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        assert all(executor.map(request, range(20000)))
+    assert len(cache.entries) == 8
+    assert cache.hits + cache.misses == 20000
+
+
+def test_large_entries_are_not_kept():
+    cache = PlanCache(max_entry_bytes=1024)
+    large = cache.get(('axis', 1000), lambda: np.arange(1000.0))
+    assert len(large) == 1000 and not large.flags.writeable
+    assert not cache.entries and cache.bytes == 0
+    cache.get(('axis', 1000), lambda: np.arange(1000.0))
+    assert cache.misses == 2
+
+
+def test_total_size_is_bounded():
+    cache = PlanCache(max_bytes=4096, max_entry_bytes=4096)
+    for length in range(100, 120):
+        cache.get(('axis', length), lambda: np.zeros(length))
+    assert cache.bytes == sum(entry.nbytes for entry in cache.entries.values()) <= 4096
+    assert ('axis', 119) in cache.entries
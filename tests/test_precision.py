@@ -0,0 +1,79 @@
+import numpy as np
+import pytest
+from Axis import DiscreteTimeAxis
+from Oscillator import PhasorOscillator
+from Precision import Precision
+from TransformAnalyzer import FFTAnalyzer, DCTAnalyzer, IFFTAnalyzer, STFTAnalyzer, WelchAnalyzer, SparseDFTAnalyzer
+
+TOLERANCE = 1e-5
+
+
+@pytest.fixture
+def single_precision():
+    Precision.set('float32')
+    yield
+    Precision.set('float64')
+
+
+def get_wave(samples_number=4096):
+    rng = np.random.default_rng(0)
+    time_axis = DiscreteTimeAxis(samples_number, 44100).generate()
+    return PhasorOscillator().generate(time_axis, rng.uniform(0.1, 10, 8), rng.uniform(1, 2000, 8),
+                                       rng.uniform(0, 360, 8))
+
+
+def get_relative_error(single, double):
+    return np.max(np.abs(single - double)) / np.max(np.abs(double))
+
+
+TRANSFORMS = {
+    'fft': (lambda wave: FFTAnalyzer(wave, one_sided=True).calculate(), np.complex64),
+    'dct': (lambda wave: DCTAnalyzer(wave).calculate(), np.float32),
+    'ifft': (lambda wave: IFFTAnalyzer(FFTAnalyzer(wave).calculate()).calculate(), np.complex64),
+    'stft': (lambda wave: STFTAnalyzer(wave, window_length=256).calculate(), np.complex64),
+}
+
+
+@pytest.mark.parametrize('name', sorted(TRANSFORMS))
+def test_single_precision_transforms(name, single_precision):
+    transform, dtype = TRANSFORMS[name]
+    Precision.set('float64')
+    double_wave = get_wave()
+    double = transform(double_wave)
+
+    Precision.set('float32')
+    single_wave = get_wave()
+    single = transform(single_wave)
+
+    assert single_wave.dtype == np.float32
+    assert single.dtype == dtype
+    assert get_relative_error(single_wave, double_wave) < TOLERANCE
+    assert get_relative_error(single, double) < TOLERANCE
+
+
+def test_double_precision_is_default():
+    assert Precision.real == np.float64 and Precision.complex == np.complex128
+    assert FFTAnalyzer(get_wave()).calculate().dtype == np.complex128
+
+
+def test_unsupported_precision():
+    with pytest.raises(ValueError):
+        Precision.set('float16')
+
+
+def test_streaming_analyzers_convert_blocks(single_precision, tmp_path):
+    samples = (get_wave(2 ** 14) * 1000).astype(np.int16)
+    samples.tofile(tmp_path / 'samples.raw')
+    data = np.memmap(tmp_path / 'samples.raw', dtype=np.int16, mode='r')
+
+    welch = WelchAnalyzer(data, 44100, segment_length=512)
+    sparse = SparseDFTAnalyzer(data, 44100, [440.0, 1000.0], block_size=1024)
+    assert welch.function is data and sparse.function is data
+
+    single_density, single_spectrum = welch.calculate(), sparse.calculate()
+    assert single_density.dtype == np.float32 and single_spectrum.dtype == np.complex64
+    Precision.set('float64')
+    double_density = WelchAnalyzer(data, 44100, segment_length=512).calculate()
+    double_spectrum = SparseDFTAnalyzer(data, 44100, [440.0, 1000.0], block_size=1024).calculate()
+    assert get_relative_error(single_density, double_density) < TOLERANCE
+    assert get_relative_error(single_spectrum, double_spectrum) < TOLERANCE
@@ -0,0 +1,55 @@
+import numpy as np
+import pytest
+from Axis import TimeAxis, DiscreteTimeAxis
+from Oscillator import SineOscillator, PhasorOscillator
+from Signal import Signal, Sine
+from SignalsHandler import SignalsHandler
+
+
+class ScaledOscillator(SineOscillator):
+    """
+    Sine oscillator with doubled amplitudes, telling its output apart from SineOscillator.
+    """
+
+    def generate(self, time, amplitudes, frequencies, phases):
+        return 2 * super().generate(time, amplitudes, frequencies, phases)
+
+
+@pytest.fixture
+def handler():
+    oscillator = Signal.oscillator
+    handler = SignalsHandler()
+    handler.append_signal(Sine(1.0, 5.0, 0.0))
+    handler.append_signal(Sine(0.5, 12.0, 90.0))
+    yield handler
+    Signal.set_oscillator(oscillator)
+
+
+def generate(handler):
+    time_axis_generator = TimeAxis(1000, 100, 0.001)
+    discrete_time_axis_generator = DiscreteTimeAxis(100, 100)
+    axes_key = (time_axis_generator.get_key(), discrete_time_axis_generator.get_key())
+    return handler.generate_wave(time_axis_generator.generate(), discrete_time_axis_generator.generate(), axes_key)
+
+
+def test_cached_waves_follow_signal_edits(handler):
+    generate(handler)
+    handler.update_signal(0, 2.0, 7.0, 30.0)
+    wave, sampled_wave = generate(handler)
+
+    reference = SignalsHandler()
+    reference.append_signal(Sine(2.0, 7.0, 30.0))
+    reference.append_signal(Sine(0.5, 12.0, 90.0))
+    expected_wave, expected_sampled_wave = generate(reference)
+    assert np.allclose(wave, expected_wave) and np.allclose(sampled_wave, expected_sampled_wave)
+
+
+def test_new_oscillator_drops_cached_waves(handler):
+    wave, sampled_wave = generate(handler)
+    Signal.set_oscillator(ScaledOscillator())
+    scaled_wave, scaled_sampled_wave = generate(handler)
+    assert np.allclose(scaled_wave, 2 * wave) and np.allclose(scaled_sampled_wave, 2 * sampled_wave)
+
+    Signal.set_oscillator(PhasorOscillator())
+    phasor_wave, _ = generate(handler)
+    assert np.allclose(phasor_wave, wave, atol=1e-9)
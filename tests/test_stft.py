@@ -0,0 +1,84 @@
+import numpy as np
+import pytest
+from scipy.signal import welch
+from TransformAnalyzer import STFTAnalyzer, ISTFTAnalyzer, WelchAnalyzer
+
+SAMPLING_FREQUENCY = 1000.0
+
+
+def get_wave(samples_number, channels=None):
+    """
+    Create a reproducible random wave, shaped (samples,) or (samples, channels).
+    """
+    shape = (samples_number,) if channels is None else (samples_number, channels)
+    return np.random.default_rng(0).standard_normal(shape)
+
+
+@pytest.mark.parametrize('channels', [None, 3])
+@pytest.mark.parametrize('window_length, hop, fft_size', [(256, None, None), (200, 50, 256), (128, 96, None)])
+def test_istft_inverts_stft(channels, window_length, hop, fft_size):
+    samples_number = 2000
+    wave = get_wave(samples_number, channels)
+    spectra = STFTAnalyzer(wave, window_length=window_length, hop=hop, fft_size=fft_size).calculate()
+    result = ISTFTAnalyzer(spectra, window_length=window_length, hop=hop, fft_size=fft_size,
+                           samples_number=samples_number).calculate()
+    assert result.shape == wave.shape
+
+    # The first and last samples are covered only by the zero end of the window.
+    hop = hop or window_length // 2
+    covered = (len(spectra) - 1) * hop + window_length
+    assert np.allclose(result[1:covered - 1], wave[1:covered - 1], rtol=0, atol=1e-10)
+    assert not np.any(result[covered:])
+
+
+def test_stft_of_multichannel_input_matches_its_channels():
+    wave = get_wave(1000, 2)
+    spectra = STFTAnalyzer(wave, window_length=128).calculate()
+    for channel in range(2):
+        assert np.allclose(spectra[:, channel], STFTAnalyzer(wave[:, channel], window_length=128).calculate())
+
+
+def test_stft_along_the_last_axis():
+    # 1024 samples are exactly covered by frames of 128 samples, 64 samples apart.
+    wave = get_wave(1024, 2)
+    spectra = STFTAnalyzer(wave.T, window_length=128, axis=1).calculate()
+    result = ISTFTAnalyzer(spectra, window_length=128, samples_number=1024, axis=1).calculate()
+    assert result.shape == wave.T.shape
+    assert np.allclose(result[:, 1:-1], wave.T[:, 1:-1], rtol=0, atol=1e-10)
+
+
+def get_chunks(wave, sizes):
+    """
+    Cut a wave into consecutive chunks of the given sizes, repeated until the wave is used up.
+    """
+    first = 0
+    while first < len(wave):
+        for size in sizes:
+            yield wave[first:first + size]
+            first += size
+
+
+@pytest.mark.parametrize('channels', [None, 2])
+@pytest.mark.parametrize('segment_length, overlap, fft_size', [(256, None, None), (200, 150, 256), (101, 0, None)])
+def test_welch_of_array_matches_scipy(channels, segment_length, overlap, fft_size):
+    wave = get_wave(5000, channels)
+    _, expected = welch(wave, SAMPLING_FREQUENCY, nperseg=segment_length, noverlap=overlap, nfft=fft_size,
+                        detrend=False, axis=0)
+    analyzer = WelchAnalyzer(wave, SAMPLING_FREQUENCY, segment_length=segment_length, overlap=overlap,
+                             fft_size=fft_size, max_block_size=4096)
+    assert np.allclose(analyzer.calculate(), expected, rtol=1e-10, atol=0)
+
+
+@pytest.mark.parametrize('channels', [None, 2])
+def test_welch_of_chunks_matches_scipy(channels):
+    wave = get_wave(5000, channels)
+    frequencies, expected = welch(wave, SAMPLING_FREQUENCY, nperseg=256, detrend=False, axis=0)
+    analyzer = WelchAnalyzer(get_chunks(wave, [1000, 37, 300, 1]), SAMPLING_FREQUENCY, max_block_size=4096)
+    assert np.allclose(analyzer.calculate(), expected, rtol=1e-10, atol=0)
+    assert np.allclose(analyzer.get_frequency_axis(), frequencies)
+    assert analyzer.segments_number == (5000 - 256) // 128 + 1
+
+
+def test_welch_of_short_input():
+    with pytest.raises(ValueError):
+        WelchAnalyzer(get_wave(100), SAMPLING_FREQUENCY).calculate()
@@ -0,0 +1,31 @@
+import numpy as np
+from TransformAnalyzer import TransformAnalyzer, FFTAnalyzer
+from TransformCache import TransformCache
+
+
+def test_hits_return_the_shared_read_only_result():
+    cache = TransformCache()
+    wave = np.random.default_rng(0).standard_normal(256)
+    first = cache.get(cache.get_key(FFTAnalyzer(wave)), FFTAnalyzer(wave).calculate)
+    second = cache.get(cache.get_key(FFTAnalyzer(wave.copy())), lambda: None)
+    assert second is first
+    assert not first.flags.writeable
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_memory_mapped_input_is_not_cached(tmp_path):
+    wave = np.memmap(tmp_path / 'wave.raw', dtype=np.float64, mode='w+', shape=(256,))
+    wave[:] = np.arange(256.0)
+    cache = TransformCache()
+    assert cache.get_key(FFTAnalyzer(wave)) is None
+    assert cache.get_key(FFTAnalyzer(np.asarray(wave)[10:])) is None
+    assert cache.get_key(FFTAnalyzer(np.array(wave))) is not None
+
+
+def test_memoized_calculation_skips_memory_mapped_input(tmp_path, monkeypatch):
+    wave = np.memmap(tmp_path / 'wave.raw', dtype=np.float64, mode='w+', shape=(256,))
+    wave[:] = np.arange(256.0)
+    monkeypatch.setattr(TransformAnalyzer, 'cache', TransformCache())
+    result = FFTAnalyzer(wave).calculate()
+    assert result.flags.writeable
+    assert TransformAnalyzer.cache.get_statistics()['entries'] == 0